@@ -0,0 +1,242 @@
+"""Throughput and memory benchmarks for the log pipeline, on synthetic data.
+
+Generates deterministic logcat, call log and SMS dumps at each requested
+size, then times categorization, keyword indexing, filtering, the graph
+aggregations, frequent callers and the full PDF report without any GUI:
+
+    python benchmark.py --sizes 10000,100000,1000000 --output bench.json
+
+Every stage runs in a freshly spawned process, so its peak RSS is its own
+and nothing is served from another stage's in-memory caches. Stages run in
+pipeline order and later ones use the sidecar indexes earlier ones wrote,
+as the GUI does after extraction. Results are printed as JSON (one record
+per size and stage); a summary table goes to stderr.
+"""
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import shutil
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+from scripts.log_types import (LOG_TYPES, TIME_RANGES, GRAPH_TYPES, LOGCAT_FILE, CALL_LOG_FILE,
+                               SMS_LOG_FILE, category_path)
+
+DEFAULT_SIZES = "10000,100000"
+TIME_RANGE_OPTIONS = list(TIME_RANGES) + ["All Time"]
+
+
+def _line_count(path):
+    from scripts.line_scanner import LineScanner
+    try:
+        with LineScanner(path) as scanner:
+            return scanner.count_lines()
+    except FileNotFoundError:
+        return 0
+
+
+def _volume(paths):
+    """(lines, bytes) across files, counting each file once"""
+    paths = list(dict.fromkeys(paths))
+    return (sum(_line_count(path) for path in paths),
+            sum(os.path.getsize(path) for path in paths if os.path.exists(path)))
+
+
+def _category_paths():
+    return [category_path(log_type) for log_type in LOG_TYPES]
+
+
+def stage_categorize(options):
+    from scripts.categorize import categorize_logcat
+    categorize_logcat(parallel=False)
+    return [LOGCAT_FILE]
+
+
+def stage_categorize_parallel(options):
+    from scripts.categorize import categorize_logcat
+    categorize_logcat(parallel=True, workers=options["workers"])
+    return [LOGCAT_FILE]
+
+
+def stage_keyword_index(options):
+    from scripts.keyword_index import build_keyword_indexes
+    paths = [LOGCAT_FILE, CALL_LOG_FILE, SMS_LOG_FILE] + _category_paths()
+    build_keyword_indexes(paths)
+    return paths
+
+
+def stage_filter(options):
+    from scripts.log_filter import filter_logs
+    filter_logs(LOGCAT_FILE, keyword="Exception", time_range="Past 7 Days", severity="Error")
+    return [LOGCAT_FILE]
+
+
+def stage_graphs(options):
+    from scripts.graphs import graph_data, graph_source
+    for log_type in GRAPH_TYPES:
+        for time_range in TIME_RANGE_OPTIONS:
+            graph_data(log_type, time_range)
+    return [graph_source(log_type)[0] for log_type in GRAPH_TYPES]
+
+
+def stage_frequent_callers(options):
+    from scripts.graphs import frequent_callers_data
+    for time_range in TIME_RANGE_OPTIONS:
+        frequent_callers_data(time_range)
+    return [CALL_LOG_FILE]
+
+
+def stage_report(options):
+    from scripts.report_export import write_full_report
+    write_full_report("benchmark_report.pdf", LOG_TYPES)
+    return [LOGCAT_FILE, CALL_LOG_FILE, SMS_LOG_FILE] + _category_paths()
+
+
+# Stage name -> function returning the files it read; run in this order
+STAGES = {
+    "categorize": stage_categorize,
+    "categorize_parallel": stage_categorize_parallel,
+    "keyword_index": stage_keyword_index,
+    "filter": stage_filter,
+    "graphs": stage_graphs,
+    "frequent_callers": stage_frequent_callers,
+    "report": stage_report,
+}
+
+
+def _max_rss_bytes(who):
+    """Peak resident set size so far, or None where resource isn't available"""
+    if resource is None:
+        return None
+    rss = resource.getrusage(who).ru_maxrss
+    # Linux reports kilobytes, macOS bytes
+    return rss if sys.platform == "darwin" else rss * 1024
+
+
+def run_stage(stage, workdir, options):
+    """Time one stage in the current process; meant to run in a fresh child"""
+    os.chdir(workdir)
+    record = {"stage": stage}
+    baseline = _max_rss_bytes(resource.RUSAGE_SELF) if resource else None
+    started = time.perf_counter()
+    try:
+        paths = STAGES[stage](options)
+    except ImportError as e:
+        record["skipped"] = f"missing dependency: {e.name or e}"
+        return record
+    seconds = time.perf_counter() - started
+
+    lines, size = _volume(paths)
+    record.update({
+        "seconds": round(seconds, 4),
+        "lines": lines,
+        "bytes": size,
+        "lines_per_sec": round(lines / seconds) if seconds else None,
+        "mb_per_sec": round(size / seconds / 1e6, 2) if seconds else None,
+        "baseline_rss_bytes": baseline,
+        "peak_rss_bytes": _max_rss_bytes(resource.RUSAGE_SELF) if resource else None,
+        # Process pool workers, for categorize_parallel
+        "peak_child_rss_bytes": _max_rss_bytes(resource.RUSAGE_CHILDREN) if resource else None,
+    })
+    return record
+
+
+def run_size(size, workdir, stages, options, seed):
+    from scripts.synthetic_logs import write_dataset
+
+    os.makedirs(workdir, exist_ok=True)
+    cwd = os.getcwd()
+    os.chdir(workdir)
+    try:
+        started = time.perf_counter()
+        written = write_dataset(size, seed=seed)
+        generate_seconds = time.perf_counter() - started
+    finally:
+        os.chdir(cwd)
+    print(f"Generated {sum(written.values())} lines in {generate_seconds:.1f}s under {workdir}",
+          file=sys.stderr)
+
+    context = multiprocessing.get_context("spawn")
+    records = []
+    for stage in stages:
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as executor:
+            record = executor.submit(run_stage, stage, workdir, options).result()
+        record["size"] = size
+        records.append(record)
+        print(_format_record(record), file=sys.stderr)
+    return records
+
+
+def _format_record(record):
+    if "skipped" in record:
+        return f"{record['size']:>10} {record['stage']:<20} skipped ({record['skipped']})"
+    peak = record["peak_rss_bytes"]
+    peak = f"{peak / 2 ** 20:8.1f} MiB" if peak is not None else "       n/a"
+    return (f"{record['size']:>10} {record['stage']:<20} {record['seconds']:9.3f}s "
+            f"{record['lines_per_sec'] or 0:>12,} lines/s {peak}")
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Benchmark the log pipeline on synthetic data")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES,
+                        help=f"Comma-separated logcat line counts (default: {DEFAULT_SIZES}); "
+                             "calls and SMS get 1%% as many rows")
+    parser.add_argument("--stages", default=",".join(STAGES),
+                        help="Comma-separated stages to run, in pipeline order")
+    parser.add_argument("--seed", type=int, default=0, help="Generator seed")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="Worker processes for categorize_parallel")
+    parser.add_argument("--workdir", help="Keep generated data here instead of a temporary directory")
+    parser.add_argument("--output", help="Write the JSON results to this file instead of stdout")
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    sizes = [int(size) for size in args.sizes.split(",") if size]
+    stages = [stage for stage in args.stages.split(",") if stage]
+    unknown = [stage for stage in stages if stage not in STAGES]
+    if unknown:
+        print(f"Unknown stages: {', '.join(unknown)}; choose from {', '.join(STAGES)}", file=sys.stderr)
+        return 2
+    if args.workers < 2 and "categorize_parallel" in stages:
+        stages.remove("categorize_parallel")
+
+    root = os.path.abspath(args.workdir) if args.workdir else tempfile.mkdtemp(prefix="logbench-")
+    options = {"workers": args.workers}
+    results = {
+        "started": datetime.now().isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu_count": os.cpu_count(),
+        "seed": args.seed,
+        "results": [],
+    }
+    try:
+        for size in sizes:
+            results["results"] += run_size(size, os.path.join(root, str(size)), stages, options, args.seed)
+    finally:
+        if not args.workdir:
+            shutil.rmtree(root, ignore_errors=True)
+
+    text = json.dumps(results, indent=2)
+    if args.output:
+        with open(args.output, "w", encoding="utf-8") as f:
+            f.write(text + "\n")
+    else:
+        print(text)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
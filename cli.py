@@ -0,0 +1,272 @@
+"""Headless command line for extracting, categorizing, filtering, graphing and reporting.
+
+Runs the same code as the GUI without importing tkinter, so it works on
+servers and in batch jobs, e.g. one invocation per device dump directory:
+
+    python cli.py -C dumps/device42 categorize
+    python cli.py -C dumps/device42 report
+
+Heavy libraries (matplotlib, NumPy, fpdf) are only imported by the
+subcommands that need them.
+"""
+import argparse
+import os
+import sys
+from datetime import datetime
+
+from scripts.log_types import (LOG_TYPES, TIME_RANGES, GRAPH_TYPES, LOGCAT_FILE, CALL_LOG_FILE,
+                               SMS_LOG_FILE, FILTERED_FILE, EXPORT_DIR, DEVICES_DIR, category_path)
+from scripts.stage_metrics import STAGES, metrics
+
+TIME_RANGE_CHOICES = list(TIME_RANGES) + ["All Time"]
+FILTER_TYPE_CHOICES = ["Logcat", "Calls", "SMS"] + list(LOG_TYPES)
+SEVERITY_CHOICES = ["Error", "Warning", "Info", "Debug", "Verbose"]
+FREQUENT_CALLERS = "Frequent Callers"
+# Same default as scripts.device_extraction, without importing it for every command
+DEVICE_WORKERS = 4
+INCREMENTAL_HELP = ("Only categorize lines appended since the last incremental run "
+                    "(falls back to a full rebuild if the start of the logcat changed)")
+
+
+def _keyword_index_paths():
+    return [LOGCAT_FILE, CALL_LOG_FILE, SMS_LOG_FILE] + [category_path(log_type) for log_type in LOG_TYPES]
+
+
+def _print_categorized(stats):
+    if stats.resumed_lines:
+        print(f"Processed {stats.lines - stats.resumed_lines} new logcat lines "
+              f"({stats.resumed_lines} already categorized)")
+    else:
+        print(f"Processed {stats.lines} logcat lines")
+    for log_type in LOG_TYPES:
+        print(f"  {log_type}: {stats.category_counts[log_type]}")
+
+
+def cmd_extract(args):
+    """Pull logcat, call log and SMS from the connected device"""
+    from scripts.categorize import categorize_logcat, should_parallelize
+    from scripts.device_extraction import fetch_sources
+    from scripts.line_scanner import LineScanner
+
+    with metrics.stage("extract") as run:
+        # Same as the GUI: all three sources are fetched at once, then the logcat is categorized
+        counts, errors = fetch_sources()
+        for source, error in errors.items():
+            print(f"Fetching {source} failed: {error}", file=sys.stderr)
+        if "logcat" in errors:
+            return 1
+        print(f"Fetched {counts['logcat']} logcat lines, {counts.get('calls', 0)} calls, {counts.get('sms', 0)} SMS")
+        stats = categorize_logcat(parallel=should_parallelize(LOGCAT_FILE), incremental=args.incremental)
+        _print_categorized(stats)
+
+        for path in (LOGCAT_FILE, CALL_LOG_FILE, SMS_LOG_FILE):
+            if os.path.exists(path):
+                with LineScanner(path) as scanner:
+                    run.add(lines=scanner.count_lines(), bytes_read=scanner.size)
+
+    if not args.no_index:
+        from scripts.keyword_index import build_keyword_indexes
+        build_keyword_indexes(_keyword_index_paths())
+    return 0
+
+
+def cmd_extract_devices(args):
+    """Pull logs from every attached device in parallel, one directory per serial"""
+    import threading
+    from scripts.adb import list_devices
+    from scripts.device_extraction import MultiDeviceExtraction, DONE, device_dir
+
+    serials = args.serial
+    if not serials:
+        devices = list_devices()
+        for device in devices:
+            if not device.ready:
+                print(f"Skipping {device.serial} ({device.state})", file=sys.stderr)
+        serials = [device.serial for device in devices if device.ready]
+    if not serials:
+        print("No devices attached", file=sys.stderr)
+        return 1
+
+    extraction = MultiDeviceExtraction(serials, root=args.root, workers=args.workers,
+                                       incremental=args.incremental)
+    runner = threading.Thread(target=extraction.run, daemon=True)
+    runner.start()
+
+    # Print each device's progress messages as they change
+    last = {}
+    def report_progress():
+        for progress in extraction.snapshot():
+            if progress.message and last.get(progress.serial) != progress.message:
+                last[progress.serial] = progress.message
+                print(f"[{progress.serial}] {progress.fraction:4.0%} {progress.message}", file=sys.stderr)
+    try:
+        while runner.is_alive():
+            runner.join(0.2)
+            report_progress()
+    except KeyboardInterrupt:
+        extraction.cancel()
+        runner.join()
+    report_progress()
+
+    failed = 0
+    for progress in extraction.snapshot():
+        if progress.state == DONE:
+            print(f"{progress.serial}: {progress.result.describe()} in {device_dir(progress.serial, args.root)}")
+        else:
+            failed += 1
+            print(f"{progress.serial}: {progress.state} {progress.error or progress.message}".rstrip())
+    return 1 if failed else 0
+
+
+def cmd_categorize(args):
+    """Split an existing logcat file into category files"""
+    from scripts.categorize import categorize_logcat, should_parallelize
+
+    if not os.path.exists(LOGCAT_FILE):
+        print(f"Logcat file not found: {LOGCAT_FILE}", file=sys.stderr)
+        return 1
+    if args.workers:
+        parallel = args.workers > 1
+    else:
+        # Workers are spawned; this script has no import-time side effects
+        parallel = args.parallel or should_parallelize(LOGCAT_FILE)
+    kwargs = {"workers": args.workers} if args.workers else {}
+    stats = categorize_logcat(parallel=parallel, incremental=args.incremental, **kwargs)
+    _print_categorized(stats)
+
+    if not args.no_index:
+        from scripts.keyword_index import build_keyword_indexes
+        build_keyword_indexes(_keyword_index_paths())
+    return 0
+
+
+def cmd_filter(args):
+    """Filter one log file by time range, keyword, severity and subtype"""
+    from scripts.log_filter import filter_logs, filter_input_file
+
+    input_file = filter_input_file(args.type)
+    if not os.path.exists(input_file):
+        print(f"Log file not found: {input_file}", file=sys.stderr)
+        return 1
+    count = filter_logs(input_file, keyword=args.keyword, time_range=args.time_range,
+                        severity=args.severity, subtype=args.subtype, output_file=args.output)
+    print(f"Found {count} matching log entries, written to {args.output}")
+    return 0
+
+
+def cmd_graph(args):
+    """Render a Graphs tab chart to an image or PDF file"""
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    from scripts.graphs import draw_graph, draw_frequent_callers
+
+    fig, ax = plt.subplots(figsize=(args.width, args.height))
+    if args.graph_type == FREQUENT_CALLERS:
+        has_data = draw_frequent_callers(fig, ax, args.time_range)
+    else:
+        has_data = draw_graph(fig, ax, args.graph_type, args.time_range)
+    os.makedirs(os.path.dirname(args.output) or ".", exist_ok=True)
+    fig.savefig(args.output, dpi=args.dpi, bbox_inches="tight", facecolor=fig.get_facecolor())
+    plt.close(fig)
+
+    if not has_data:
+        print(f"No {args.graph_type} data for {args.time_range}; wrote placeholder chart to {args.output}",
+              file=sys.stderr)
+        return 1
+    print(f"Chart written to {args.output}")
+    return 0
+
+
+def cmd_report(args):
+    """Write the full forensic PDF report"""
+    from scripts.report_export import write_full_report
+
+    output = args.output
+    if not output:
+        os.makedirs(EXPORT_DIR, exist_ok=True)
+        output = f"{EXPORT_DIR}/forensic_report_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+
+    last_message = [None]
+    def progress(fraction, message):
+        if not args.quiet and message != last_message[0]:
+            last_message[0] = message
+            print(f"[{fraction:4.0%}] {message}", file=sys.stderr)
+
+    write_full_report(output, LOG_TYPES, progress)
+    print(f"Forensic report exported to {output}")
+    return 0
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Android log forensics without the GUI")
+    parser.add_argument("-C", "--workdir", help="Run in this directory (its logs/ folder is used)")
+    parser.add_argument("--stats-json", metavar="PATH",
+                        help="Write per-stage timings and counters to PATH as JSON when done")
+    parser.add_argument("--profile", metavar="STAGES",
+                        help=f"Comma-separated stages to run under cProfile ({', '.join(STAGES)}); "
+                             "summaries go into --stats-json")
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    extract = subparsers.add_parser("extract", help=cmd_extract.__doc__)
+    extract.add_argument("--no-index", action="store_true", help="Skip building keyword indexes")
+    extract.add_argument("--incremental", action="store_true", help=INCREMENTAL_HELP)
+    extract.set_defaults(func=cmd_extract)
+
+    devices = subparsers.add_parser("extract-devices", help=cmd_extract_devices.__doc__)
+    devices.add_argument("--serial", action="append", help="Device serial (repeatable; default: every ready device)")
+    devices.add_argument("--workers", type=int, default=DEVICE_WORKERS, help="Devices extracted at once")
+    devices.add_argument("--root", default=DEVICES_DIR, help="Directory for the per-device folders")
+    devices.add_argument("--incremental", action="store_true", help=INCREMENTAL_HELP)
+    devices.set_defaults(func=cmd_extract_devices)
+
+    categorize = subparsers.add_parser("categorize", help=cmd_categorize.__doc__)
+    categorize.add_argument("--workers", type=int, help="Worker processes (default: automatic for large files)")
+    categorize.add_argument("--parallel", action="store_true",
+                            help="Use a process pool whatever the file size (the GUI runs large files this way)")
+    categorize.add_argument("--no-index", action="store_true", help="Skip building keyword indexes")
+    categorize.add_argument("--incremental", action="store_true", help=INCREMENTAL_HELP)
+    categorize.set_defaults(func=cmd_categorize)
+
+    filter_ = subparsers.add_parser("filter", help=cmd_filter.__doc__)
+    filter_.add_argument("--type", default="Logcat", choices=FILTER_TYPE_CHOICES)
+    filter_.add_argument("--time-range", default="All Time", choices=TIME_RANGE_CHOICES)
+    filter_.add_argument("--keyword")
+    filter_.add_argument("--severity", choices=SEVERITY_CHOICES)
+    filter_.add_argument("--subtype")
+    filter_.add_argument("--output", default=FILTERED_FILE)
+    filter_.set_defaults(func=cmd_filter)
+
+    graph = subparsers.add_parser("graph", help=cmd_graph.__doc__)
+    graph.add_argument("graph_type", choices=GRAPH_TYPES + [FREQUENT_CALLERS])
+    graph.add_argument("output", help="Output file; the format follows the extension (.png, .pdf, .svg)")
+    graph.add_argument("--time-range", default="All Time", choices=TIME_RANGE_CHOICES)
+    graph.add_argument("--width", type=float, default=7)
+    graph.add_argument("--height", type=float, default=4)
+    graph.add_argument("--dpi", type=int, default=150)
+    graph.set_defaults(func=cmd_graph)
+
+    report = subparsers.add_parser("report", help=cmd_report.__doc__)
+    report.add_argument("--output", help="PDF path (default: logs/exports/forensic_report_<time>.pdf)")
+    report.add_argument("--quiet", action="store_true", help="Don't print progress")
+    report.set_defaults(func=cmd_report)
+    return parser
+
+
+def main(argv=None):
+    args = build_parser().parse_args(argv)
+    # Resolve before changing directory so the path is relative to where we were started
+    stats_json = os.path.abspath(args.stats_json) if args.stats_json else None
+    if args.profile:
+        metrics.profile_stages.update(stage.strip() for stage in args.profile.split(",") if stage.strip())
+    if args.workdir:
+        os.chdir(args.workdir)
+    try:
+        return args.func(args)
+    finally:
+        if stats_json:
+            metrics.dump_json(stats_json)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,194 @@
+"""Local stand-in for the adb executable, for exercising extraction without hardware.
+
+Point the tools at it through the ADB environment variable:
+
+    ADB="python /path/to/fake_adb.py" python cli.py extract-devices
+
+It answers `devices`, `-s SERIAL logcat -d` and `-s SERIAL shell content
+query` for the call log and SMS providers with deterministic synthetic data
+(seeded by serial). `shell` with no command reads command lines from stdin
+like a device shell, understanding just enough (content query, echo,
+printf, exec, `;`, `$?`, redirections) to serve scripts.adb.AdbShell.
+Behaviour is set with environment variables:
+
+    FAKE_ADB_DEVICES   comma-separated serials, optionally serial=state
+                       (default: emulator-5554,emulator-5556,FAKE0001)
+    FAKE_ADB_LINES     logcat lines per device (default 2000)
+    FAKE_ADB_ROWS      call log and SMS rows per device (default 200)
+    FAKE_ADB_DELAY     seconds to sleep before answering, to mimic USB latency
+    FAKE_ADB_FAIL      comma-separated serials whose commands fail
+    FAKE_ADB_QUERY_DELAY
+                       seconds each content query takes on the device,
+                       including inside an interactive shell
+    FAKE_ADB_LEGACY    comma-separated serials without shell_v2, which
+                       reject `shell -T` like devices before Android 7
+    FAKE_ADB_DROP      interactive shells exit after the input line that
+                       takes them to this many commands, to exercise
+                       reconnecting (default: never)
+"""
+import os
+import random
+import shlex
+import sys
+import time
+import zlib
+from datetime import datetime, timedelta
+
+from scripts.synthetic_logs import logcat_lines
+
+DEFAULT_DEVICES = "emulator-5554,emulator-5556,FAKE0001"
+
+
+def _devices():
+    devices = {}
+    for entry in os.environ.get("FAKE_ADB_DEVICES", DEFAULT_DEVICES).split(","):
+        entry = entry.strip()
+        if entry:
+            serial, _, state = entry.partition("=")
+            devices[serial] = state or "device"
+    return devices
+
+
+def _seed(serial):
+    return zlib.crc32(serial.encode("utf-8"))
+
+
+def _end_time():
+    return datetime.now().replace(minute=0, second=0, microsecond=0)
+
+
+def _fail(message, status=1):
+    sys.stderr.write(message + "\n")
+    return status
+
+
+def _content_rows(serial, uri):
+    """Rows as `content query` prints them"""
+    rng = random.Random(_seed(serial) + len(uri))
+    count = int(os.environ.get("FAKE_ADB_ROWS", "200"))
+    numbers = [f"+1555{rng.randrange(10 ** 7):07d}" for _ in range(30)]
+    end = _end_time()
+    step = timedelta(days=7) / max(count, 1)
+    for i in range(count):
+        date = int((end - step * (count - i)).timestamp() * 1000)
+        if "call_log" in uri:
+            call_type = rng.choice((1, 2, 3))
+            duration = 0 if call_type == 3 else rng.randrange(5, 900)
+            yield f"Row: {i} number={rng.choice(numbers)}, date={date}, duration={duration}, type={call_type}"
+        else:
+            sms_type = rng.choice((1, 1, 2))
+            body = rng.choice(("On my way", "Call me", f"Code {rng.randrange(100000, 999999)}", "OK"))
+            yield f"Row: {i} address={rng.choice(numbers)}, date={date}, type={sms_type}, body={body}"
+
+
+def _shell(serial, args):
+    if args[:1] == ["echo"]:
+        print(" ".join(args[1:]))
+        return 0
+    if args[:1] == ["printf"] and len(args) > 1:
+        template = args[1].encode("utf-8").decode("unicode_escape").replace("%d", "%s")
+        sys.stdout.write(template % tuple(args[2:]))
+        return 0
+    if args[:2] == ["content", "query"] and "--uri" in args:
+        uri = args[args.index("--uri") + 1]
+        if "call_log" not in uri and "sms" not in uri:
+            return _fail(f"Error while accessing provider:{uri}")
+        time.sleep(float(os.environ.get("FAKE_ADB_QUERY_DELAY", "0")))
+        for row in _content_rows(serial, uri):
+            print(row)
+        return 0
+    return _fail(f"/system/bin/sh: {' '.join(args)}: not found", 127)
+
+
+def _commands(line):
+    """Split a shell line into argument lists at `;`, dropping redirections"""
+    lexer = shlex.shlex(line, posix=True, punctuation_chars=";<>&|")
+    lexer.whitespace_split = True
+    commands = [[]]
+    tokens = list(lexer)
+    while tokens:
+        token = tokens.pop(0)
+        if token == ";":
+            commands.append([])
+        elif token in ("<", ">", ">>", ">&"):
+            if tokens:
+                tokens.pop(0)
+            # The descriptor in 2>&1 or 2>/dev/null comes through as its own word
+            if token != "<" and commands[-1] and commands[-1][-1].isdigit():
+                commands[-1].pop()
+        else:
+            commands[-1].append(token)
+    return [args for args in commands if args]
+
+
+def _interactive_shell(serial):
+    """Run command lines from stdin until EOF, `exit` or FAKE_ADB_DROP commands"""
+    drop = int(os.environ.get("FAKE_ADB_DROP", "0"))
+    status = 0
+    handled = 0
+    for line in sys.stdin:
+        for args in _commands(line):
+            args = [str(status) if arg == "$?" else arg for arg in args]
+            if args[0] == "exit":
+                return int(args[1]) if len(args) > 1 else status
+            if args[0] == "exec":
+                # Only `exec 2>&1`, which the redirection handling already dropped
+                continue
+            status = _shell(serial, args)
+            sys.stdout.flush()
+            handled += 1
+        if drop and handled >= drop:
+            return 0
+    return status
+
+
+def main(argv):
+    delay = float(os.environ.get("FAKE_ADB_DELAY", "0"))
+    if delay:
+        time.sleep(delay)
+
+    devices = _devices()
+    serial = None
+    if argv[:1] == ["-s"] and len(argv) > 1:
+        serial, argv = argv[1], argv[2:]
+    if not argv:
+        return _fail("usage: adb [-s SERIAL] COMMAND")
+
+    command, args = argv[0], argv[1:]
+    if command == "devices":
+        print("List of devices attached")
+        for name, state in devices.items():
+            print(f"{name}\t{state}" + (" product:fake model:Fake_Phone device:fake" if "-l" in args else ""))
+        return 0
+
+    if serial is None:
+        ready = [name for name, state in devices.items() if state == "device"]
+        if len(ready) != 1:
+            return _fail("error: more than one device/emulator" if ready else "error: no devices/emulators found")
+        serial = ready[0]
+    if serial not in devices:
+        return _fail(f"error: device '{serial}' not found")
+    if devices[serial] != "device":
+        return _fail(f"error: device {devices[serial]}")
+    if serial in os.environ.get("FAKE_ADB_FAIL", "").split(","):
+        return _fail(f"error: closed ({serial})")
+
+    if command == "logcat":
+        count = int(os.environ.get("FAKE_ADB_LINES", "2000"))
+        out = sys.stdout
+        for line in logcat_lines(count, seed=_seed(serial), end=_end_time()):
+            out.write(line + "\n")
+        return 0
+    if command == "shell":
+        if "-T" in args and serial in os.environ.get("FAKE_ADB_LEGACY", "").split(","):
+            return _fail("error: target doesn't support PTY args")
+        args = [arg for arg in args if arg not in ("-T", "-t", "-x")]
+        if not args:
+            return _interactive_shell(serial)
+        # adb sends the arguments as one line, which the device shell splits again
+        return _shell(serial, shlex.split(" ".join(args)))
+    return _fail(f"adb: unknown command {command}")
+
+
+if __name__ == "__main__":
+    sys.exit(main(sys.argv[1:]))
@@ -1,27 +1,48 @@
+import time
+# Startup is timed from here to the first idle moment of the main window
+STARTUP_STARTED = time.perf_counter()
 import tkinter as tk
 from tkinter import scrolledtext, ttk, filedialog, messagebox
 import threading
-from scripts.android_logs import get_logcat, get_call_logs, get_sms_logs, monitor_logs
-from scripts.log_parser import filter_logs
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-from datetime import datetime, timedelta
+from scripts.android_logs import monitor_logs
+from scripts.log_types import LOG_TYPES, GRAPH_TYPES, LOGCAT_FILE, category_path
+from scripts.log_filter import filter_logs, filter_input_file
+from scripts.log_classifier import LogClassifier
+from scripts.category_sinks import CategorySinks
+from scripts.categorize import categorize_logcat, should_parallelize
+from scripts.logcat_parser import parse_file
+from scripts.timestamp_index import load_index
+from scripts.keyword_index import build_keyword_indexes
+from scripts.log_viewer import VirtualLogViewer
+from scripts.bounded_queue import BoundedLogQueue, OVERFLOW_POLICIES
+from scripts.live_buffer import LiveBuffer
+from scripts.line_scanner import LineScanner, iter_file_lines
+from scripts.result_cache import ResultCache
+from scripts.background_job import BackgroundJob
+from scripts.progress_window import JobProgressWindow
+from scripts.device_extraction import fetch_sources
+from scripts.stage_metrics import metrics
+from datetime import datetime
 from collections import Counter
 import subprocess  # For ADB command execution
-import time       # For sleep/delays
 import queue      # For thread-safe communication
 from collections import deque  # For efficient log buffering
+from itertools import islice
 import re
-import pandas as pd
-from fpdf import FPDF
-import matplotlib.dates as mdates
 import os
 import json
+import shutil
+import sys
 
 # Add this right after your imports
 monitoring_active = False
-log_queue = queue.Queue()
+LIVE_QUEUE_SIZE = 10000        # Entries buffered between the monitor thread and the UI
+LIVE_QUEUE_POLICY = "block"    # One of OVERFLOW_POLICIES
+log_queue = BoundedLogQueue(LIVE_QUEUE_SIZE, LIVE_QUEUE_POLICY)
 monitoring_thread = None
+LIVE_DRAIN_BUDGET = 0.05  # Seconds of queue draining allowed per UI tick
+LIVE_MAX_LINES = 1000     # Lines kept in the Live Monitoring view
+live_buffer = LiveBuffer(LIVE_MAX_LINES)
 
 # --- Add these lines after imports but before any other code ---
 # Initialize required global variables
@@ -34,48 +55,21 @@ BUTTON_TEXT_COLOR = "#your_color"
 TEXT_BG_COLOR = "#your_color"
 TEXT_FG_COLOR = "#your_color"
 FONT = ("Your Font", 10)  # Define your font
-LOG_TYPES = {
-    "Application": {
-        "description": "Application-specific logs",
-        "pattern": r'ActivityManager|PackageManager|ApplicationContext',
-        "color": "blue"
-    },
-    "System": {
-        "description": "System-level logs",
-        "pattern": r'SystemServer|System\.err|SystemClock|SystemProperties',
-        "color": "green"
-    },
-    "Crash": {
-        "description": "Application crashes and exceptions",
-        "pattern": r'FATAL|Exception|ANR|crash|force close|stacktrace',
-        "color": "red"
-    },
-    "GC": {
-        "description": "Garbage Collection events",
-        "pattern": r'dalvikvm.*GC|art.*GC|GC_|collector',
-        "color": "purple"
-    },
-    "Network": {
-        "description": "Network activity logs",
-        "pattern": r'ConnectivityManager|NetworkInfo|WifiManager|HttpURLConnection|socket|wifi|TCP|UDP|DNS',
-        "color": "cyan"
-    },
-    "Broadcast": {
-        "description": "Broadcast receivers and events",
-        "pattern": r'BroadcastReceiver|sendBroadcast|onReceive|Intent.*broadcast',
-        "color": "yellow"
-    },
-    "Service": {
-        "description": "Service lifecycle events",
-        "pattern": r'Service|startService|stopService|bindService|onBind',
-        "color": "orange"
-    },
-    "Device": {
-        "description": "Device state and hardware",
-        "pattern": r'PowerManager|BatteryManager|sensor|hardware|camera|location|bluetooth|telephony',
-        "color": "magenta"
-    }
-}
+
+# Precompiled matcher shared by extraction, live monitoring and distribution charts
+log_classifier = LogClassifier(LOG_TYPES)
+
+# Category files written by live monitoring, kept open between queue ticks
+live_sinks = CategorySinks(LOG_TYPES)
+# True while the Logcat Types tabs show exactly what the category files hold
+category_texts_synced = False
+# Bumped to cancel a load_category_texts still filling the tabs
+category_texts_generation = 0
+GRAPH_CACHE_BYTES = 32 * 1024 * 1024  # Memory cap for cached graph aggregates
+graph_cache = ResultCache(GRAPH_CACHE_BYTES)
+# Large logcats are categorized by this script in a separate process
+CLI_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "cli.py")
+CATEGORY_LOAD_LINES = 2000  # Lines of a category file inserted into its tab per UI tick
 
 # Define all missing functions
 def import_logs():
@@ -148,10 +142,6 @@ logcat_type_notebook.pack(expand=1, fill="both")
 logcat_tabs = {}
 logcat_type_texts = {}
 
-print("LOG_TYPES type:", type(LOG_TYPES))
-print("LOG_TYPES contents:", LOG_TYPES)
-print("First key type:", type(next(iter(LOG_TYPES))) if LOG_TYPES else "Empty dictionary")
-
 # Create tabs for each log type in LOG_TYPES
 for log_type in LOG_TYPES:  # Direct iteration over dictionary keys
     # Create frame for each log type
@@ -188,16 +178,53 @@ output_text.pack(fill=tk.BOTH, expand=True, pady=5)
 live_text = scrolledtext.ScrolledText(tab_live, wrap=tk.WORD, width=100, height=30, bg=BG_COLOR, fg=FG_COLOR, font=FONT)
 live_text.pack(fill=tk.BOTH, expand=True, pady=5)
 
-all_logs_text = scrolledtext.ScrolledText(tab_all_logs, wrap=tk.WORD, width=100, height=30, bg=BG_COLOR, fg=FG_COLOR, font=FONT)
+# Queue health for live monitoring: overflow policy, depth, drops and lag
+live_status_frame = tk.Frame(tab_live, bg=BG_COLOR)
+live_status_frame.pack(fill=tk.X, side=tk.BOTTOM, pady=5)
+
+tk.Label(live_status_frame, text="On Overflow:", bg=BG_COLOR, fg=FG_COLOR, font=FONT).pack(side=tk.LEFT, padx=5)
+live_policy_combo = ttk.Combobox(live_status_frame, values=list(OVERFLOW_POLICIES), width=12, state="readonly")
+live_policy_combo.set(LIVE_QUEUE_POLICY)
+live_policy_combo.pack(side=tk.LEFT, padx=5)
+live_policy_combo.bind("<<ComboboxSelected>>", lambda e: setattr(log_queue, "policy", live_policy_combo.get()))
+
+live_queue_label = tk.Label(live_status_frame, text="", bg=BG_COLOR, fg=FG_COLOR, font=FONT)
+live_queue_label.pack(side=tk.LEFT, padx=10)
+
+# Retention size and pause control for the live view's ring buffer
+tk.Label(live_status_frame, text="Keep Lines:", bg=BG_COLOR, fg=FG_COLOR, font=FONT).pack(side=tk.LEFT, padx=5)
+live_retention_spin = tk.Spinbox(live_status_frame, values=(500, 1000, 5000, 10000, 50000), width=7,
+                                 command=lambda: set_live_retention(live_retention_spin.get()))
+live_retention_spin.delete(0, tk.END)
+live_retention_spin.insert(0, str(LIVE_MAX_LINES))
+live_retention_spin.pack(side=tk.LEFT, padx=5)
+live_retention_spin.bind("<Return>", lambda e: set_live_retention(live_retention_spin.get()))
+
+live_pause_var = tk.BooleanVar(value=False)
+tk.Checkbutton(live_status_frame, text="Pause View", variable=live_pause_var,
+               bg=BG_COLOR, fg=FG_COLOR, selectcolor=BG_COLOR, font=FONT,
+               command=lambda: set_live_paused(live_pause_var.get())).pack(side=tk.LEFT, padx=5)
+
+# Large captures are shown through virtualized viewers that only render the visible lines
+all_logs_text = VirtualLogViewer(tab_all_logs, wrap=tk.WORD, width=100, height=30, bg=BG_COLOR, fg=FG_COLOR, font=FONT)
 all_logs_text.pack(fill=tk.BOTH, expand=True, pady=5)
 
-logcat_text = scrolledtext.ScrolledText(tab_logcat, wrap=tk.WORD, width=100, height=30, bg=BG_COLOR, fg=FG_COLOR, font=FONT)
+logcat_text = VirtualLogViewer(tab_logcat, wrap=tk.WORD, width=100, height=30, bg=BG_COLOR, fg=FG_COLOR, font=FONT)
 logcat_text.pack(fill=tk.BOTH, expand=True, pady=5)
 
 # Buttons for each tab
 extract_button = tk.Button(tab_extract, text="Extract Logs", bg=BUTTON_COLOR, fg=BUTTON_TEXT_COLOR, command=lambda: extract_logs())
 extract_button.pack(pady=5)
 
+extract_all_button = tk.Button(tab_extract, text="Extract All Devices", bg=BUTTON_COLOR, fg=BUTTON_TEXT_COLOR,
+                               command=lambda: extract_all_devices())
+extract_all_button.pack(pady=5)
+
+# Repeat extractions can classify only what was appended since the last one
+incremental_var = tk.BooleanVar(value=False)
+tk.Checkbutton(tab_extract, text="Only categorize new lines", variable=incremental_var,
+               bg=BG_COLOR, fg=FG_COLOR, selectcolor=BG_COLOR, font=FONT).pack(pady=2)
+
 
 # Filters: Time Range + Log Type for Graphs
 graph_filter_frame = tk.Frame(tab_graphs, bg="black")
@@ -210,8 +237,7 @@ graph_time_combo.grid(row=0, column=1, padx=5)
 
 tk.Label(graph_filter_frame, text="Log Type:", bg="black", fg="lime").grid(row=0, column=2, padx=5)
 # Enhanced graph types with the new logcat categories
-graph_types = ["Call Logs", "SMS Logs", "Top SMS Senders", "Logcat Activity"] + list(LOG_TYPES.keys())
-graph_type_combo = ttk.Combobox(graph_filter_frame, values=graph_types)
+graph_type_combo = ttk.Combobox(graph_filter_frame, values=GRAPH_TYPES)
 graph_type_combo.set("Call Logs")
 graph_type_combo.grid(row=0, column=3, padx=5)
 
@@ -222,10 +248,9 @@ graph_button.grid(row=0, column=4, padx=10)
 freq_button = tk.Button(graph_filter_frame, text="Most Frequent Callers", bg="gray", fg="black", command=lambda: plot_frequent_callers())
 freq_button.grid(row=0, column=5, padx=10)
 
-# Placeholder for matplotlib chart
-graph_fig, graph_ax = plt.subplots(figsize=(7, 4))
-graph_canvas = FigureCanvasTkAgg(graph_fig, master=tab_graphs)
-graph_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=10)
+# The matplotlib chart is created by ensure_graph_canvas() when the first graph is drawn
+graph_canvas = None
+startup_seconds = None  # Set by report_startup_time() once the window is ready
 
 # Create notebook for different logcat types
 logcat_type_notebook = ttk.Notebook(tab_logcat_types)
@@ -253,76 +278,216 @@ def extraction_thread():
     output_text.insert(tk.END, "⌛ Extracting logs, please wait...\n")
     output_text.see(tk.END)
     
-    # Get standard logs
-    get_logcat()
-    get_call_logs()
-    get_sms_logs()
-
-    # Process logcat logs into different types
-    try:
-        categorize_logcat_logs()
-    except Exception as e:
-        output_text.insert(tk.END, f"⚠️ Error categorizing logcat logs: {str(e)}\n")
+    with metrics.stage("extract") as run:
+        # Logcat, call log and SMS are fetched at the same time, then categorized
+        _, errors = fetch_sources()
+        for source, error in errors.items():
+            output_text.insert(tk.END, f"⚠️ Fetching {source} failed: {str(error)}\n")
+        
+        if "logcat" not in errors:
+            try:
+                categorize_logcat_logs()
+            except Exception as e:
+                output_text.insert(tk.END, f"⚠️ Error categorizing logcat logs: {str(e)}\n")
+        
+        # Everything pulled from the device
+        for path in ("logs/android_logcat.txt", "logs/call_logs.txt", "logs/sms_logs.txt"):
+            if os.path.exists(path):
+                with LineScanner(path) as scanner:
+                    run.add(lines=scanner.count_lines(), bytes_read=scanner.size)
 
-    # Load Logcat Logs
+    # Load Logcat Logs (the viewer reads visible lines on demand through the line index)
     try:
-        with open("logs/android_logcat.txt", "r", encoding="utf-8", errors="replace") as f:
-            logcat_text.delete(1.0, tk.END)
-            logcat_text.insert(tk.END, f.read())
+        logcat_text.set_sources([load_index("logs/android_logcat.txt")])
     except FileNotFoundError:
-        logcat_text.insert(tk.END, "⚠️ Logcat file not found.\n")
+        logcat_text.show_message("⚠️ Logcat file not found.\n")
 
     # Load All Logs
-    all_logs_text.delete(1.0, tk.END)
     log_files = [("Logcat", "logs/android_logcat.txt"),
                  ("Calls", "logs/call_logs.txt"),
                  ("SMS", "logs/sms_logs.txt")]
     
+    all_log_sources = []
     for log_name, path in log_files:
         try:
-            with open(path, "r", encoding="utf-8", errors="replace") as f:
-                all_logs_text.insert(tk.END, f"\n===== {log_name} =====\n")
-                all_logs_text.insert(tk.END, f.read())
+            index = load_index(path)
+            all_log_sources.append(f"\n===== {log_name} =====\n")
+            all_log_sources.append(index)
         except FileNotFoundError:
-            all_logs_text.insert(tk.END, f"\n⚠️ {log_name} log file not found.\n")
+            all_log_sources.append(f"\n⚠️ {log_name} log file not found.\n")
+    all_logs_text.set_sources(all_log_sources)
 
     output_text.insert(tk.END, "✅ Logs Extracted Successfully!\n")
     output_text.see(tk.END)
 
+    # Build keyword indexes in the background so the Filter Logs tab can use them
+    index_paths = [path for _, path in log_files]
+    index_paths += [f"logs/logcat_types/{log_type.lower()}_logs.txt" for log_type in LOG_TYPES]
+    threading.Thread(target=build_keyword_indexes, args=(index_paths,), daemon=True).start()
+
+def extract_all_devices():
+    """Extract every ready device in parallel into logs/devices/<serial>/"""
+    from scripts.adb import list_devices, AdbError
+    from scripts.device_extraction import MultiDeviceExtraction, DONE, device_dir
+    from scripts.progress_window import DeviceProgressWindow
+    
+    try:
+        devices = list_devices()
+    except AdbError as e:
+        messagebox.showerror("Extraction Failed", f"Could not list devices: {str(e)}")
+        return
+    for device in devices:
+        if not device.ready:
+            output_text.insert(tk.END, f"⚠️ Skipping {device.serial} ({device.state})\n")
+    serials = [device.serial for device in devices if device.ready]
+    if not serials:
+        messagebox.showwarning("Extraction", "No devices attached.")
+        return
+    
+    extraction = MultiDeviceExtraction(serials, incremental=incremental_var.get())
+    job = BackgroundJob(extraction.run, name="Extracting Devices").start()
+    
+    def show_results(snapshot):
+        for progress in snapshot:
+            if progress.state == DONE:
+                output_text.insert(tk.END, f"✅ {progress.serial}: {progress.result.describe()} "
+                                           f"in {device_dir(progress.serial)}\n")
+            else:
+                output_text.insert(tk.END, f"❌ {progress.serial}: {progress.message}\n")
+        output_text.see(tk.END)
+    
+    DeviceProgressWindow(root, job, extraction, on_done=show_results, bg=BG_COLOR, fg=FG_COLOR, font=FONT)
+
 def categorize_logcat_logs():
     """Categorize logcat logs into different types based on patterns"""
+    if should_parallelize(LOGCAT_FILE):
+        # Big captures are classified on every core, by cli.py in a process of its own:
+        # forking this process, with Tk and worker threads running, could deadlock the pool
+        categorize_in_subprocess(incremental=incremental_var.get())
+    else:
+        categorize_logcat_stream(None, check_exists=True, incremental=incremental_var.get())
+
+def category_file_lines(log_type):
+    """Lines of a category file, without the header categorization writes first"""
+    # The tabs show only the lines, as categorization inserts them
+    header = (f"=== {log_type} Logs ===\n", "\n")
+    in_header = True
     try:
-        # Ensure logs directory exists
-        os.makedirs("logs/logcat_types", exist_ok=True)
-        
-        # Clear previous categorized logs
-        for log_type in LOG_TYPES:
-            with open(f"logs/logcat_types/{log_type.lower()}_logs.txt", "w", encoding="utf-8") as f:
-                f.write(f"=== {log_type} Logs ===\n\n")
-        
-        # Process main logcat file
-        try:
-            with open("logs/android_logcat.txt", "r", encoding="utf-8", errors="replace") as f:
-                logcat_lines = f.readlines()
-        except FileNotFoundError:
-            output_text.insert(tk.END, "⚠️ Logcat file not found for categorization.\n")
+        for number, line in enumerate(iter_file_lines(category_path(log_type))):
+            if in_header and number < len(header) and line == header[number]:
+                continue
+            in_header = False
+            yield line
+    except FileNotFoundError:
+        return
+
+def load_category_texts():
+    """Refill the Logcat Types tabs from the category files on disk.
+
+    Files are read CATEGORY_LOAD_LINES lines per tick of the Tk event loop,
+    so large categories are never held in memory whole and the window stays
+    responsive. Safe to call from worker threads; a later load or
+    categorization run cancels one still in progress.
+    """
+    global category_texts_synced, category_texts_generation
+    category_texts_synced = False
+    category_texts_generation += 1
+    generation = category_texts_generation
+    pending = [(log_type, category_file_lines(log_type)) for log_type in LOG_TYPES]
+    
+    def begin():
+        if generation != category_texts_generation:
             return
-        
-        # Clear text widgets for each log type
         for log_type in LOG_TYPES:
+            # Live monitoring leaves the tabs disabled
+            logcat_type_texts[log_type].config(state=tk.NORMAL)
             logcat_type_texts[log_type].delete(1.0, tk.END)
+        load_chunk()
+    
+    def load_chunk():
+        global category_texts_synced
+        if generation != category_texts_generation:
+            return
+        while pending:
+            log_type, lines = pending[0]
+            chunk = list(islice(lines, CATEGORY_LOAD_LINES))
+            if chunk:
+                logcat_type_texts[log_type].insert(tk.END, "".join(chunk))
+                root.after(1, load_chunk)
+                return
+            pending.pop(0)
+        category_texts_synced = True
+    
+    root.after(0, begin)
+
+def categorize_in_subprocess(incremental=False):
+    """Categorize the logcat file with `cli.py categorize --parallel` and show the results"""
+    command = [sys.executable, CLI_SCRIPT, "categorize", "--parallel", "--no-index"]
+    if incremental:
+        command.append("--incremental")
+    try:
+        with metrics.stage("categorize", f"{LOGCAT_FILE} (cli.py --parallel)") as run:
+            result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+            if result.returncode != 0:
+                raise RuntimeError(result.stderr.strip() or f"cli.py exited with status {result.returncode}")
+            # "Processed N logcat lines" (or "N new logcat lines" when resumed)
+            processed = re.search(r"Processed (\d+)", result.stdout)
+            run.add(lines=int(processed.group(1)) if processed else 0, bytes_read=os.path.getsize(LOGCAT_FILE))
+        load_category_texts()
+        output_text.insert(tk.END, f"📊 {result.stdout.strip()}\n")
+        output_text.insert(tk.END, "✅ Logcat logs successfully categorized by type!\n")
+    except Exception as e:
+        output_text.insert(tk.END, f"❌ Error during log categorization: {str(e)}\n")
+        raise e
+
+def categorize_logcat_stream(offset_lines, check_exists=False, incremental=False):
+    """Parse, classify and write category files for a stream of (offset, raw line) pairs.
+
+    With offset_lines=None the logcat file is read. With incremental=True
+    only lines appended since the last incremental run are classified, if
+    the start of the file is unchanged; they are appended to the tabs when
+    the tabs still mirror the category files, which are reloaded otherwise.
+    """
+    global category_texts_synced, category_texts_generation
+    # Cancel any reload still filling the tabs
+    category_texts_generation += 1
+    try:
+        if check_exists and not os.path.exists(LOGCAT_FILE):
+            # Still leave empty category files behind, as a fresh extraction would
+            with CategorySinks(LOG_TYPES, mode="w") as sinks:
+                for log_type in LOG_TYPES:
+                    sinks.write(log_type, f"=== {log_type} Logs ===\n\n")
+            output_text.insert(tk.END, "⚠️ Logcat file not found for categorization.\n")
+            category_texts_synced = False
+            return
         
-        # Process each line and categorize
-        for line in logcat_lines:
-            for log_type, info in LOG_TYPES.items():
-                if re.search(info["pattern"], line, re.IGNORECASE):
-                    # Append to type-specific file
-                    with open(f"logs/logcat_types/{log_type.lower()}_logs.txt", "a", encoding="utf-8") as f:
-                        f.write(line)
-                    
-                    # Update text widget
-                    logcat_type_texts[log_type].insert(tk.END, line)
+        # A resumed run only sees the new lines, so keep what the tabs show if it is current
+        kept = incremental and category_texts_synced
+        category_texts_synced = False
+        if not kept:
+            # Clear text widgets for each log type
+            for log_type in LOG_TYPES:
+                logcat_type_texts[log_type].config(state=tk.NORMAL)
+                logcat_type_texts[log_type].delete(1.0, tk.END)
+        
+        # Update the type's text widget as each line is categorized
+        def show_line(log_type, line):
+            logcat_type_texts[log_type].insert(tk.END, line)
+        
+        stats = categorize_logcat(offset_lines, on_match=show_line, incremental=incremental)
+        
+        if bool(stats.resumed_lines) != kept:
+            # Cleared tabs got only the new lines, or a full rebuild went on top of kept text;
+            # the reload marks the tabs synced once it finishes
+            load_category_texts()
+        else:
+            category_texts_synced = True
         
+        if stats.resumed_lines:
+            output_text.insert(tk.END, f"📊 Processed {stats.lines - stats.resumed_lines} new logcat lines "
+                                       f"({stats.resumed_lines} already categorized)\n")
+        else:
+            output_text.insert(tk.END, f"📊 Processed {stats.lines} logcat lines\n")
         output_text.insert(tk.END, "✅ Logcat logs successfully categorized by type!\n")
     except Exception as e:
         output_text.insert(tk.END, f"❌ Error during log categorization: {str(e)}\n")
@@ -334,439 +499,178 @@ def start_monitoring():
         start_monitoring._thread = threading.Thread(target=monitor_thread, daemon=True)
         start_monitoring._thread.start()
         update_live_monitor("🔍 Starting live monitoring...\n")
+        
+        # Start draining the queue once; process_log_queue reschedules itself
+        if not getattr(process_log_queue, '_scheduled', False):
+            process_log_queue._scheduled = True
+            root.after(100, process_log_queue)
     else:
         update_live_monitor("⚠️ Monitoring is already running\n")
 
 def monitor_thread():
     """Main monitoring thread with enhanced error handling"""
     try:
-        def handle_log(log):
-            # Queue log updates for thread-safe UI updates
-            log_queue.put(('update', log))
-            
-            # Categorize logs
-            for log_type, info in LOG_TYPES.items():
-                if re.search(info["pattern"], log, re.IGNORECASE):
+        with metrics.stage("monitor") as run:
+            def handle_log(log):
+                run.add(lines=1, bytes_read=len(log))
+                
+                # Queue log updates for thread-safe UI updates
+                log_queue.put(('update', log))
+                
+                # Categorize logs
+                for log_type in log_classifier.classify(log):
+                    run.category_hits[log_type] += 1
                     log_queue.put(('categorize', (log_type, log)))
-        
-        # Start the actual monitoring
-        monitor_logs(handle_log)
+            
+            # Start the actual monitoring
+            monitor_logs(handle_log)
         
     except Exception as e:
-        log_queue.put(('error', f"Monitoring error: {str(e)}"))
+        log_queue.put(('error', f"Monitoring error: {str(e)}"), droppable=False)
     finally:
-        log_queue.put(('status', "Monitoring stopped"))
+        log_queue.put(('status', "Monitoring stopped"), droppable=False)
+
+def append_live_text(text):
+    """Add a block of text to the live ring buffer and render it (UI thread only)"""
+    render_live_view(live_buffer.append(text))
+
+def render_live_view(update):
+    """Apply a LiveBuffer update to the live text widget"""
+    if update is None:
+        # Paused: the buffer keeps the lines, the widget stays where the user scrolled
+        return
+    
+    live_text.config(state=tk.NORMAL)
+    if update[0] == "replace":
+        live_text.delete(1.0, tk.END)
+        live_text.insert(tk.END, update[1])
+    else:
+        _, text, trim = update
+        live_text.insert(tk.END, text)
+        # Drop the lines that fell out of the ring buffer
+        if trim:
+            live_text.delete(1.0, f"{trim + 1}.0")
+    
+    live_text.see(tk.END)
+    live_text.config(state=tk.DISABLED)
+
+def set_live_paused(paused):
+    """Freeze or resume the live view; events keep filling the buffer while paused"""
+    live_buffer.paused = paused
+    if not paused:
+        render_live_view(live_buffer.render())
+
+def set_live_retention(value):
+    """Change how many lines the live view keeps"""
+    try:
+        maxlen = int(value)
+    except ValueError:
+        return
+    if maxlen > 0 and maxlen != live_buffer.maxlen:
+        live_buffer.resize(maxlen)
+        if not live_buffer.paused:
+            render_live_view(live_buffer.render())
 
 def update_live_monitor(log):
     """Thread-safe UI updates"""
-    def _update():
-        live_text.config(state=tk.NORMAL)
-        live_text.insert(tk.END, log)
-        live_text.see(tk.END)
-        
-        # Limit log size
-        if int(live_text.index('end-1c').split('.')[0]) > 1000:
-            live_text.delete(1.0, "100.0")
-            
-        live_text.config(state=tk.DISABLED)
-    
-    root.after(0, _update)
+    root.after(0, lambda: append_live_text(log))
 
 def process_log_queue():
-    """Process all queued log entries"""
-    while not log_queue.empty():
-        entry_type, data = log_queue.get_nowait()
+    """Drain queued log entries within a time budget, one insert per widget per tick"""
+    global category_texts_synced
+    deadline = time.monotonic() + LIVE_DRAIN_BUDGET
+    live_lines = []
+    type_lines = {}
+    
+    while time.monotonic() < deadline:
+        try:
+            entry_type, data = log_queue.get_nowait()
+        except queue.Empty:
+            break
         
         if entry_type == 'update':
-            update_live_monitor(data + "\n")
+            live_lines.append(data + "\n")
         elif entry_type == 'categorize':
             log_type, log = data
-            text_widget = logcat_type_texts.get(log_type)
-            if text_widget:
-                text_widget.config(state=tk.NORMAL)
-                text_widget.insert(tk.END, log + "\n")
-                text_widget.see(tk.END)
-                text_widget.config(state=tk.DISABLED)
+            if log_type in logcat_type_texts:
+                type_lines.setdefault(log_type, []).append(log + "\n")
                 
-                # Append to file
+                # Append to file (flushed in batches by the sink)
                 try:
-                    os.makedirs("logs/logcat_types", exist_ok=True)
-                    with open(f"logs/logcat_types/{log_type.lower()}_logs.txt", "a", encoding="utf-8") as f:
-                        f.write(log + "\n")
+                    if not live_sinks.is_open:
+                        live_sinks.open()
+                    live_sinks.write(log_type, log + "\n")
                 except Exception as e:
                     print(f"Error saving log: {e}")
         elif entry_type == 'error':
             messagebox.showerror("Monitoring Error", data)
         elif entry_type == 'status':
-            update_live_monitor(f"⭐ {data}\n")
+            live_lines.append(f"⭐ {data}\n")
+            # Monitoring stopped, make sure everything reaches disk
+            live_sinks.close()
     
-    root.after(100, process_log_queue)  # Continue processing
+    # Coalesce everything drained this tick into a single insert per widget
+    if live_lines:
+        append_live_text("".join(live_lines))
+    if type_lines:
+        # The tabs now run ahead of the buffered category files
+        category_texts_synced = False
+    for log_type, lines in type_lines.items():
+        text_widget = logcat_type_texts[log_type]
+        text_widget.config(state=tk.NORMAL)
+        text_widget.insert(tk.END, "".join(lines))
+        text_widget.see(tk.END)
+        text_widget.config(state=tk.DISABLED)
+    
+    # Flush quiet periods so buffered lines don't sit in memory
+    live_sinks.flush_if_due()
+    
+    # Show whether the UI is keeping up with the device
+    metrics.sample_queue("monitor", log_queue.qsize())
+    live_queue_label.config(text=f"Queue: {log_queue.qsize()}/{log_queue.maxsize} "
+                                 f"(peak {log_queue.high_water}) | Dropped: {log_queue.dropped} "
+                                 f"| Lag: {log_queue.lag():.1f}s")
+    
+    # Come straight back if the budget ran out with entries still waiting
+    root.after(1 if not log_queue.empty() else 100, process_log_queue)  # Continue processing
+
+def ensure_graph_canvas():
+    """Create the Graphs tab figure and canvas on first use, importing matplotlib only then"""
+    global graph_fig, graph_ax, graph_canvas
+    if graph_canvas is None:
+        import matplotlib.pyplot as plt
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        graph_fig, graph_ax = plt.subplots(figsize=(7, 4))
+        graph_canvas = FigureCanvasTkAgg(graph_fig, master=tab_graphs)
+        graph_canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, pady=10)
 
 def plot_graph():
-    log_type = graph_type_combo.get()
-    time_range = graph_time_combo.get()
+    from scripts.graphs import draw_graph
+    ensure_graph_canvas()
     
-    # Function to extract timestamps from log files
-    def get_timestamps_from_file(filepath):
-        try:
-            with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-                lines = f.readlines()
-        except FileNotFoundError:
-            return None, []
-        
-        timestamps = []
-        all_lines = []
-        
-        for line in lines:
-            # Try to find standard datetime format
-            date_match = re.search(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', line)
-            if date_match:
-                try:
-                    ts = datetime.strptime(date_match.group(), "%Y-%m-%d %H:%M:%S")
-                    timestamps.append(ts)
-                    all_lines.append(line)
-                    continue
-                except:
-                    pass
-            
-            # Try unix timestamp format
-            unix_match = re.search(r'date=(\d+)', line)
-            if unix_match:
-                try:
-                    ts = datetime.fromtimestamp(int(unix_match.group(1)) / 1000)
-                    timestamps.append(ts)
-                    all_lines.append(line)
-                except:
-                    pass
-                
-            # Try logcat timestamp format
-            logcat_match = re.search(r'(\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-            if logcat_match:
-                try:
-                    today = datetime.now()
-                    date_str = f"{today.year}-{logcat_match.group(1)}"
-                    ts = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                    # Handle year boundary
-                    if ts > today:
-                        ts = ts.replace(year=today.year - 1)
-                    timestamps.append(ts)
-                    all_lines.append(line)
-                except:
-                    pass
-        
-        return all_lines, timestamps
-
-    # Apply time filter based on selected range
-    now = datetime.now()
-    def apply_time_filter(timestamps, lines):
-        filtered_timestamps = []
-        filtered_lines = []
-        
-        for i, ts in enumerate(timestamps):
-            include = False
-            
-            if time_range == "Past 1 Hour" and now - ts <= timedelta(hours=1):
-                include = True
-            elif time_range == "Past 24 Hours" and now - ts <= timedelta(hours=24):
-                include = True
-            elif time_range == "Past 7 Days" and now - ts <= timedelta(days=7):
-                include = True
-            elif time_range == "All Time":
-                include = True
-                
-            if include:
-                filtered_timestamps.append(ts)
-                filtered_lines.append(lines[i])
-                
-        return filtered_timestamps, filtered_lines
-
-    # Clear the previous graph
+    # Clear the previous graph and draw the selected one
     graph_ax.clear()
-
-    # Generate graphs based on log type
-    if log_type in ["Call Logs", "SMS Logs"]:
-        path = "logs/call_logs.txt" if log_type == "Call Logs" else "logs/sms_logs.txt"
-        lines, timestamps = get_timestamps_from_file(path)
-        
-        if lines is None or not lines:
-            graph_ax.text(0.5, 0.5, f"{log_type} file not found or empty", fontsize=14, ha='center')
-            graph_canvas.draw()
-            return
-
-        timestamps, lines = apply_time_filter(timestamps, lines)
-        
-        if not timestamps:
-            graph_ax.text(0.5, 0.5, "No data in selected time range", fontsize=12, ha='center')
-            graph_canvas.draw()
-            return
-
-        # Aggregate data by hour
-        activity_per_hour = {}
-        for ts in timestamps:
-            hour = ts.replace(minute=0, second=0, microsecond=0)
-            activity_per_hour[hour] = activity_per_hour.get(hour, 0) + 1
-
-        sorted_times = sorted(activity_per_hour.keys())
-        counts = [activity_per_hour[t] for t in sorted_times]
-
-        # Plot the time series graph
-        graph_ax.plot(sorted_times, counts, marker="o", color="lime", linewidth=2)
-        graph_ax.set_title(f"{log_type} Activity Over Time", color="lime", fontsize=12)
-        graph_ax.set_ylabel("Count", color="lime")
-        graph_ax.set_xlabel("Time", color="lime")
-        graph_ax.tick_params(axis='x', colors='lime')
-        graph_ax.tick_params(axis='y', colors='lime')
-        graph_ax.grid(True, alpha=0.3)
-        
-        # Format x-axis dates properly
-        graph_ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-        graph_fig.autofmt_xdate()
-
-    elif log_type == "Top SMS Senders":
-        lines, timestamps = get_timestamps_from_file("logs/sms_logs.txt")
-        
-        if lines is None or not lines:
-            graph_ax.text(0.5, 0.5, "SMS log file not found or empty", fontsize=14, ha='center')
-            graph_canvas.draw()
-            return
-
-        timestamps, lines = apply_time_filter(timestamps, lines)
-        
-        if not timestamps:
-            graph_ax.text(0.5, 0.5, "No data in selected time range", fontsize=12, ha='center')
-            graph_canvas.draw()
-            return
-
-        # Extract sender phone numbers
-        senders = []
-        for line in lines:
-            match = re.search(r'from: (\+?\d+)', line)
-            if match:
-                senders.append(match.group(1))
-
-        if not senders:
-            graph_ax.text(0.5, 0.5, "No sender data found in logs", fontsize=12, ha='center')
-            graph_canvas.draw()
-            return
-
-        # Count most frequent senders
-        counter = Counter(senders)
-        top_senders = counter.most_common(10)
-        labels = [s[0] for s in top_senders]
-        counts = [s[1] for s in top_senders]
-
-        # Create horizontal bar chart
-        bars = graph_ax.barh(labels[::-1], counts[::-1], color="lime")
-        graph_ax.set_title("Top 10 SMS Senders", color="lime", fontsize=12)
-        graph_ax.set_xlabel("Number of Messages", color="lime")
-        graph_ax.tick_params(axis='x', colors='lime')
-        graph_ax.tick_params(axis='y', colors='lime')
-        graph_ax.grid(True, axis='x', alpha=0.3)
-        
-        # Add count values at the end of each bar
-        for i, bar in enumerate(bars):
-            width = bar.get_width()
-            graph_ax.text(width + 0.3, bar.get_y() + bar.get_height()/2, 
-                         str(int(width)), ha='left', va='center', color='lime')
-
-    elif log_type == "Logcat Activity":
-        lines, timestamps = get_timestamps_from_file("logs/android_logcat.txt")
-        
-        if lines is None or not lines:
-            graph_ax.text(0.5, 0.5, "Logcat file not found or empty", fontsize=14, ha='center')
-            graph_canvas.draw()
-            return
-
-        timestamps, lines = apply_time_filter(timestamps, lines)
-        
-        if not timestamps:
-            graph_ax.text(0.5, 0.5, "No logcat activity in selected time range", fontsize=12, ha='center')
-            graph_canvas.draw()
-            return
-
-        # Aggregate data by hour
-        activity_per_hour = {}
-        for ts in timestamps:
-            hour = ts.replace(minute=0, second=0, microsecond=0)
-            activity_per_hour[hour] = activity_per_hour.get(hour, 0) + 1
-
-        sorted_times = sorted(activity_per_hour.keys())
-        counts = [activity_per_hour[t] for t in sorted_times]
-
-        # Plot time series graph
-        graph_ax.plot(sorted_times, counts, marker="o", linestyle="-", color="lime", linewidth=2)
-        graph_ax.set_title("Logcat Activity Over Time", color="lime", fontsize=12)
-        graph_ax.set_ylabel("Number of Entries", color="lime")
-        graph_ax.set_xlabel("Time", color="lime")
-        graph_ax.tick_params(axis='x', colors='lime')
-        graph_ax.tick_params(axis='y', colors='lime')
-        graph_ax.grid(True, alpha=0.3)
-        
-        # Format x-axis dates properly
-        graph_ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-        graph_fig.autofmt_xdate()
-    
-    # Handle specialized logcat type graphs
-    elif log_type in LOG_TYPES:
-        # Get the color for this log type
-        log_color = LOG_TYPES[log_type]["color"] if log_type in LOG_TYPES else "lime"
-        
-        # Get the file path for this log type
-        filepath = f"logs/logcat_types/{log_type.lower()}_logs.txt"
-        
-        # Get timestamps from file
-        lines, timestamps = get_timestamps_from_file(filepath)
-        
-        if lines is None or not timestamps:
-            graph_ax.text(0.5, 0.5, f"No {log_type} logs found", fontsize=14, ha='center')
-            graph_canvas.draw()
-            return
-            
-        # Apply time filter
-        timestamps, lines = apply_time_filter(timestamps, lines)
-        
-        if not timestamps:
-            graph_ax.text(0.5, 0.5, f"No {log_type} logs in selected time range", fontsize=12, ha='center')
-            graph_canvas.draw()
-            return
-            
-        # For specialized log types, show two graphs:
-        # 1. Activity over time
-        # 2. Distribution of subtypes (if applicable)
-        
-        # Activity over time (primary graph)
-        activity_per_hour = {}
-        for ts in timestamps:
-            hour = ts.replace(minute=0, second=0, microsecond=0)
-            activity_per_hour[hour] = activity_per_hour.get(hour, 0) + 1
-            
-        sorted_times = sorted(activity_per_hour.keys())
-        counts = [activity_per_hour[t] for t in sorted_times]
-        
-        # Plot the time series
-        graph_ax.plot(sorted_times, counts, marker="o", color=log_color, linewidth=2)
-        graph_ax.set_title(f"{log_type} Activity Over Time", color="lime", fontsize=12)
-        graph_ax.set_ylabel("Count", color="lime")
-        graph_ax.set_xlabel("Time", color="lime")
-        graph_ax.tick_params(axis='x', colors='lime')
-        graph_ax.tick_params(axis='y', colors='lime')
-        graph_ax.grid(True, alpha=0.3)
-        
-        # Format x-axis dates properly
-        graph_ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
-        graph_fig.autofmt_xdate()
-
-    # Apply dark theme to the graph figure
-    graph_fig.patch.set_facecolor('#121212')
-    graph_ax.set_facecolor('#1e1e1e')
+    draw_graph(graph_fig, graph_ax, graph_type_combo.get(), graph_time_combo.get(), graph_cache)
     
     # Draw the updated graph
     graph_canvas.draw()
 
 def plot_frequent_callers():
-    try:
-        with open("logs/call_logs.txt", "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-    except FileNotFoundError:
-        graph_ax.clear()
-        graph_ax.text(0.5, 0.5, "Call log file not found", fontsize=14, ha='center')
-        graph_canvas.draw()
-        return
-    
-    # Apply time filter
-    time_range = graph_time_combo.get()
-    now = datetime.now()
-    
-    filtered_lines = []
-    for line in lines:
-        date_match = re.search(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', line)
-        unix_match = re.search(r'date=(\d+)', line)
-        
-        include = False
-        if date_match:
-            try:
-                ts = datetime.strptime(date_match.group(), "%Y-%m-%d %H:%M:%S")
-                if (time_range == "Past 1 Hour" and now - ts <= timedelta(hours=1)) or \
-                   (time_range == "Past 24 Hours" and now - ts <= timedelta(hours=24)) or \
-                   (time_range == "Past 7 Days" and now - ts <= timedelta(days=7)) or \
-                   (time_range == "All Time"):
-                    include = True
-            except:
-                pass
-        elif unix_match:
-            try:
-                ts = datetime.fromtimestamp(int(unix_match.group(1)) / 1000)
-                if (time_range == "Past 1 Hour" and now - ts <= timedelta(hours=1)) or \
-                   (time_range == "Past 24 Hours" and now - ts <= timedelta(hours=24)) or \
-                   (time_range == "Past 7 Days" and now - ts <= timedelta(days=7)) or \
-                   (time_range == "All Time"):
-                    include = True
-            except:
-                pass
-        
-        if include or time_range == "All Time":
-            filtered_lines.append(line)
+    from scripts.graphs import draw_frequent_callers
+    ensure_graph_canvas()
     
-    if not filtered_lines:
-        graph_ax.clear()
-        graph_ax.text(0.5, 0.5, "No call data in selected time range", fontsize=12, ha='center')
-        graph_canvas.draw()
-        return
-    
-    # Extract phone numbers
-    numbers = []
-    for line in filtered_lines:
-        # Look for phone numbers in the line
-        matches = re.findall(r'(?:number:|to:|from:)\s*(\+?\d{7,15})', line)
-        if matches:
-            numbers.extend(matches)
-        else:
-            # Try the general phone number pattern
-            matches = re.findall(r'(\+?\d{7,15})', line)
-            numbers.extend(matches)
-
-    if not numbers:
-        graph_ax.clear()
-        graph_ax.text(0.5, 0.5, "No phone numbers found in logs", fontsize=12, ha='center')
-        graph_canvas.draw()
-        return
-
-    # Count frequencies and get top callers
-    counter = Counter(numbers)
-    top_callers = counter.most_common(10)
-    labels = [x[0] for x in top_callers]
-    counts = [x[1] for x in top_callers]
-
-    # Create the bar chart
     graph_ax.clear()
-    bars = graph_ax.barh(labels[::-1], counts[::-1], color="lime")
-    graph_ax.set_title("Top 10 Frequent Callers", color="lime", fontsize=12)
-    graph_ax.set_xlabel("Number of Calls", color="lime")
-    graph_ax.tick_params(axis='x', colors='lime')
-    graph_ax.tick_params(axis='y', colors='lime')
-    graph_ax.grid(True, axis='x', alpha=0.3)
-    
-    # Add count values at the end of each bar
-    for i, bar in enumerate(bars):
-        width = bar.get_width()
-        graph_ax.text(width + 0.3, bar.get_y() + bar.get_height()/2, 
-                     str(int(width)), ha='left', va='center', color='lime')
-    
-    # Apply dark theme
-    graph_fig.patch.set_facecolor('#121212')
-    graph_ax.set_facecolor('#1e1e1e')
+    draw_frequent_callers(graph_fig, graph_ax, graph_time_combo.get(), graph_cache)
     
     # Draw the updated graph
     graph_canvas.draw()
 
 def create_log_distribution_chart(log_type):
     """Create a distribution chart for a specific logcat type showing subtypes"""
+    import matplotlib.pyplot as plt
     try:
         filepath = f"logs/logcat_types/{log_type.lower()}_logs.txt"
-        with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-            
-        if not lines:
+        if not os.path.getsize(filepath):
             return None
             
         # For each log type, define specific patterns to look for
@@ -815,13 +719,14 @@ def create_log_distribution_chart(log_type):
             
         # Count occurrences
         counts = {pattern: 0 for pattern in patterns}
-        for line in lines:
-            for pattern_name, pattern in patterns.items():
-                if re.search(pattern, line, re.IGNORECASE):
-                    counts[pattern_name] += 1
-                    # Only count for the first matching pattern unless it's Other
-                    if pattern_name != "Other":
-                        break
+        with LineScanner(filepath) as scanner:
+            for line in scanner.iter_lines():
+                for pattern_name, pattern in patterns.items():
+                    if re.search(pattern, line, re.IGNORECASE):
+                        counts[pattern_name] += 1
+                        # Only count for the first matching pattern unless it's Other
+                        if pattern_name != "Other":
+                            break
                         
         # Create distribution chart
         labels = list(counts.keys())
@@ -852,11 +757,8 @@ def process_logs_for_type(log_type):
         # Split into lines and filter empty lines
         log_lines = [line.strip() for line in log_content.split('\n') if line.strip()]
         
-        # Get the regex pattern for this log type
-        pattern = LOG_TYPES[log_type]["pattern"]
-        
-        # Filter lines that match the pattern
-        matching_lines = [line for line in log_lines if re.search(pattern, line, re.IGNORECASE)]
+        # Filter lines that match this log type
+        matching_lines = [line for line in log_lines if log_classifier.matches(log_type, line)]
         
         # Extract relevant components (modify as needed)
         processed_logs = []
@@ -872,6 +774,9 @@ def process_logs_for_type(log_type):
         return []
 def plot_log_type_distribution(log_type):
     """Create a distribution chart window for a specific log type"""
+    import matplotlib.pyplot as plt
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+    
     def create_log_distribution_chart(log_type):
         # Sample data - replace with your actual log processing
         log_data = process_logs_for_type(log_type)  # Implement this function
@@ -974,7 +879,9 @@ def export_graph_data(format_type):
         log_type = graph_type_combo.get()
         data = []
 
-        if graph_ax.lines:  # For line charts like Call Logs, SMS Logs, Logcat
+        if graph_ax is None:  # No graph has been drawn yet
+            pass
+        elif graph_ax.lines:  # For line charts like Call Logs, SMS Logs, Logcat
             x_data = graph_ax.lines[0].get_xdata()
             y_data = graph_ax.lines[0].get_ydata()
             data = list(zip(x_data, y_data))
@@ -998,50 +905,49 @@ def export_graph_data(format_type):
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         if format_type == "csv":
+            import pandas as pd
             df = pd.DataFrame(data, columns=["Label/Time", "Count"])
             filepath = f"logs/exports/graph_export_{timestamp}.csv"
             df.to_csv(filepath, index=False)
             messagebox.showinfo("Export Successful", f"Data exported to {filepath}")
         
         elif format_type == "pdf":
+            from scripts.report_export import write_graph_pdf
             filepath = f"logs/exports/graph_export_{timestamp}.pdf"
-            pdf = FPDF()
-            pdf.add_page()
-            pdf.set_font("Arial", size=12)
-            pdf.cell(200, 10, txt=f"{log_type} - Graph Export", ln=True, align='C')
-            pdf.cell(200, 10, txt=f"Time Range: {graph_time_combo.get()}", ln=True)
-            pdf.cell(200, 10, txt=f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
-            pdf.ln(10)
-            
-            # Create data table
-            pdf.set_font("Arial", 'B', size=10)
-            pdf.cell(100, 10, txt="Time/Label", border=1)
-            pdf.cell(50, 10, txt="Count", border=1)
-            pdf.ln()
-            
-            pdf.set_font("Arial", size=10)
-            for i, (label, count) in enumerate(data):
-                # Format the label/time
-                if isinstance(label, datetime):
-                    label_str = label.strftime('%Y-%m-%d %H:%M')
-                else:
-                    label_str = str(label)
-                
-                # Add a row to the table
-                pdf.cell(100, 10, txt=label_str, border=1)
-                pdf.cell(50, 10, txt=str(count), border=1)
-                pdf.ln()
-            
-            # Save the PDF
-            pdf.output(filepath)
-            messagebox.showinfo("Export Successful", f"Report exported to {filepath}")
+            # The graph data is read from the axes here; only the PDF layout runs in the background
+            time_range = graph_time_combo.get()
+            run_report_job("Exporting Graph",
+                           lambda job: write_graph_pdf(filepath, log_type, time_range, data, job.update),
+                           "Export Successful", f"Report exported to {filepath}",
+                           "Export Failed", "Failed to export data")
     
     except Exception as e:
         messagebox.showerror("Export Failed", f"Failed to export data: {str(e)}")
 
+def run_report_job(title, work, success_title, success_message, error_title, error_message):
+    """Run work(job) in the background behind a progress window with a cancel button.
+
+    Only the final outcome comes back to the UI thread, as a message box.
+    """
+    job = BackgroundJob(work, name=title).start()
+    JobProgressWindow(
+        root, job, title,
+        on_success=lambda result: messagebox.showinfo(success_title, success_message),
+        on_error=lambda e: messagebox.showerror(error_title, f"{error_message}: {str(e)}"),
+        bg=BG_COLOR, fg=FG_COLOR, font=FONT
+    )
+    return job
+
+def show_stage_stats():
+    """Open the per-stage timing and profiling panel"""
+    from scripts.stats_panel import StageStatsWindow
+    StageStatsWindow(root, metrics, bg=BG_COLOR, fg=FG_COLOR, font=FONT)
+
 def export_full_report():
     """Generate a comprehensive report with all log analysis"""
     try:
+        from scripts.report_export import write_full_report
+        
         # Create exports directory if it doesn't exist
         os.makedirs("logs/exports", exist_ok=True)
         
@@ -1049,225 +955,11 @@ def export_full_report():
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         filepath = f"logs/exports/forensic_report_{timestamp}.pdf"
         
-        pdf = FPDF()
-        
-        # Add a cover page
-        pdf.add_page()
-        pdf.set_font("Arial", 'B', size=24)
-        pdf.cell(200, 40, txt="Android Forensic Analysis Report", ln=True, align='C')
-        pdf.set_font("Arial", size=12)
-        pdf.cell(200, 10, txt=f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True, align='C')
-        pdf.ln(20)
-        
-        # Add device information if available
-        try:
-            # Try to get basic device info from logcat
-            device_info = {
-                "Device Model": "Unknown",
-                "Android Version": "Unknown",
-                "Kernel Version": "Unknown"
-            }
-            
-            with open("logs/android_logcat.txt", "r", encoding="utf-8", errors="replace") as f:
-                logs = f.read()
-                # Look for device model
-                model_match = re.search(r'model=([^,\s]+)', logs)
-                if model_match:
-                    device_info["Device Model"] = model_match.group(1)
-                
-                # Look for Android version
-                version_match = re.search(r'Android\s+(\d+(\.\d+)*)', logs)
-                if version_match:
-                    device_info["Android Version"] = version_match.group(1)
-                
-                # Look for kernel version
-                kernel_match = re.search(r'Linux\s+version\s+([^\s]+)', logs)
-                if kernel_match:
-                    device_info["Kernel Version"] = kernel_match.group(1)
-            
-            # Add device info to the report
-            pdf.set_font("Arial", 'B', size=14)
-            pdf.cell(200, 10, txt="Device Information", ln=True)
-            pdf.ln(5)
-            
-            pdf.set_font("Arial", size=12)
-            for key, value in device_info.items():
-                pdf.cell(200, 10, txt=f"{key}: {value}", ln=True)
-            
-        except Exception as e:
-            pdf.cell(200, 10, txt="Could not retrieve device information", ln=True)
-        
-        # Add table of contents placeholder (would need to be filled in post-processing)
-        pdf.add_page()
-        pdf.set_font("Arial", 'B', size=16)
-        pdf.cell(200, 10, txt="Table of Contents", ln=True)
-        pdf.ln(10)
-        pdf.set_font("Arial", size=12)
-        pdf.cell(200, 10, txt="1. Call Log Analysis", ln=True)
-        pdf.cell(200, 10, txt="2. SMS Log Analysis", ln=True)
-        pdf.cell(200, 10, txt="3. Logcat Analysis", ln=True)
-        
-        # Call Log Analysis
-        pdf.add_page()
-        pdf.set_font("Arial", 'B', size=16)
-        pdf.cell(200, 10, txt="1. Call Log Analysis", ln=True)
-        pdf.ln(10)
-        
-        try:
-            with open("logs/call_logs.txt", "r", encoding="utf-8", errors="replace") as f:
-                call_logs = f.readlines()
-                
-            if call_logs:
-                # Call statistics
-                call_count = len(call_logs)
-                
-                # Count incoming/outgoing/missed calls
-                incoming = sum(1 for line in call_logs if re.search(r'type:\s*1|INCOMING', line, re.IGNORECASE))
-                outgoing = sum(1 for line in call_logs if re.search(r'type:\s*2|OUTGOING', line, re.IGNORECASE))
-                missed = sum(1 for line in call_logs if re.search(r'type:\s*3|MISSED', line, re.IGNORECASE))
-                
-                pdf.set_font("Arial", size=12)
-                pdf.cell(200, 10, txt=f"Total calls: {call_count}", ln=True)
-                pdf.cell(200, 10, txt=f"Incoming calls: {incoming}", ln=True)
-                pdf.cell(200, 10, txt=f"Outgoing calls: {outgoing}", ln=True)
-                pdf.cell(200, 10, txt=f"Missed calls: {missed}", ln=True)
-                pdf.ln(10)
-                
-                # Most frequent callers
-                numbers = []
-                for line in call_logs:
-                    matches = re.findall(r'(?:number:|to:|from:)\s*(\+?\d{7,15})', line)
-                    if matches:
-                        numbers.extend(matches)
-                    else:
-                        matches = re.findall(r'(\+?\d{7,15})', line)
-                        numbers.extend(matches)
-                
-                if numbers:
-                    counter = Counter(numbers)
-                    top_callers = counter.most_common(5)
-                    
-                    pdf.set_font("Arial", 'B', size=14)
-                    pdf.cell(200, 10, txt="Top 5 Most Frequent Callers", ln=True)
-                    pdf.ln(5)
-                    
-                    pdf.set_font("Arial", 'B', size=12)
-                    pdf.cell(100, 10, txt="Phone Number", border=1)
-                    pdf.cell(50, 10, txt="Call Count", border=1)
-                    pdf.ln()
-                    
-                    pdf.set_font("Arial", size=12)
-                    for number, count in top_callers:
-                        pdf.cell(100, 10, txt=number, border=1)
-                        pdf.cell(50, 10, txt=str(count), border=1)
-                        pdf.ln()
-            else:
-                pdf.cell(200, 10, txt="No call logs found", ln=True)
-                
-        except FileNotFoundError:
-            pdf.cell(200, 10, txt="Call log file not found", ln=True)
-        except Exception as e:
-            pdf.cell(200, 10, txt=f"Error analyzing call logs: {str(e)}", ln=True)
-        
-        # SMS Log Analysis
-        pdf.add_page()
-        pdf.set_font("Arial", 'B', size=16)
-        pdf.cell(200, 10, txt="2. SMS Log Analysis", ln=True)
-        pdf.ln(10)
-        
-        try:
-            with open("logs/sms_logs.txt", "r", encoding="utf-8", errors="replace") as f:
-                sms_logs = f.readlines()
-                
-            if sms_logs:
-                # SMS statistics
-                sms_count = len(sms_logs)
-                
-                # Count incoming/outgoing SMS
-                incoming = sum(1 for line in sms_logs if re.search(r'type:\s*1|INCOMING|from:', line, re.IGNORECASE))
-                outgoing = sum(1 for line in sms_logs if re.search(r'type:\s*2|OUTGOING|to:', line, re.IGNORECASE))
-                
-                pdf.set_font("Arial", size=12)
-                pdf.cell(200, 10, txt=f"Total SMS messages: {sms_count}", ln=True)
-                pdf.cell(200, 10, txt=f"Incoming messages: {incoming}", ln=True)
-                pdf.cell(200, 10, txt=f"Outgoing messages: {outgoing}", ln=True)
-                pdf.ln(10)
-                
-                # Most frequent SMS senders
-                senders = []
-                for line in sms_logs:
-                    match = re.search(r'from: (\+?\d+)', line)
-                    if match:
-                        senders.append(match.group(1))
-                
-                if senders:
-                    counter = Counter(senders)
-                    top_senders = counter.most_common(5)
-                    
-                    pdf.set_font("Arial", 'B', size=14)
-                    pdf.cell(200, 10, txt="Top 5 Most Frequent SMS Senders", ln=True)
-                    pdf.ln(5)
-                    
-                    pdf.set_font("Arial", 'B', size=12)
-                    pdf.cell(100, 10, txt="Phone Number", border=1)
-                    pdf.cell(50, 10, txt="Message Count", border=1)
-                    pdf.ln()
-                    
-                    pdf.set_font("Arial", size=12)
-                    for number, count in top_senders:
-                        pdf.cell(100, 10, txt=number, border=1)
-                        pdf.cell(50, 10, txt=str(count), border=1)
-                        pdf.ln()
-            else:
-                pdf.cell(200, 10, txt="No SMS logs found", ln=True)
-                
-        except FileNotFoundError:
-            pdf.cell(200, 10, txt="SMS log file not found", ln=True)
-        except Exception as e:
-            pdf.cell(200, 10, txt=f"Error analyzing SMS logs: {str(e)}", ln=True)
-        
-        # Logcat Analysis
-        pdf.add_page()
-        pdf.set_font("Arial", 'B', size=16)
-        pdf.cell(200, 10, txt="3. Logcat Analysis", ln=True)
-        pdf.ln(10)
-        
-        # Add logcat type distribution information
-        for log_type in LOG_TYPES:
-            try:
-                filepath = f"logs/logcat_types/{log_type.lower()}_logs.txt"
-                with open(filepath, "r", encoding="utf-8", errors="replace") as f:
-                    lines = f.readlines()
-                
-                if lines:
-                    pdf.set_font("Arial", 'B', size=14)
-                    pdf.cell(200, 10, txt=f"{log_type} Logs", ln=True)
-                    pdf.ln(5)
-                    
-                    pdf.set_font("Arial", size=12)
-                    pdf.cell(200, 10, txt=f"Total entries: {len(lines)}", ln=True)
-                    
-                    # Add example entries (first 3)
-                    if len(lines) > 1:
-                        pdf.set_font("Arial", 'B', size=12)
-                        pdf.cell(200, 10, txt="Example entries:", ln=True)
-                        
-                        pdf.set_font("Arial", size=10)
-                        for i, line in enumerate(lines[1:4]):  # Skip header line and show 3 examples
-                            # Truncate long lines
-                            if len(line) > 100:
-                                line = line[:97] + "..."
-                            pdf.multi_cell(0, 10, txt=f"{i+1}. {line.strip()}")
-                    
-                    pdf.ln(5)
-            except FileNotFoundError:
-                pass
-            except Exception as e:
-                pdf.cell(200, 10, txt=f"Error analyzing {log_type} logs: {str(e)}", ln=True)
-        
-        # Save the PDF
-        pdf.output(filepath)
-        messagebox.showinfo("Report Generated", f"Forensic report exported to {filepath}")
+        # Collection and PDF layout run on a worker thread so the window stays responsive
+        run_report_job("Generating Report",
+                       lambda job: write_full_report(filepath, LOG_TYPES, job.update),
+                       "Report Generated", f"Forensic report exported to {filepath}",
+                       "Report Generation Failed", "Failed to generate report")
     
     except Exception as e:
         messagebox.showerror("Report Generation Failed", f"Failed to generate report: {str(e)}")
@@ -1342,15 +1034,8 @@ def apply_filter():
     severity = filter_severity_combo.get()
     
     # Determine input file based on log type
-    if log_type == "Logcat":
-        input_file = "logs/android_logcat.txt"
-    elif log_type == "Calls":
-        input_file = "logs/call_logs.txt"
-    elif log_type == "SMS":
-        input_file = "logs/sms_logs.txt"
-    elif log_type in LOG_TYPES:
-        input_file = f"logs/logcat_types/{log_type.lower()}_logs.txt"
-    else:
+    input_file = filter_input_file(log_type)
+    if input_file is None:
         filter_output.insert(tk.END, "❌ Please select a valid log type.\n")
         return
     
@@ -1365,164 +1050,25 @@ def apply_filter():
         filter_output.delete(1.0, tk.END)
         filter_output.insert(tk.END, f"❌ Error applying filter: {str(e)}\n")
 
-def filter_logs(input_file, keyword=None, time_range=None, severity=None, subtype=None, output_file="logs/filtered_logs.txt"):
-    """Enhanced filter logs function that handles all the new options"""
-    try:
-        with open(input_file, "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
-            
-        now = datetime.now()
-        filtered_lines = []
-        
-        # Define patterns for severity levels
-        severity_patterns = {
-            "Error": r'E/|ERROR|Exception|FATAL',
-            "Warning": r'W/|WARN|WARNING',
-            "Info": r'I/|INFO',
-            "Debug": r'D/|DEBUG',
-            "Verbose": r'V/|VERBOSE'
-        }
-        
-        # Define patterns for subtypes based on categories
-        subtype_patterns = {
-            # Application subtypes
-            "Activity": r'Activity|startActivity',
-            "Fragment": r'Fragment',
-            "View": r'View|Inflate',
-            "Lifecycle": r'onCreate|onStart|onResume|onPause|onStop|onDestroy',
-            
-            # System subtypes
-            "Boot": r'boot|start up|startup|starting',
-            "Memory": r'memory|heap|ram',
-            "CPU": r'cpu|processor',
-            "Battery": r'battery|power',
-            
-            # Crash subtypes
-            "NullPointer": r'NullPointerException',
-            "OutOfMemory": r'OutOfMemoryError',
-            "IllegalState": r'IllegalStateException',
-            "ANR": r'ANR|Not Responding',
-            
-            # Network subtypes
-            "WiFi": r'wifi|wlan',
-            "Mobile": r'mobile|cellular|data connection',
-            "HTTP": r'http|https|URL',
-            "Socket": r'socket|tcp|udp',
-            
-            # GC subtypes
-            "Dalvik GC": r'dalvikvm.*GC',
-            "ART GC": r'art.*GC',
-            "Explicit GC": r'Explicit GC',
-            "Concurrent GC": r'Concurrent GC',
-            
-            # Broadcast subtypes
-            "System": r'android\.intent\.action|system broadcast',
-            "App": r'com\.',
-            "Sticky": r'sticky|registerReceiver',
-            "Ordered": r'ordered broadcast',
-            
-            # Service subtypes
-            "Start": r'startService',
-            "Stop": r'stopService',
-            "Bind": r'bindService|onBind',
-            "Unbind": r'unbindService|onUnbind',
-            
-            # Device subtypes
-            "Battery": r'battery|BatteryManager',
-            "Power": r'power|PowerManager|wake|sleep',
-            "Sensor": r'sensor|Sensor',
-            "Camera": r'camera|Camera',
-            "Location": r'location|LocationManager|GPS'
-        }
-        
-        for line in lines:
-            include = True
-            
-            # Apply time filter
-            if time_range and time_range != "All Time":
-                date_match = re.search(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', line)
-                unix_match = re.search(r'date=(\d+)', line)
-                logcat_match = re.search(r'(\d{2}-\d{2} \d{2}:\d{2}:\d{2})', line)
-                
-                has_timestamp = False
-                if date_match:
-                    try:
-                        ts = datetime.strptime(date_match.group(), "%Y-%m-%d %H:%M:%S")
-                        has_timestamp = True
-                    except:
-                        pass
-                elif unix_match:
-                    try:
-                        ts = datetime.fromtimestamp(int(unix_match.group(1)) / 1000)
-                        has_timestamp = True
-                    except:
-                        pass
-                elif logcat_match:
-                    try:
-                        today = datetime.now()
-                        date_str = f"{today.year}-{logcat_match.group(1)}"
-                        ts = datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S")
-                        if ts > today:
-                            ts = ts.replace(year=today.year - 1)
-                        has_timestamp = True
-                    except:
-                        pass
-                
-                if has_timestamp:
-                    if time_range == "Past 1 Hour" and (now - ts) > timedelta(hours=1):
-                        include = False
-                    elif time_range == "Past 24 Hours" and (now - ts) > timedelta(hours=24):
-                        include = False
-                    elif time_range == "Past 7 Days" and (now - ts) > timedelta(days=7):
-                        include = False
-            
-            # Apply keyword filter
-            if include and keyword and keyword.strip():
-                if keyword.lower() not in line.lower():
-                    include = False
-            
-            # Apply severity filter
-            if include and severity and severity != "All":
-                if not re.search(severity_patterns.get(severity, ""), line, re.IGNORECASE):
-                    include = False
-            
-            # Apply subtype filter
-            if include and subtype and subtype != "All":
-                if not re.search(subtype_patterns.get(subtype, ""), line, re.IGNORECASE):
-                    include = False
-            
-            # Add line to filtered results if it passes all filters
-            if include:
-                filtered_lines.append(line)
-        
-        # Write filtered lines to output file
-        with open(output_file, "w", encoding="utf-8") as f:
-            f.writelines(filtered_lines)
-        
-        return len(filtered_lines)
-    
-    except Exception as e:
-        print(f"Error filtering logs: {e}")
-        raise
-
 def load_filtered_logs():
     """Load filtered logs into the filter output text widget"""
     try:
         filter_output.delete(1.0, tk.END)
         
-        with open("logs/filtered_logs.txt", "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
+        with LineScanner("logs/filtered_logs.txt") as scanner:
+            if not scanner.size:
+                filter_output.insert(tk.END, "No logs match the selected filters.\n")
+                return
             
-        if not lines:
-            filter_output.insert(tk.END, "No logs match the selected filters.\n")
-            return
-        
-        # Show filtered logs with line numbers
-        for i, line in enumerate(lines):
-            filter_output.insert(tk.END, f"{i+1}: {line}")
+            # Show filtered logs with line numbers in a single insert
+            line_count = 0
+            numbered = []
+            for line_count, line in enumerate(scanner.iter_lines(), 1):
+                numbered.append(f"{line_count}: {line}")
+            filter_output.insert(tk.END, "".join(numbered))
         
         # Show summary
-        filter_output.insert(tk.END, f"\n\n✅ Found {len(lines)} matching log entries.\n")
+        filter_output.insert(tk.END, f"\n\n✅ Found {line_count} matching log entries.\n")
         
         # Create a button to graph the filtered results
         tk.Button(filter_frame, text="Graph Filtered Results", bg=BUTTON_COLOR, fg=BUTTON_TEXT_COLOR,
@@ -1535,67 +1081,34 @@ def load_filtered_logs():
 def graph_filtered_results():
     """Create a graph of the filtered log results"""
     try:
+        import matplotlib.pyplot as plt
+        import matplotlib.dates as mdates
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from scripts.time_buckets import hourly_counts
+        
         log_type = filter_type_combo.get()
         
-        with open("logs/filtered_logs.txt", "r", encoding="utf-8", errors="replace") as f:
-            lines = f.readlines()
+        records = parse_file("logs/filtered_logs.txt")
             
-        if not lines:
+        if not records:
             messagebox.showinfo("Graph", "No data to graph.")
             return
         
         # Different graph types based on log type
         if log_type in ["Calls", "SMS"]:
             # Create time-based graph for call or SMS logs
-            timestamps = []
-            
-            for line in lines:
-                # Try to extract timestamp
-                date_match = re.search(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}', line)
-                unix_match = re.search(r'date=(\d+)', line)
-                
-                if date_match:
-                    try:
-                        ts = datetime.strptime(date_match.group(), "%Y-%m-%d %H:%M:%S")
-                        timestamps.append(ts)
-                    except:
-                        pass
-                elif unix_match:
-                    try:
-                        ts = datetime.fromtimestamp(int(unix_match.group(1)) / 1000)
-                        timestamps.append(ts)
-                    except:
-                        pass
+            timestamps = [record.timestamp for record in records if record.timestamp is not None]
             
             if not timestamps:
                 messagebox.showinfo("Graph", "No timestamp data found in logs.")
                 return
             
-            # Group timestamps by hour
-            timestamps.sort()
-            
-            # Create bins by hour
-            start_time = timestamps[0].replace(minute=0, second=0, microsecond=0)
-            end_time = timestamps[-1].replace(minute=59, second=59, microsecond=999999)
-            
-            # Create hourly bins
-            hourly_bins = []
-            current = start_time
-            while current <= end_time:
-                hourly_bins.append(current)
-                current += timedelta(hours=1)
-            
-            # Count logs in each bin
-            counts = [0] * (len(hourly_bins))
-            for ts in timestamps:
-                for i, bin_time in enumerate(hourly_bins[:-1]):
-                    if bin_time <= ts < hourly_bins[i+1]:
-                        counts[i] += 1
-                        break
+            # Count logs in every hourly bin from the first to the last entry
+            hourly_bins, counts = hourly_counts(timestamps, fill_gaps=True)
             
             # Plot the results
             fig, ax = plt.subplots(figsize=(12, 6))
-            ax.plot(hourly_bins[:-1], counts, marker='o', linestyle='-')
+            ax.plot(hourly_bins, counts, marker='o', linestyle='-')
             ax.set_title(f"{log_type} Frequency Over Time")
             ax.set_xlabel("Time")
             ax.set_ylabel("Count")
@@ -1652,10 +1165,13 @@ def graph_filtered_results():
             }
             
             # Count severity levels
-            for line in lines:
+            for record in records:
+                if record.severity:
+                    severity_counts[record.severity] += 1
+                    continue
                 found = False
                 for severity, pattern in severity_patterns.items():
-                    if re.search(pattern, line, re.IGNORECASE):
+                    if re.search(pattern, record.line, re.IGNORECASE):
                         severity_counts[severity] += 1
                         found = True
                         break
@@ -1739,9 +1255,7 @@ def save_filtered_logs():
         if not file_path:
             return
             
-        with open("logs/filtered_logs.txt", "r", encoding="utf-8", errors="replace") as src_file:
-            with open(file_path, "w", encoding="utf-8") as dst_file:
-                dst_file.write(src_file.read())
+        shutil.copyfile("logs/filtered_logs.txt", file_path)
                 
         messagebox.showinfo("Save Successful", f"Filtered logs saved to {file_path}")
     
@@ -1760,15 +1274,15 @@ tk.Button(export_frame, text="Export Full Report", bg=BUTTON_COLOR, fg=BUTTON_TE
          command=export_full_report).pack(side=tk.LEFT, padx=10)
 
 tk.Button(export_frame, text="Export Current Graph (PNG)", bg=BUTTON_COLOR, fg=BUTTON_TEXT_COLOR,
-         command=lambda: export_chart(graph_fig, "graph_export.png") if 'graph_fig' in globals() else 
+         command=lambda: export_chart(graph_fig, "graph_export.png") if graph_fig is not None else 
                        messagebox.showinfo("Export", "No graph to export. Please generate a graph first.")).pack(side=tk.LEFT, padx=10)
 
 tk.Button(export_frame, text="Export Current Graph (PDF)", bg=BUTTON_COLOR, fg=BUTTON_TEXT_COLOR,
-         command=lambda: export_chart(graph_fig, "graph_export.pdf") if 'graph_fig' in globals() else 
+         command=lambda: export_chart(graph_fig, "graph_export.pdf") if graph_fig is not None else 
                        messagebox.showinfo("Export", "No graph to export. Please generate a graph first.")).pack(side=tk.LEFT, padx=10)
 
 tk.Button(export_frame, text="Export Current Graph Data (CSV)", bg=BUTTON_COLOR, fg=BUTTON_TEXT_COLOR,
-         command=lambda: export_graph_data("csv") if 'graph_fig' in globals() else 
+         command=lambda: export_graph_data("csv") if graph_fig is not None else 
                        messagebox.showinfo("Export", "No graph to export. Please generate a graph first.")).pack(side=tk.LEFT, padx=10)
 
 # Add visualization buttons to each logcat type tab
@@ -1789,7 +1303,7 @@ main_menu.add_cascade(label="File", menu=file_menu)
 file_menu.add_command(label="Import Logs", command=import_logs)
 file_menu.add_command(label="Export Full Report", command=export_full_report)
 file_menu.add_separator()
-file_menu.add_command(label="Exit", command=root.quit)
+file_menu.add_command(label="Exit", command=lambda: on_close())
 
 # Graph menu
 graph_menu = tk.Menu(main_menu, tearoff=0)
@@ -1806,6 +1320,9 @@ analysis_menu.add_command(label="SMS Analysis", command=lambda: notebook.select(
 analysis_menu.add_command(label="Logcat Analysis", command=lambda: notebook.select(tab_logcat))
 analysis_menu.add_command(label="Advanced Filter", command=lambda: notebook.select(tab_filter))
 
+analysis_menu.add_separator()
+analysis_menu.add_command(label="Performance Stats", command=lambda: show_stage_stats())
+
 # Help menu
 help_menu = tk.Menu(main_menu, tearoff=0)
 main_menu.add_cascade(label="Help", menu=help_menu)
@@ -1826,7 +1343,23 @@ notebook.add(tab_logcat, text="Logcat")
 notebook.add(tab_filter, text="Filter")
 notebook.pack(expand=True, fill='both')
 
+def on_close():
+    """Flush buffered category logs before closing the window"""
+    try:
+        live_sinks.close()
+    except Exception as e:
+        print(f"Error flushing logs on exit: {e}")
+    root.destroy()
+
+root.protocol("WM_DELETE_WINDOW", on_close)
+
 # Start the application
+def report_startup_time():
+    """Print how long the window took to become ready, for tracking cold-start regressions"""
+    global startup_seconds
+    startup_seconds = time.perf_counter() - STARTUP_STARTED
+    print(f"⏱ Startup time: {startup_seconds:.3f}s")
+
 if __name__ == "__main__":
     # Create global directories if they don't exist
     os.makedirs("logs", exist_ok=True)
@@ -1855,6 +1388,9 @@ if __name__ == "__main__":
     except Exception as e:
         print(f"Error loading SMS logs: {e}")
     
+    # Runs once the window has been drawn and the event loop is idle
+    root.after_idle(report_startup_time)
+    
     # Show welcome message
     messagebox.showinfo("Welcome", "Welcome to the Android Forensic Analyzer!\n\nThis tool helps you analyze Android logs for forensic investigation. Start by importing logs using the 'Import Logs' button or from the File menu.")
     
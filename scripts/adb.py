@@ -0,0 +1,313 @@
+"""adb command helpers: device enumeration, shell sessions and content provider queries.
+
+The adb executable comes from the ADB environment variable when set (it may
+include arguments, e.g. ADB="python fake_adb.py"), so everything here can
+run against the local stand-in instead of real hardware.
+"""
+import atexit
+import contextlib
+import os
+import queue
+import re
+import shlex
+import subprocess
+import threading
+import time
+import uuid
+
+# Seconds allowed for a single non-streaming adb command
+ADB_TIMEOUT = 120
+# Idle shell sessions kept open per device; enough for the call log and SMS
+# queries to run side by side. Busier moments get extra sessions, closed after use
+SESSIONS_PER_DEVICE = 2
+
+# Start of the line printed after each shell session command, before its exit status
+_SENTINEL = "__adb_done"
+
+# "Row: 0 number=+15551234567, date=1697000000000, type=1"
+_ROW_PREFIX = re.compile(r'^Row:\s*\d+\s+')
+_ROW_FIELD = re.compile(r'(\w+)=(.*?)(?=, \w+=|$)')
+
+
+class AdbError(Exception):
+    """An adb command failed or timed out"""
+
+
+class Device:
+    """One line of `adb devices -l` output"""
+
+    def __init__(self, serial, state, details=None):
+        self.serial = serial
+        self.state = state
+        self.details = details or {}
+
+    @property
+    def ready(self):
+        return self.state == "device"
+
+    @property
+    def model(self):
+        return self.details.get("model")
+
+    def __repr__(self):
+        return f"Device({self.serial!r}, {self.state!r})"
+
+
+def adb_executable():
+    """The adb command line prefix, honouring the ADB environment variable"""
+    return shlex.split(os.environ.get("ADB", "adb"))
+
+
+def adb_command(serial=None, *args):
+    """Build an adb command line, targeting one device when serial is given"""
+    command = adb_executable()
+    if serial:
+        command += ["-s", serial]
+    return command + list(args)
+
+
+def run_adb(serial=None, *args, timeout=ADB_TIMEOUT):
+    """Run an adb command and return its stdout as text; raises AdbError on failure"""
+    command = adb_command(serial, *args)
+    try:
+        result = subprocess.run(command, stdout=subprocess.PIPE, stderr=subprocess.PIPE, timeout=timeout)
+    except (OSError, subprocess.TimeoutExpired) as e:
+        raise AdbError(f"{' '.join(command)}: {e}") from e
+    if result.returncode != 0:
+        message = result.stderr.decode("utf-8", errors="replace").strip() or f"exit status {result.returncode}"
+        raise AdbError(f"{' '.join(command)}: {message}")
+    return result.stdout.decode("utf-8", errors="replace")
+
+
+def parse_devices(output):
+    """Parse `adb devices -l` output into Device objects"""
+    devices = []
+    for line in output.splitlines():
+        line = line.strip()
+        if not line or line.startswith("List of devices") or line.startswith("*"):
+            continue
+        parts = line.split()
+        if len(parts) < 2:
+            continue
+        details = dict(part.split(":", 1) for part in parts[2:] if ":" in part)
+        devices.append(Device(parts[0], parts[1], details))
+    return devices
+
+
+def list_devices():
+    """Every device adb knows about, including offline and unauthorized ones"""
+    return parse_devices(run_adb(None, "devices", "-l"))
+
+
+def parse_content_rows(output):
+    """Parse `content query` output into one dict per row"""
+    rows = []
+    for line in output.splitlines():
+        match = _ROW_PREFIX.match(line)
+        if not match:
+            # Values such as SMS bodies may contain newlines
+            if rows and line:
+                last_key = next(reversed(rows[-1]))
+                rows[-1][last_key] += "\n" + line
+            continue
+        rows.append({key: value for key, value in _ROW_FIELD.findall(line[match.end():])})
+    return rows
+
+
+class _Disconnected(Exception):
+    """The shell process went away before a command finished"""
+
+
+class _SessionFailed(AdbError):
+    """A new shell session exited before running its command"""
+
+
+def _pump_lines(stream, lines):
+    for raw in iter(stream.readline, b""):
+        lines.put(raw.decode("utf-8", errors="replace"))
+    lines.put(None)
+
+
+class AdbShell:
+    """One long-lived `adb shell` process that runs commands one at a time.
+
+    Each command is written to the shell's stdin followed by a printf of a
+    unique sentinel and the command's exit status, and its output is read up
+    to that sentinel, so a query costs one round trip instead of starting
+    adb and negotiating with the device. Threads sharing a session take
+    turns; shell_session gives concurrent callers separate ones. If the
+    shell has died (device replugged, adb server restarted) it is restarted
+    and the command retried once, so commands should be safe to repeat.
+
+    Needs the device's shell_v2 feature for -T; older devices are handled
+    by shell_command falling back to one-shot commands.
+    """
+
+    def __init__(self, serial=None, timeout=ADB_TIMEOUT):
+        self.serial = serial
+        self.timeout = timeout
+        self._process = None
+        self._lines = None
+        self._lock = threading.Lock()
+
+    def _start(self):
+        # -T: no pty, so commands aren't echoed and output isn't given \r\n line ends
+        command = adb_command(self.serial, "shell", "-T")
+        try:
+            self._process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                             stderr=subprocess.STDOUT)
+        except OSError as e:
+            raise AdbError(f"{' '.join(command)}: {e}") from e
+        self._lines = queue.Queue()
+        threading.Thread(target=_pump_lines, args=(self._process.stdout, self._lines),
+                         name=f"adb-shell-{self.serial or 'default'}", daemon=True).start()
+        # Error messages then come back in the output of the command that printed them
+        self._write("exec 2>&1\n")
+
+    def _stop(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            process.stdin.close()
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            process.kill()
+            process.wait()
+
+    def _write(self, text):
+        try:
+            self._process.stdin.write(text.encode("utf-8"))
+            self._process.stdin.flush()
+        except OSError as e:
+            raise _Disconnected(str(e)) from e
+
+    def _execute(self, command, timeout):
+        token = uuid.uuid4().hex
+        # The sentinel is only joined together by printf, so a shell that
+        # echoes its input can't produce it early
+        self._write(f"{command} </dev/null; printf '%s_%s %d\\n' {_SENTINEL} {token} $?\n")
+        marker = f"{_SENTINEL}_{token} "
+        deadline = time.monotonic() + timeout
+        output = []
+        while True:
+            try:
+                line = self._lines.get(timeout=max(deadline - time.monotonic(), 0))
+            except queue.Empty:
+                self._stop()
+                raise AdbError(f"{command}: timed out after {timeout} seconds") from None
+            if line is None:
+                raise _Disconnected("".join(output).strip())
+            index = line.find(marker)
+            if index < 0:
+                output.append(line)
+                continue
+            output.append(line[:index])
+            try:
+                status = int(line[index + len(marker):])
+            except ValueError:
+                status = -1
+            return status, "".join(output)
+
+    def run(self, command, timeout=None):
+        """Run a shell command line on the device and return its output as text.
+
+        Raises AdbError if the command exits non-zero, times out, or the
+        session can't be (re)started.
+        """
+        timeout = timeout or self.timeout
+        with self._lock:
+            for _ in range(2):
+                fresh = self._process is None or self._process.poll() is not None
+                try:
+                    if fresh:
+                        self._stop()
+                        self._start()
+                    status, output = self._execute(command, timeout)
+                except _Disconnected as e:
+                    self._stop()
+                    if fresh:
+                        raise _SessionFailed(f"adb shell: {str(e) or 'connection closed'}") from None
+                    continue
+                if status != 0:
+                    raise AdbError(f"{command}: {output.strip() or f'exit status {status}'}")
+                return output
+
+    def close(self):
+        with self._lock:
+            self._stop()
+
+
+# Serial -> idle AdbShell sessions
+_sessions = {}
+# Serials that can't keep a shell session open and get one adb process per command
+_one_shot = set()
+_sessions_lock = threading.Lock()
+
+
+@contextlib.contextmanager
+def shell_session(serial=None):
+    """Borrow an idle AdbShell for a device, or a new one if all are busy.
+
+    Each concurrent caller gets a session of its own, so commands on the
+    same device run side by side rather than queueing behind one shell.
+    """
+    with _sessions_lock:
+        idle = _sessions.get(serial)
+        session = idle.pop() if idle else AdbShell(serial)
+    try:
+        yield session
+    finally:
+        with _sessions_lock:
+            idle = _sessions.setdefault(serial, [])
+            if len(idle) < SESSIONS_PER_DEVICE:
+                idle.append(session)
+                session = None
+        if session is not None:
+            session.close()
+
+
+def close_sessions():
+    """Close every idle shell session"""
+    with _sessions_lock:
+        sessions = [session for idle in _sessions.values() for session in idle]
+        _sessions.clear()
+    for session in sessions:
+        session.close()
+
+
+atexit.register(close_sessions)
+
+
+def shell_command(serial, command):
+    """Run a shell command line on a device and return its output as text.
+
+    Uses one of the device's pooled AdbShell sessions. If that can't start, for instance on
+    devices before Android 7 that reject `adb shell -T`, but a one-shot
+    `adb shell` works, the device is remembered and always run one-shot.
+    """
+    with _sessions_lock:
+        one_shot = serial in _one_shot
+    if not one_shot:
+        try:
+            with shell_session(serial) as session:
+                return session.run(command)
+        except _SessionFailed:
+            output = run_adb(serial, "shell", command)
+            with _sessions_lock:
+                _one_shot.add(serial)
+            return output
+    return run_adb(serial, "shell", command)
+
+
+def content_query(serial, uri, projection=None, sort=None):
+    """Run `content query` on a device and return the rows as dicts"""
+    args = ["content", "query", "--uri", uri]
+    if projection:
+        args += ["--projection", ":".join(projection)]
+    if sort:
+        args += ["--sort", sort]
+    return parse_content_rows(shell_command(serial, shlex.join(args)))
@@ -0,0 +1,75 @@
+"""Cancellable background jobs with progress that the UI polls"""
+import threading
+
+
+class JobCancelled(BaseException):
+    """Raised inside a job's work function once cancel() has been requested.
+
+    Like asyncio.CancelledError this derives from BaseException, so the
+    broad "except Exception" handlers in report code don't swallow it.
+    """
+
+
+class BackgroundJob:
+    """Run work(job) on a daemon thread.
+
+    The work function reports progress with job.update(fraction, message),
+    which also raises JobCancelled if the job has been cancelled. Nothing is
+    sent to the UI from the worker; the UI reads snapshot() on its own timer
+    and picks up result or error once done is set.
+    """
+
+    def __init__(self, work, name="BackgroundJob"):
+        self.work = work
+        self.name = name
+        self.result = None
+        self.error = None
+        self.done = threading.Event()
+        self._cancel = threading.Event()
+        self._lock = threading.Lock()
+        self._fraction = 0.0
+        self._message = ""
+        self._thread = None
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.result = self.work(self)
+        except BaseException as e:
+            self.error = e
+        finally:
+            self.done.set()
+
+    def update(self, fraction=None, message=None):
+        """Record progress (0..1) and/or a status message, then check for cancellation"""
+        with self._lock:
+            if fraction is not None:
+                self._fraction = min(max(fraction, 0.0), 1.0)
+            if message is not None:
+                self._message = message
+        self.check_cancelled()
+
+    def check_cancelled(self):
+        if self._cancel.is_set():
+            raise JobCancelled()
+
+    def cancel(self):
+        """Ask the job to stop at its next update() or check_cancelled()"""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set()
+
+    def snapshot(self):
+        """Return (fraction, message) for display"""
+        with self._lock:
+            return self._fraction, self._message
+
+    def wait(self, timeout=None):
+        """Block until the job finishes; returns True if it did"""
+        return self.done.wait(timeout)
@@ -0,0 +1,77 @@
+"""Bounded queue with overflow policies for the live monitoring feed"""
+import queue
+import threading
+import time
+from collections import deque
+
+# What put() does when the queue is full
+OVERFLOW_POLICIES = {
+    "block": "Block the log reader until there is room",
+    "drop_oldest": "Discard the oldest queued entry",
+    "drop_newest": "Discard the incoming entry",
+}
+
+
+class BoundedLogQueue:
+    """Thread-safe FIFO with a size limit, an overflow policy and drop/lag accounting.
+
+    get_nowait() raises queue.Empty like queue.Queue, so it can replace one
+    directly. Entries put with droppable=False (status and error messages)
+    are never dropped, by either policy, and may exceed the limit.
+    """
+
+    def __init__(self, maxsize=10000, policy="block"):
+        if policy not in OVERFLOW_POLICIES:
+            raise ValueError(f"Unknown overflow policy: {policy}")
+        self.maxsize = maxsize
+        self.policy = policy
+        self.dropped = 0
+        self.high_water = 0
+        self._items = deque()
+        self._lock = threading.Lock()
+        self._not_full = threading.Condition(self._lock)
+
+    def put(self, item, droppable=True):
+        """Queue an item, applying the overflow policy if the queue is full"""
+        with self._not_full:
+            if droppable and len(self._items) >= self.maxsize:
+                if self.policy == "block":
+                    while len(self._items) >= self.maxsize and self.policy == "block":
+                        self._not_full.wait(0.1)
+                if len(self._items) >= self.maxsize:
+                    if self.policy == "drop_oldest":
+                        # Protected entries stay; with none droppable the limit is exceeded
+                        for index, (_, _, queued_droppable) in enumerate(self._items):
+                            if queued_droppable:
+                                del self._items[index]
+                                self.dropped += 1
+                                break
+                    elif self.policy == "drop_newest":
+                        self.dropped += 1
+                        return False
+            self._items.append((time.monotonic(), item, droppable))
+            if len(self._items) > self.high_water:
+                self.high_water = len(self._items)
+            return True
+
+    def get_nowait(self):
+        """Remove and return the oldest item, or raise queue.Empty"""
+        with self._not_full:
+            if not self._items:
+                raise queue.Empty
+            _, item, _ = self._items.popleft()
+            self._not_full.notify()
+            return item
+
+    def empty(self):
+        return not self._items
+
+    def qsize(self):
+        return len(self._items)
+
+    def lag(self):
+        """Seconds the oldest queued item has been waiting"""
+        with self._lock:
+            if not self._items:
+                return 0.0
+            return time.monotonic() - self._items[0][0]
@@ -0,0 +1,104 @@
+"""Logcat categorization shared by the GUI and the command line"""
+import os
+from array import array
+
+from scripts.categorize_checkpoint import resume_point, save_checkpoint, clear_checkpoint
+from scripts.category_sinks import CategorySinks
+from scripts.log_classifier import LogClassifier
+from scripts.log_types import LOG_TYPES, LOGCAT_FILE, CATEGORY_DIR
+from scripts.logcat_stream import file_lines, with_offsets, run_pipeline
+from scripts.parallel_categorize import categorize_parallel
+from scripts.stage_metrics import metrics
+from scripts.timestamp_index import store_index
+
+# Logcat files at least this large are categorized across a process pool
+PARALLEL_CATEGORIZE_MIN_BYTES = 64 * 1024 * 1024
+PARALLEL_CATEGORIZE_WORKERS = os.cpu_count() or 1
+
+
+def should_parallelize(path=LOGCAT_FILE, workers=PARALLEL_CATEGORIZE_WORKERS):
+    """True if a logcat file is big enough to be worth a process pool.
+
+    The pool's workers are spawned, so the GUI (whose module code builds the
+    Tk window) hands these files to `cli.py categorize --parallel` instead.
+    """
+    return workers > 1 and os.path.exists(path) and os.path.getsize(path) >= PARALLEL_CATEGORIZE_MIN_BYTES
+
+
+def _categorize_tail(path, log_types, on_match, directory, resume):
+    """Classify and append only the lines after a checkpoint, returning stats for the whole file"""
+    checkpoint, offsets, timestamps = resume
+    with CategorySinks(log_types, directory=directory, mode="a") as sinks:
+        tail = run_pipeline(with_offsets(file_lines(path, checkpoint.offset), checkpoint.offset),
+                            LogClassifier(log_types), sinks, on_match=on_match)
+
+    # Extend copies; the prefix arrays may belong to a cached index
+    stats = tail
+    stats.resumed_lines = checkpoint.lines
+    stats.lines += checkpoint.lines
+    stats.category_counts.update(checkpoint.category_counts)
+    stats.level_counts.update(checkpoint.level_counts)
+    stats.offsets = array("q", offsets) + tail.offsets
+    stats.timestamps = array("d", timestamps) + tail.timestamps
+    return stats
+
+
+def categorize_logcat(offset_lines=None, path=LOGCAT_FILE, log_types=LOG_TYPES, on_match=None,
+                      parallel=False, workers=PARALLEL_CATEGORIZE_WORKERS, directory=CATEGORY_DIR,
+                      incremental=False):
+    """Write one file per category for a logcat and store its line index.
+
+    offset_lines is a stream of (offset, raw line) pairs, such as adb output
+    tee'd to path; by default path itself is read. With parallel=True path is
+    classified by a process pool instead. on_match(log_type, text) sees every
+    categorized line (or chunk of lines when parallel). Returns PipelineStats.
+
+    With incremental=True a checkpoint is kept in directory. If path still
+    starts with exactly the bytes categorized last time, only the lines after
+    them are classified and appended (and passed to on_match), and
+    stats.resumed_lines says how many were carried over; otherwise the
+    category files are rebuilt. Non-incremental runs drop the checkpoint.
+    """
+    category_paths = {log_type: CategorySinks(log_types, directory=directory).path_for(log_type)
+                   for log_type in log_types}
+    resume = None
+    if incremental and offset_lines is None:
+        resume = resume_point(path, log_types, category_paths, directory)
+    if not incremental:
+        clear_checkpoint(directory)
+
+    if resume is not None:
+        detail = f"{path} (from byte {resume[0].offset})"
+    else:
+        detail = f"{path} (parallel)" if parallel else path
+    with metrics.stage("categorize", detail) as run:
+        if resume is not None:
+            stats = _categorize_tail(path, log_types, on_match, directory, resume)
+            read = os.path.getsize(path) - resume[0].offset
+            run.add(lines=stats.lines - stats.resumed_lines, bytes_read=read)
+            run.add_hits(stats.category_counts - resume[0].category_counts)
+        else:
+            # Clear previous categorized logs, keeping one writer open per type
+            with CategorySinks(log_types, directory=directory, mode="w") as sinks:
+                for log_type in log_types:
+                    sinks.write(log_type, f"=== {log_type} Logs ===\n\n")
+
+                if parallel:
+                    def write_chunk(log_type, text):
+                        sinks.write(log_type, text)
+                        if on_match:
+                            on_match(log_type, text)
+
+                    stats = categorize_parallel(path, log_types, write_chunk, workers=workers)
+                else:
+                    if offset_lines is None:
+                        offset_lines = with_offsets(file_lines(path))
+                    stats = run_pipeline(offset_lines, LogClassifier(log_types), sinks, on_match=on_match)
+            run.add(lines=stats.lines, bytes_read=os.path.getsize(path) if os.path.exists(path) else 0)
+            run.add_hits(stats.category_counts)
+
+        # The pipeline already collected every line's offset and timestamp
+        store_index(path, stats.offsets, stats.timestamps)
+        if incremental:
+            save_checkpoint(directory, path, log_types, category_paths, stats)
+    return stats
@@ -0,0 +1,149 @@
+"""Checkpoints that let categorization resume at the end of the last run"""
+import hashlib
+import json
+import os
+from collections import Counter
+
+from scripts.line_scanner import LineScanner
+from scripts.timestamp_index import load_index_prefix
+
+CHECKPOINT_NAME = ".categorize_checkpoint.json"
+_VERSION = 1
+
+# Bytes hashed per step, so hashing never copies the whole file
+_HASH_BLOCK = 8 * 1024 * 1024
+
+
+def checkpoint_path(directory):
+    return os.path.join(directory, CHECKPOINT_NAME)
+
+
+def prefix_digest(path, size):
+    """SHA-256 of the first size bytes of a file"""
+    digest = hashlib.sha256()
+    with LineScanner(path) as scanner:
+        for block in range(0, min(size, scanner.size), _HASH_BLOCK):
+            digest.update(scanner.buffer[block:min(block + _HASH_BLOCK, size)])
+    return digest.hexdigest()
+
+
+def patterns_digest(log_types):
+    """Fingerprint of the category patterns, so edited patterns force a rebuild"""
+    patterns = {log_type: info["pattern"] for log_type, info in log_types.items()}
+    return hashlib.sha256(json.dumps(patterns, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class Checkpoint:
+    """Where the last incremental run stopped and what it had produced.
+
+    offset is the end of the last complete line classified; lines, the
+    category counts and level counts cover everything before it. The
+    category files are recorded by size so appends from anywhere else
+    (such as live monitoring) are noticed.
+    """
+
+    def __init__(self, log_path, offset, mtime_ns, digest, patterns, lines,
+                 category_sizes, category_counts, level_counts):
+        self.log_path = log_path
+        self.offset = offset
+        self.mtime_ns = mtime_ns
+        self.digest = digest
+        self.patterns = patterns
+        self.lines = lines
+        self.category_sizes = category_sizes
+        self.category_counts = Counter(category_counts)
+        self.level_counts = Counter(level_counts)
+
+    def to_dict(self):
+        return {
+            "version": _VERSION,
+            "log_path": self.log_path,
+            "offset": self.offset,
+            "mtime_ns": self.mtime_ns,
+            "prefix_sha256": self.digest,
+            "patterns_sha256": self.patterns,
+            "lines": self.lines,
+            "category_sizes": self.category_sizes,
+            "category_counts": dict(self.category_counts),
+            "level_counts": dict(self.level_counts),
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("version") != _VERSION:
+            raise ValueError("Unsupported checkpoint version")
+        return cls(data["log_path"], data["offset"], data["mtime_ns"], data["prefix_sha256"],
+                   data["patterns_sha256"], data["lines"], data["category_sizes"],
+                   data["category_counts"], data["level_counts"])
+
+
+def load_checkpoint(directory):
+    """Return the checkpoint stored in a category directory, or None"""
+    try:
+        with open(checkpoint_path(directory), encoding="utf-8") as f:
+            return Checkpoint.from_dict(json.load(f))
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+
+
+def save_checkpoint(directory, log_path, log_types, category_paths, stats):
+    """Checkpoint a finished run whose PipelineStats cover the whole log file.
+
+    Nothing is saved if the file ends in a partial line, since that line
+    may still be growing; the next run then rebuilds from scratch.
+    """
+    st = os.stat(log_path)
+    if st.st_size:
+        with open(log_path, "rb") as f:
+            f.seek(st.st_size - 1)
+            if f.read(1) != b"\n":
+                clear_checkpoint(directory)
+                return None
+    checkpoint = Checkpoint(
+        log_path, st.st_size, st.st_mtime_ns, prefix_digest(log_path, st.st_size), patterns_digest(log_types),
+        stats.lines, {log_type: os.path.getsize(path) for log_type, path in category_paths.items()},
+        stats.category_counts, stats.level_counts)
+    tmp_path = checkpoint_path(directory) + ".tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump(checkpoint.to_dict(), f)
+    os.replace(tmp_path, checkpoint_path(directory))
+    return checkpoint
+
+
+def clear_checkpoint(directory):
+    try:
+        os.remove(checkpoint_path(directory))
+    except FileNotFoundError:
+        pass
+
+
+def resume_point(log_path, log_types, category_paths, directory):
+    """Return (checkpoint, offsets, timestamps) if categorization can carry on
+    from the checkpoint, or None if a full rebuild is needed.
+
+    Resuming requires the same log file and category patterns, untouched
+    category files, a log file whose first checkpoint.offset bytes are
+    unchanged, and a line index for those bytes.
+    """
+    checkpoint = load_checkpoint(directory)
+    if checkpoint is None or checkpoint.log_path != log_path:
+        return None
+    if checkpoint.patterns != patterns_digest(log_types):
+        return None
+    if set(checkpoint.category_sizes) != set(category_paths):
+        return None
+    for log_type, path in category_paths.items():
+        if not os.path.exists(path) or os.path.getsize(path) != checkpoint.category_sizes[log_type]:
+            return None
+    try:
+        if os.path.getsize(log_path) < checkpoint.offset:
+            return None
+    except FileNotFoundError:
+        return None
+
+    prefix = load_index_prefix(log_path, checkpoint.offset, checkpoint.mtime_ns)
+    if prefix is None or len(prefix[0]) != checkpoint.lines:
+        return None
+    if prefix_digest(log_path, checkpoint.offset) != checkpoint.digest:
+        return None
+    return checkpoint, prefix[0], prefix[1]
@@ -0,0 +1,88 @@
+"""Persistent, buffered writers for the per-category logcat files"""
+import os
+import threading
+import time
+
+
+class CategorySinks:
+    """Keep one open, buffered file per LOG_TYPES entry.
+
+    Writes go into each file's buffer and are flushed together once
+    max_buffer_bytes have been written or flush_interval seconds have passed,
+    so an unclean exit loses at most one batch. Call close() (or use the sinks
+    as a context manager) to flush everything on shutdown.
+    """
+
+    def __init__(self, log_types, directory="logs/logcat_types", mode="a",
+                 max_buffer_bytes=64 * 1024, flush_interval=1.0):
+        self.log_types = list(log_types)
+        self.directory = directory
+        self.mode = mode
+        self.max_buffer_bytes = max_buffer_bytes
+        self.flush_interval = flush_interval
+        self._files = {}
+        self._pending = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def path_for(self, log_type):
+        """Return the file path used for a log type"""
+        return os.path.join(self.directory, f"{log_type.lower()}_logs.txt")
+
+    def open(self):
+        """Open every category file, truncating them when mode is 'w'"""
+        with self._lock:
+            if self._files:
+                return self
+            os.makedirs(self.directory, exist_ok=True)
+            for log_type in self.log_types:
+                self._files[log_type] = open(self.path_for(log_type), self.mode,
+                                             encoding="utf-8", buffering=self.max_buffer_bytes)
+            self._last_flush = time.monotonic()
+        return self
+
+    def write(self, log_type, text):
+        """Buffer text for a log type, flushing if a threshold is reached"""
+        with self._lock:
+            if not self._files:
+                raise ValueError("Category sinks are not open")
+            self._files[log_type].write(text)
+            self._pending += len(text)
+            if self._pending >= self.max_buffer_bytes or \
+               time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+
+    def flush_if_due(self):
+        """Flush pending data if the time threshold has passed"""
+        with self._lock:
+            if self._pending and time.monotonic() - self._last_flush >= self.flush_interval:
+                self._flush_locked()
+
+    def flush(self):
+        """Flush every category file to disk"""
+        with self._lock:
+            self._flush_locked()
+
+    def close(self):
+        """Flush and close every category file"""
+        with self._lock:
+            self._flush_locked()
+            for f in self._files.values():
+                f.close()
+            self._files = {}
+
+    @property
+    def is_open(self):
+        return bool(self._files)
+
+    def _flush_locked(self):
+        for f in self._files.values():
+            f.flush()
+        self._pending = 0
+        self._last_flush = time.monotonic()
+
+    def __enter__(self):
+        return self.open()
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
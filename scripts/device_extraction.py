@@ -0,0 +1,273 @@
+"""Log extraction from every attached device at once, one directory per serial.
+
+Each device gets DEVICES_DIR/<serial>/ holding the usual logs/ layout, so
+any per-device directory can be opened with `cli.py -C <dir> ...` like a
+single-device workspace.
+"""
+import os
+import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+from scripts.adb import adb_command, content_query
+from scripts.background_job import JobCancelled
+from scripts.categorize import categorize_logcat
+from scripts.log_types import LOGCAT_FILE, CALL_LOG_FILE, SMS_LOG_FILE, CATEGORY_DIR, DEVICES_DIR
+from scripts.logcat_stream import adb_lines, tee_to_file
+from scripts.stage_metrics import metrics
+
+# Devices extracted at the same time; USB bandwidth runs out well before CPUs do
+DEVICE_WORKERS = 4
+
+CALL_LOG_URI = "content://call_log/calls"
+CALL_LOG_PROJECTION = ["number", "date", "duration", "type"]
+SMS_URI = "content://sms"
+SMS_PROJECTION = ["address", "date", "type", "body"]
+
+# Device progress states
+QUEUED, RUNNING, DONE, FAILED, CANCELLED = "queued", "running", "done", "failed", "cancelled"
+
+
+def device_dir(serial, root=DEVICES_DIR):
+    """Directory for one device; serials like 192.168.1.5:5555 are made path-safe"""
+    return os.path.join(root, re.sub(r'[^\w.-]', "_", serial))
+
+
+def _row_time(row):
+    date = row.get("date", "")
+    if not date.isdigit():
+        return "unknown"
+    return datetime.fromtimestamp(int(date) / 1000).strftime("%Y-%m-%d %H:%M:%S")
+
+
+def format_call_row(row):
+    """Call log line in the format the graphs and report read"""
+    return (f"{_row_time(row)} | number: {row.get('number', '')} | type: {row.get('type', '')} | "
+            f"duration: {row.get('duration', '')}\n")
+
+
+def format_sms_row(row):
+    """SMS line in the format the graphs and report read; received messages use from:"""
+    party = "from" if row.get("type") == "1" else "to"
+    body = row.get("body", "").replace("\n", " ")
+    return f"{_row_time(row)} | {party}: {row.get('address', '')} | type: {row.get('type', '')} | body: {body}\n"
+
+
+def _write_rows(path, rows, format_row):
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        f.writelines(format_row(row) for row in rows)
+    return len(rows)
+
+
+def pull_logcat(serial, path):
+    """Write a device's logcat dump to path; returns the line count"""
+    lines = 0
+    for _ in tee_to_file(adb_lines(adb_command(serial, "logcat", "-d", "-v", "threadtime")), path):
+        lines += 1
+    return lines
+
+
+def pull_call_log(serial, path):
+    """Write a device's call log to path, oldest first; returns the row count"""
+    rows = content_query(serial, CALL_LOG_URI, CALL_LOG_PROJECTION, sort="date ASC")
+    return _write_rows(path, rows, format_call_row)
+
+
+def pull_sms(serial, path):
+    """Write a device's SMS messages to path, oldest first; returns the row count"""
+    rows = content_query(serial, SMS_URI, SMS_PROJECTION, sort="date ASC")
+    return _write_rows(path, rows, format_sms_row)
+
+
+# Source name -> (fetch function, file under the workspace)
+SOURCES = {
+    "logcat": (pull_logcat, LOGCAT_FILE),
+    "calls": (pull_call_log, CALL_LOG_FILE),
+    "sms": (pull_sms, SMS_LOG_FILE),
+}
+
+
+def fetch_sources(serial=None, base=".", progress=None):
+    """Fetch logcat, call log and SMS at the same time.
+
+    The fetches are all I/O-bound round trips, so together they take about as
+    long as the slowest one. Logcat streams from its own adb process and the
+    two content queries borrow separate pooled shell sessions. Files go under
+    base (serial=None lets adb pick the only attached device).
+    progress(source, error) is called as each source finishes. Returns
+    (lines written per source, exception per failed source); one source
+    failing doesn't stop the others.
+    """
+    counts = {}
+    errors = {}
+    with ThreadPoolExecutor(max_workers=len(SOURCES), thread_name_prefix="fetch") as executor:
+        futures = {executor.submit(fetch, serial, os.path.join(base, path)): name
+                   for name, (fetch, path) in SOURCES.items()}
+        for future in as_completed(futures):
+            name = futures[future]
+            try:
+                counts[name] = future.result()
+            except Exception as e:
+                errors[name] = e
+            if progress:
+                progress(name, errors.get(name))
+    return counts, errors
+
+
+class ExtractionResult:
+    """Outcome of extracting one device.
+
+    stats is the logcat's PipelineStats, or None if the logcat couldn't be
+    fetched; errors maps each failed source to its exception.
+    """
+
+    def __init__(self, counts, errors, stats=None):
+        self.counts = counts
+        self.errors = errors
+        self.stats = stats
+
+    def describe(self):
+        """One-line summary, naming any failed sources"""
+        parts = [f"{self.stats.lines} logcat lines"] if self.stats is not None else []
+        parts += [f"{name} failed: {error}" for name, error in self.errors.items()]
+        return "; ".join(parts)
+
+
+def extract_device(serial, root=DEVICES_DIR, progress=None, incremental=False):
+    """Fetch logcat, call log and SMS from one device, then categorize its logcat.
+
+    The three sources are fetched concurrently and joined before
+    categorization starts. progress(fraction, message) is called as steps
+    finish; anything it raises (such as JobCancelled) stops the extraction.
+    Source failures are returned in the ExtractionResult rather than raised.
+    """
+    progress = progress or (lambda fraction, message: None)
+    base = device_dir(serial, root)
+    finished = []
+
+    def source_done(name, error):
+        finished.append(name)
+        progress(0.6 * len(finished) / len(SOURCES), f"{name} failed" if error else f"Fetched {name}")
+
+    with metrics.stage("extract", serial) as run:
+        progress(0.0, "Fetching logcat, call log and SMS")
+        counts, errors = fetch_sources(serial, base, source_done)
+        run.add(lines=sum(counts.values()))
+        result = ExtractionResult(counts, errors)
+        if "logcat" not in errors:
+            progress(0.6, "Categorizing logcat")
+            result.stats = categorize_logcat(path=os.path.join(base, LOGCAT_FILE),
+                                             directory=os.path.join(base, CATEGORY_DIR), incremental=incremental)
+        progress(1.0, result.describe())
+    return result
+
+
+class DeviceProgress:
+    """Where one device's extraction is up to"""
+
+    def __init__(self, serial):
+        self.serial = serial
+        self.state = QUEUED
+        self.fraction = 0.0
+        self.message = ""
+        self.error = None
+        self.result = None
+
+    @property
+    def stats(self):
+        return self.result.stats if self.result else None
+
+    def copy(self):
+        progress = DeviceProgress(self.serial)
+        progress.__dict__.update(self.__dict__)
+        return progress
+
+
+class MultiDeviceExtraction:
+    """Extract several devices with a bounded pool of worker threads.
+
+    Each worker runs extract_device for one serial at a time; a device whose
+    logcat can't be fetched is FAILED, and doesn't stop the others.
+    snapshot() can be read from any thread while run() is going.
+    """
+
+    def __init__(self, serials, root=DEVICES_DIR, workers=DEVICE_WORKERS, incremental=False):
+        self.serials = list(serials)
+        self.root = root
+        self.workers = max(1, workers)
+        self.incremental = incremental
+        self._progress = {serial: DeviceProgress(serial) for serial in self.serials}
+        self._lock = threading.Lock()
+        self._cancel = threading.Event()
+        self._job = None
+
+    def snapshot(self):
+        """Copies of every device's progress, in serial order"""
+        with self._lock:
+            return [self._progress[serial].copy() for serial in self.serials]
+
+    @property
+    def fraction(self):
+        with self._lock:
+            if not self.serials:
+                return 1.0
+            return sum(p.fraction for p in self._progress.values()) / len(self.serials)
+
+    def cancel(self):
+        """Stop starting devices and interrupt running ones at their next step"""
+        self._cancel.set()
+
+    @property
+    def cancelled(self):
+        return self._cancel.is_set() or (self._job is not None and self._job.cancelled)
+
+    def run(self, job=None):
+        """Extract every device, returning the final snapshot.
+
+        With a BackgroundJob, overall progress is reported to it and its
+        cancel() cancels the extraction too.
+        """
+        self._job = job
+        with ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="device") as executor:
+            for serial in self.serials:
+                executor.submit(self._extract, serial)
+        if job is not None:
+            job.check_cancelled()
+        return self.snapshot()
+
+    def _update(self, serial, fraction=None, message=None, state=None):
+        with self._lock:
+            progress = self._progress[serial]
+            if fraction is not None:
+                progress.fraction = fraction
+            if message is not None:
+                progress.message = message
+            if state is not None:
+                progress.state = state
+            done = sum(p.state in (DONE, FAILED, CANCELLED) for p in self._progress.values())
+        if self._job is not None:
+            self._job.update(self.fraction, f"{done}/{len(self.serials)} devices finished")
+        if self.cancelled:
+            raise JobCancelled()
+
+    def _extract(self, serial):
+        try:
+            self._update(serial, state=RUNNING, message="Starting")
+            result = extract_device(serial, self.root, incremental=self.incremental,
+                                    progress=lambda fraction, message: self._update(serial, fraction, message))
+        except JobCancelled:
+            with self._lock:
+                self._progress[serial].state = CANCELLED
+                self._progress[serial].message = "Cancelled"
+        except Exception as e:
+            with self._lock:
+                self._progress[serial].state = FAILED
+                self._progress[serial].error = e
+                self._progress[serial].message = f"Failed: {e}"
+        else:
+            with self._lock:
+                self._progress[serial].result = result
+                # Calls or SMS failing still leaves a usable logcat
+                self._progress[serial].state = DONE if result.stats is not None else FAILED
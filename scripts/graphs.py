@@ -0,0 +1,315 @@
+"""Graphs tab charts, drawn onto any matplotlib figure so the GUI and CLI share them"""
+from collections import Counter
+from datetime import datetime
+
+from scripts.log_types import (LOG_TYPES, TIME_RANGES, LOGCAT_FILE, CALL_LOG_FILE, SMS_LOG_FILE,
+                               category_path)
+from scripts.report_stats import CALL_NUMBER_RE, ANY_NUMBER_RE, SMS_SENDER_RE
+from scripts.stage_metrics import metrics
+from scripts.time_buckets import hourly_counts
+from scripts.timestamp_index import load_index
+
+
+def _time_filter(index, time_range, now):
+    """(epochs, rows) of the dated lines inside a time range"""
+    if time_range in TIME_RANGES:
+        # Binary-search to the first line in range instead of checking every line
+        rows, epochs = index.dated_rows_since((now - TIME_RANGES[time_range]).timestamp())
+    elif time_range == "All Time":
+        rows, epochs = index.dated_rows()
+    else:
+        rows, epochs = [], []
+            
+    return epochs, list(rows)
+
+
+def _range_expiry(time_range, oldest):
+    """A relative range result holds until its oldest entry drops out of the range"""
+    if time_range in TIME_RANGES and oldest is not None:
+        return oldest + TIME_RANGES[time_range].total_seconds()
+    return None
+
+
+def count_activity(index, epochs, rows):
+    return hourly_counts(epochs)
+
+
+def count_senders(index, epochs, rows):
+    # Extract sender phone numbers
+    senders = []
+    for line in index.read_lines(rows):
+        match = SMS_SENDER_RE.search(line)
+        if match:
+            senders.append(match.group(1))
+    return Counter(senders).most_common(10)
+
+
+def graph_source(log_type):
+    """(file, aggregate function) behind a graph type, or None for unknown types"""
+    if log_type == "Call Logs":
+        return CALL_LOG_FILE, count_activity
+    if log_type == "SMS Logs":
+        return SMS_LOG_FILE, count_activity
+    if log_type == "Top SMS Senders":
+        return SMS_LOG_FILE, count_senders
+    if log_type == "Logcat Activity":
+        return LOGCAT_FILE, count_activity
+    if log_type in LOG_TYPES:
+        return category_path(log_type), count_activity
+    return None
+
+
+def graph_data(log_type, time_range, cache=None, now=None):
+    """Aggregate behind a graph: None when the file is missing or has no dated
+    lines, else (entries in range, aggregate).
+
+    Aggregates are cached per file version and time range; the timestamps
+    themselves come from the shared sidecar index, so switching ranges only
+    re-filters already parsed data.
+    """
+    filepath, aggregate = graph_source(log_type)
+    now = now or datetime.now()
+
+    def compute():
+        # Only cache misses show up as graph runs
+        with metrics.stage("graph", f"{log_type} ({time_range})") as run:
+            index = load_index(filepath)
+            # Timestamps come from the index; only the senders chart reads log text
+            run.add(lines=len(index))
+            if not index.dated_rows()[0]:
+                return None, None
+            epochs, rows = _time_filter(index, time_range, now)
+            if not epochs:
+                return (0, None), None
+            return (len(epochs), aggregate(index, epochs, rows)), _range_expiry(time_range, min(epochs))
+
+    try:
+        return cache.get_or_compute(filepath, log_type, time_range, compute) if cache else compute()[0]
+    except FileNotFoundError:
+        return None
+
+
+def frequent_callers_data(time_range, cache=None, now=None):
+    """(call lines in range, top 10 (number, count)); raises FileNotFoundError"""
+    now = now or datetime.now()
+
+    def count_callers():
+        with metrics.stage("graph", f"Frequent Callers ({time_range})") as run:
+            index = load_index(CALL_LOG_FILE)
+            filtered_lines = read = 0
+            oldest = None
+            numbers = []
+            if time_range == "All Time":
+                lines = index.iter_lines()
+            elif time_range in TIME_RANGES:
+                # Only read the tail of the file that falls inside the range
+                cutoff = (now - TIME_RANGES[time_range]).timestamp()
+                lines = index.iter_since(cutoff, include_undated=False)
+            else:
+                lines = []
+        
+            for line, ts in lines:
+                filtered_lines += 1
+                read += len(line)
+                if ts is not None and (oldest is None or ts < oldest):
+                    oldest = ts
+                # Look for phone numbers in the line
+                matches = CALL_NUMBER_RE.findall(line)
+                if matches:
+                    numbers.extend(matches)
+                else:
+                    # Try the general phone number pattern
+                    matches = ANY_NUMBER_RE.findall(line)
+                    numbers.extend(matches)
+        
+            run.add(lines=filtered_lines, bytes_read=read)
+            
+            # Count frequencies and get top callers
+            return (filtered_lines, Counter(numbers).most_common(10)), _range_expiry(time_range, oldest)
+
+    if cache:
+        return cache.get_or_compute(CALL_LOG_FILE, "Frequent Callers", time_range, count_callers)
+    return count_callers()[0]
+
+
+def draw_graph(fig, ax, log_type, time_range, cache=None):
+    """Draw the Graphs tab chart for a graph type and time range onto ax.
+
+    ax should already be cleared. Returns False if only a "no data" message
+    was drawn. cache is an optional ResultCache for the aggregates.
+    """
+    import matplotlib.dates as mdates
+
+    # Generate graphs based on log type
+    if log_type in ["Call Logs", "SMS Logs"]:
+        result = graph_data(log_type, time_range, cache)
+        
+        if result is None:
+            ax.text(0.5, 0.5, f"{log_type} file not found or empty", fontsize=14, ha='center')
+            return False
+
+        in_range, activity = result
+        if not in_range:
+            ax.text(0.5, 0.5, "No data in selected time range", fontsize=12, ha='center')
+            return False
+
+        # Aggregate data by hour
+        sorted_times, counts = activity
+
+        # Plot the time series graph
+        ax.plot(sorted_times, counts, marker="o", color="lime", linewidth=2)
+        ax.set_title(f"{log_type} Activity Over Time", color="lime", fontsize=12)
+        ax.set_ylabel("Count", color="lime")
+        ax.set_xlabel("Time", color="lime")
+        ax.tick_params(axis='x', colors='lime')
+        ax.tick_params(axis='y', colors='lime')
+        ax.grid(True, alpha=0.3)
+        
+        # Format x-axis dates properly
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+        fig.autofmt_xdate()
+
+    elif log_type == "Top SMS Senders":
+        result = graph_data(log_type, time_range, cache)
+        
+        if result is None:
+            ax.text(0.5, 0.5, "SMS log file not found or empty", fontsize=14, ha='center')
+            return False
+
+        in_range, top_senders = result
+        if not in_range:
+            ax.text(0.5, 0.5, "No data in selected time range", fontsize=12, ha='center')
+            return False
+
+        if not top_senders:
+            ax.text(0.5, 0.5, "No sender data found in logs", fontsize=12, ha='center')
+            return False
+
+        # Count most frequent senders
+        labels = [s[0] for s in top_senders]
+        counts = [s[1] for s in top_senders]
+
+        # Create horizontal bar chart
+        bars = ax.barh(labels[::-1], counts[::-1], color="lime")
+        ax.set_title("Top 10 SMS Senders", color="lime", fontsize=12)
+        ax.set_xlabel("Number of Messages", color="lime")
+        ax.tick_params(axis='x', colors='lime')
+        ax.tick_params(axis='y', colors='lime')
+        ax.grid(True, axis='x', alpha=0.3)
+        
+        # Add count values at the end of each bar
+        for i, bar in enumerate(bars):
+            width = bar.get_width()
+            ax.text(width + 0.3, bar.get_y() + bar.get_height()/2, 
+                    str(int(width)), ha='left', va='center', color='lime')
+
+    elif log_type == "Logcat Activity":
+        result = graph_data(log_type, time_range, cache)
+        
+        if result is None:
+            ax.text(0.5, 0.5, "Logcat file not found or empty", fontsize=14, ha='center')
+            return False
+
+        in_range, activity = result
+        if not in_range:
+            ax.text(0.5, 0.5, "No logcat activity in selected time range", fontsize=12, ha='center')
+            return False
+
+        # Aggregate data by hour
+        sorted_times, counts = activity
+
+        # Plot time series graph
+        ax.plot(sorted_times, counts, marker="o", linestyle="-", color="lime", linewidth=2)
+        ax.set_title("Logcat Activity Over Time", color="lime", fontsize=12)
+        ax.set_ylabel("Number of Entries", color="lime")
+        ax.set_xlabel("Time", color="lime")
+        ax.tick_params(axis='x', colors='lime')
+        ax.tick_params(axis='y', colors='lime')
+        ax.grid(True, alpha=0.3)
+        
+        # Format x-axis dates properly
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+        fig.autofmt_xdate()
+    
+    # Handle specialized logcat type graphs
+    elif log_type in LOG_TYPES:
+        # Get the color for this log type
+        log_color = LOG_TYPES[log_type]["color"] if log_type in LOG_TYPES else "lime"
+        
+        # Get hourly activity in the selected range
+        result = graph_data(log_type, time_range, cache)
+        
+        if result is None:
+            ax.text(0.5, 0.5, f"No {log_type} logs found", fontsize=14, ha='center')
+            return False
+            
+        in_range, activity = result
+        if not in_range:
+            ax.text(0.5, 0.5, f"No {log_type} logs in selected time range", fontsize=12, ha='center')
+            return False
+            
+        # For specialized log types, show two graphs:
+        # 1. Activity over time
+        # 2. Distribution of subtypes (if applicable)
+        
+        # Activity over time (primary graph)
+        sorted_times, counts = activity
+        
+        # Plot the time series
+        ax.plot(sorted_times, counts, marker="o", color=log_color, linewidth=2)
+        ax.set_title(f"{log_type} Activity Over Time", color="lime", fontsize=12)
+        ax.set_ylabel("Count", color="lime")
+        ax.set_xlabel("Time", color="lime")
+        ax.tick_params(axis='x', colors='lime')
+        ax.tick_params(axis='y', colors='lime')
+        ax.grid(True, alpha=0.3)
+        
+        # Format x-axis dates properly
+        ax.xaxis.set_major_formatter(mdates.DateFormatter('%m-%d %H:%M'))
+        fig.autofmt_xdate()
+
+    # Apply dark theme to the graph figure
+    fig.patch.set_facecolor('#121212')
+    ax.set_facecolor('#1e1e1e')
+    
+    return True
+
+
+def draw_frequent_callers(fig, ax, time_range, cache=None):
+    """Draw the top 10 callers chart onto a cleared ax; False if only a message was drawn"""
+    try:
+        filtered_lines, top_callers = frequent_callers_data(time_range, cache)
+    except FileNotFoundError:
+        ax.text(0.5, 0.5, "Call log file not found", fontsize=14, ha='center')
+        return False
+    
+    if not filtered_lines:
+        ax.text(0.5, 0.5, "No call data in selected time range", fontsize=12, ha='center')
+        return False
+
+    if not top_callers:
+        ax.text(0.5, 0.5, "No phone numbers found in logs", fontsize=12, ha='center')
+        return False
+
+    labels = [x[0] for x in top_callers]
+    counts = [x[1] for x in top_callers]
+
+    # Create the bar chart
+    bars = ax.barh(labels[::-1], counts[::-1], color="lime")
+    ax.set_title("Top 10 Frequent Callers", color="lime", fontsize=12)
+    ax.set_xlabel("Number of Calls", color="lime")
+    ax.tick_params(axis='x', colors='lime')
+    ax.tick_params(axis='y', colors='lime')
+    ax.grid(True, axis='x', alpha=0.3)
+    
+    # Add count values at the end of each bar
+    for i, bar in enumerate(bars):
+        width = bar.get_width()
+        ax.text(width + 0.3, bar.get_y() + bar.get_height()/2, 
+                str(int(width)), ha='left', va='center', color='lime')
+    
+    # Apply dark theme
+    fig.patch.set_facecolor('#121212')
+    ax.set_facecolor('#1e1e1e')
+    
+    return True
@@ -0,0 +1,153 @@
+"""Inverted token index for fast keyword filtering of log files"""
+import json
+import os
+import re
+import threading
+from array import array
+
+from scripts.line_scanner import LineScanner
+
+INDEX_SUFFIX = ".kwidx"
+_MAGIC = b"ALTKW1\n"
+TOKEN_RE = re.compile(r'\w+')
+
+# In-process copies of loaded indexes, keyed by log path
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class KeywordIndex:
+    """Map of lowercase tokens to the line numbers (rows) they appear on"""
+
+    def __init__(self, path, size, mtime_ns, tokens, rows):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        # token -> (start, count) into the shared rows array
+        self.tokens = tokens
+        self.rows = rows
+
+    def postings(self, token):
+        """Rows containing an exact token"""
+        start, count = self.tokens.get(token, (0, 0))
+        return self.rows[start:start + count]
+
+    def candidate_rows(self, keyword):
+        """Return sorted rows that may contain keyword (case-insensitive), or None.
+
+        Every line containing the keyword is in the result; callers still
+        confirm with a substring check. None means the keyword has no word
+        characters and the index can't narrow the search.
+        """
+        query = keyword.lower()
+        query_tokens = [(m.group(), m.start(), m.end()) for m in TOKEN_RE.finditer(query)]
+        if not query_tokens:
+            return None
+
+        candidates = None
+        for token, start, end in query_tokens:
+            # Tokens at the edges of the query may be part of a longer word in the line
+            open_left = start == 0
+            open_right = end == len(query)
+            if open_left and open_right:
+                words = [w for w in self.tokens if token in w]
+            elif open_left:
+                words = [w for w in self.tokens if w.endswith(token)]
+            elif open_right:
+                words = [w for w in self.tokens if w.startswith(token)]
+            else:
+                words = [token] if token in self.tokens else []
+
+            matched = set()
+            for word in words:
+                matched.update(self.postings(word))
+            candidates = matched if candidates is None else candidates & matched
+            if not candidates:
+                return []
+
+        return sorted(candidates)
+
+    def save(self):
+        """Write the index next to the log file"""
+        header = json.dumps({
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "count": len(self.rows),
+            "tokens": self.tokens
+        }).encode("utf-8")
+        tmp_path = self.path + INDEX_SUFFIX + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(header + b"\n")
+            self.rows.tofile(f)
+        os.replace(tmp_path, self.path + INDEX_SUFFIX)
+
+
+def build_keyword_index(path):
+    """Tokenize every line of a log file into an inverted index"""
+    st = os.stat(path)
+    postings = {}
+    with LineScanner(path) as scanner:
+        for row, (_, raw) in enumerate(scanner.iter_raw()):
+            line = raw.decode("utf-8", errors="replace").lower()
+            for token in set(TOKEN_RE.findall(line)):
+                rows = postings.get(token)
+                if rows is None:
+                    rows = postings[token] = array("I")
+                rows.append(row)
+
+    tokens = {}
+    all_rows = array("I")
+    for token, rows in postings.items():
+        tokens[token] = (len(all_rows), len(rows))
+        all_rows.extend(rows)
+    return KeywordIndex(path, st.st_size, st.st_mtime_ns, tokens, all_rows)
+
+
+def _read_sidecar(path, st):
+    """Load a sidecar index if it matches the file's current size and mtime"""
+    try:
+        with open(path + INDEX_SUFFIX, "rb") as f:
+            if f.readline() != _MAGIC:
+                return None
+            header = json.loads(f.readline())
+            if header["size"] != st.st_size or header["mtime_ns"] != st.st_mtime_ns:
+                return None
+            rows = array("I")
+            rows.fromfile(f, header["count"])
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    tokens = {token: tuple(span) for token, span in header["tokens"].items()}
+    return KeywordIndex(path, st.st_size, st.st_mtime_ns, tokens, rows)
+
+
+def load_keyword_index(path):
+    """Return the keyword index for a file if one is built and current, else None"""
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    with _cache_lock:
+        index = _cache.get(path)
+    if index is not None and index.size == st.st_size and index.mtime_ns == st.st_mtime_ns:
+        return index
+
+    index = _read_sidecar(path, st)
+    if index is not None:
+        with _cache_lock:
+            _cache[path] = index
+    return index
+
+
+def build_keyword_indexes(paths):
+    """Build and save keyword indexes for every existing, out-of-date file"""
+    for path in paths:
+        try:
+            if not os.path.exists(path) or load_keyword_index(path) is not None:
+                continue
+            index = build_keyword_index(path)
+            index.save()
+            with _cache_lock:
+                _cache[path] = index
+        except Exception as e:
+            print(f"Error building keyword index for {path}: {e}")
@@ -0,0 +1,85 @@
+"""Memory-mapped line scanner shared by the log file readers"""
+import mmap
+import os
+
+# Bytes examined per step when counting lines, so counting never copies the whole file
+_COUNT_BLOCK = 8 * 1024 * 1024
+
+
+def decode_line(raw):
+    """Decode a raw line the way a text-mode read would"""
+    line = raw.decode("utf-8", errors="replace")
+    # CRLF (or adb's CRCRLF) becomes a plain newline
+    if line.endswith("\r\n"):
+        line = line.rstrip("\r\n") + "\n"
+    return line
+
+
+class LineScanner:
+    """Lazy, random-access view of a file's lines through mmap.
+
+    Nothing is decoded until a line is asked for, so peak memory stays flat
+    no matter how large the file is. Use as a context manager so the mapping
+    is released promptly (Windows can't replace a file while it's mapped).
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self._file = open(path, "rb")
+        self.size = os.fstat(self._file.fileno()).st_size
+        # mmap can't map empty files
+        self.buffer = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ) if self.size else b""
+
+    def close(self):
+        if isinstance(self.buffer, mmap.mmap):
+            self.buffer.close()
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.close()
+
+    def _line_end(self, offset):
+        newline = self.buffer.find(b"\n", offset)
+        return self.size if newline < 0 else newline + 1
+
+    def iter_raw(self, start=0):
+        """Yield (offset, raw bytes) for each line from a byte offset on"""
+        offset = start
+        while offset < self.size:
+            end = self._line_end(offset)
+            yield offset, self.buffer[offset:end]
+            offset = end
+
+    def iter_offsets(self, start=0):
+        """Yield the byte offset of each line without copying any line data"""
+        offset = start
+        while offset < self.size:
+            yield offset
+            offset = self._line_end(offset)
+
+    def iter_lines(self, start=0):
+        """Yield decoded lines from a byte offset on"""
+        for _, raw in self.iter_raw(start):
+            yield decode_line(raw)
+
+    def line_at(self, offset):
+        """Decode the single line starting at a byte offset"""
+        return decode_line(self.buffer[offset:self._line_end(offset)])
+
+    def count_lines(self):
+        """Number of lines, counted the way readlines() would"""
+        count = 0
+        for block in range(0, self.size, _COUNT_BLOCK):
+            count += self.buffer[block:block + _COUNT_BLOCK].count(b"\n")
+        if self.size and self.buffer[self.size - 1:self.size] != b"\n":
+            count += 1
+        return count
+
+
+def iter_file_lines(path, start=0):
+    """Yield decoded lines of a file through a LineScanner, closing it when done"""
+    with LineScanner(path) as scanner:
+        yield from scanner.iter_lines(start)
@@ -0,0 +1,52 @@
+"""Ring buffer that backs the Live Monitoring view"""
+from collections import deque
+
+
+class LiveBuffer:
+    """The most recent live-monitor lines, kept in a deque(maxlen=N).
+
+    The buffer is the source of truth; the Text widget is just a rendering of
+    it. While paused, lines keep arriving here and the widget is left alone so
+    it can be scrolled; resuming re-renders from the buffer.
+    """
+
+    def __init__(self, maxlen=1000):
+        self.lines = deque(maxlen=maxlen)
+        self.paused = False
+        # Lines currently shown in the widget, so trimming never has to query Tk
+        self.rendered = 0
+        self.stale = False
+
+    @property
+    def maxlen(self):
+        return self.lines.maxlen
+
+    def resize(self, maxlen):
+        """Change how many lines are retained, keeping the newest ones"""
+        self.lines = deque(self.lines, maxlen=maxlen)
+        self.stale = True
+
+    def append(self, text):
+        """Add a block of text and return how to update the widget.
+
+        Returns None when paused, ("replace", text) when the widget must be
+        redrawn from the buffer, or ("append", text, lines_to_trim).
+        """
+        new_lines = [line if line.endswith("\n") else line + "\n"
+                     for line in text.splitlines(keepends=True)]
+        self.lines.extend(new_lines)
+        if self.paused:
+            self.stale = True
+            return None
+        if self.stale or len(new_lines) >= self.maxlen:
+            return self.render()
+
+        trim = max(self.rendered + len(new_lines) - self.maxlen, 0)
+        self.rendered = self.rendered + len(new_lines) - trim
+        return ("append", "".join(new_lines), trim)
+
+    def render(self):
+        """Return a full redraw of the buffer"""
+        self.stale = False
+        self.rendered = len(self.lines)
+        return ("replace", "".join(self.lines))
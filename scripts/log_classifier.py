@@ -0,0 +1,105 @@
+"""Single-pass classification of log lines into LOG_TYPES categories"""
+import re
+
+_REGEX_META = set(".^$*+?{}[]()|\\")
+
+
+def _literal(alternative):
+    """Return the plain text of an alternative, or None if it needs the regex engine"""
+    chars = []
+    i = 0
+    while i < len(alternative):
+        c = alternative[i]
+        if c == "\\":
+            # Escaped punctuation (e.g. System\.err) is still a literal
+            if i + 1 < len(alternative) and not alternative[i + 1].isalnum():
+                chars.append(alternative[i + 1])
+                i += 2
+                continue
+            return None
+        if c in _REGEX_META:
+            return None
+        chars.append(c)
+        i += 1
+    return "".join(chars)
+
+
+def _literal_prefix(alternative):
+    """Return the literal text every match of an alternative must start with"""
+    chars = []
+    i = 0
+    while i < len(alternative):
+        c = alternative[i]
+        if c == "\\":
+            if i + 1 < len(alternative) and not alternative[i + 1].isalnum():
+                chars.append(alternative[i + 1])
+                i += 2
+                continue
+            break
+        if c in _REGEX_META:
+            break
+        chars.append(c)
+        i += 1
+    # A quantifier makes the character before it optional
+    if chars and i < len(alternative) and alternative[i] in "*?{":
+        chars.pop()
+    return "".join(chars).lower()
+
+
+class LogClassifier:
+    """Precompiled matcher that returns every LOG_TYPES category a line belongs to.
+
+    Results are identical to running re.search(pattern, line, re.IGNORECASE)
+    for each category. Plain-text alternatives are checked with substring tests
+    on the lowercased line, and regex alternatives only run once their literal
+    prefix is present. Non-ASCII lines fall back to the compiled patterns since
+    str.lower() and re.IGNORECASE disagree on a handful of Unicode characters.
+    """
+
+    def __init__(self, log_types):
+        self.log_types = list(log_types)
+        self._compiled = {}
+        self._checks = {}
+        for log_type in self.log_types:
+            pattern = log_types[log_type]["pattern"]
+            compiled = re.compile(pattern, re.IGNORECASE)
+            self._compiled[log_type] = compiled
+
+            # Only split on '|' when it can't be inside a group or character class
+            if "(" in pattern or "[" in pattern:
+                checks = [("", compiled)]
+            else:
+                checks = []
+                for alternative in pattern.split("|"):
+                    literal = _literal(alternative)
+                    if literal is None:
+                        checks.append((_literal_prefix(alternative),
+                                       re.compile(alternative, re.IGNORECASE)))
+                    else:
+                        checks.append((literal.lower(), None))
+            self._checks[log_type] = checks
+
+    def classify(self, line):
+        """Return the list of categories matching a line, in LOG_TYPES order"""
+        if not line.isascii():
+            return [log_type for log_type, compiled in self._compiled.items() if compiled.search(line)]
+
+        lowered = line.lower()
+        categories = []
+        for log_type, checks in self._checks.items():
+            for text, compiled in checks:
+                if text in lowered and (compiled is None or compiled.search(line)):
+                    categories.append(log_type)
+                    break
+        return categories
+
+    def matches(self, log_type, line):
+        """Return True if a line belongs to the given category"""
+        if not line.isascii():
+            return self._compiled[log_type].search(line) is not None
+
+        lowered = line.lower()
+        for text, compiled in self._checks[log_type]:
+            if text in lowered and (compiled is None or compiled.search(line)):
+                return True
+        return False
@@ -0,0 +1,165 @@
+"""Keyword, time range, severity and subtype filtering of log files"""
+import re
+from datetime import datetime
+
+from scripts.keyword_index import load_keyword_index
+from scripts.log_types import (LOG_TYPES, TIME_RANGES, LOGCAT_FILE, CALL_LOG_FILE, SMS_LOG_FILE,
+                               FILTERED_FILE, category_path)
+from scripts.logcat_parser import parse_line
+from scripts.stage_metrics import metrics
+from scripts.timestamp_index import load_index
+
+
+# Filter tab log types besides the logcat categories
+FILTER_SOURCES = {
+    "Logcat": LOGCAT_FILE,
+    "Calls": CALL_LOG_FILE,
+    "SMS": SMS_LOG_FILE,
+}
+
+
+def filter_input_file(log_type):
+    """File filtered for a Filter tab log type, or None if the type is unknown"""
+    if log_type in FILTER_SOURCES:
+        return FILTER_SOURCES[log_type]
+    if log_type in LOG_TYPES:
+        return category_path(log_type)
+    return None
+
+
+def filter_logs(input_file, keyword=None, time_range=None, severity=None, subtype=None, output_file=FILTERED_FILE):
+    """Enhanced filter logs function that handles all the new options"""
+    run = metrics.begin("filter", input_file)
+    try:
+        index = load_index(input_file)
+            
+        now = datetime.now()
+        filtered_lines = []
+        
+        # Define patterns for severity levels
+        severity_patterns = {
+            "Error": r'E/|ERROR|Exception|FATAL',
+            "Warning": r'W/|WARN|WARNING',
+            "Info": r'I/|INFO',
+            "Debug": r'D/|DEBUG',
+            "Verbose": r'V/|VERBOSE'
+        }
+        
+        # Define patterns for subtypes based on categories
+        subtype_patterns = {
+            # Application subtypes
+            "Activity": r'Activity|startActivity',
+            "Fragment": r'Fragment',
+            "View": r'View|Inflate',
+            "Lifecycle": r'onCreate|onStart|onResume|onPause|onStop|onDestroy',
+            
+            # System subtypes
+            "Boot": r'boot|start up|startup|starting',
+            "Memory": r'memory|heap|ram',
+            "CPU": r'cpu|processor',
+            "Battery": r'battery|power',
+            
+            # Crash subtypes
+            "NullPointer": r'NullPointerException',
+            "OutOfMemory": r'OutOfMemoryError',
+            "IllegalState": r'IllegalStateException',
+            "ANR": r'ANR|Not Responding',
+            
+            # Network subtypes
+            "WiFi": r'wifi|wlan',
+            "Mobile": r'mobile|cellular|data connection',
+            "HTTP": r'http|https|URL',
+            "Socket": r'socket|tcp|udp',
+            
+            # GC subtypes
+            "Dalvik GC": r'dalvikvm.*GC',
+            "ART GC": r'art.*GC',
+            "Explicit GC": r'Explicit GC',
+            "Concurrent GC": r'Concurrent GC',
+            
+            # Broadcast subtypes
+            "System": r'android\.intent\.action|system broadcast',
+            "App": r'com\.',
+            "Sticky": r'sticky|registerReceiver',
+            "Ordered": r'ordered broadcast',
+            
+            # Service subtypes
+            "Start": r'startService',
+            "Stop": r'stopService',
+            "Bind": r'bindService|onBind',
+            "Unbind": r'unbindService|onUnbind',
+            
+            # Device subtypes
+            "Battery": r'battery|BatteryManager',
+            "Power": r'power|PowerManager|wake|sleep',
+            "Sensor": r'sensor|Sensor',
+            "Camera": r'camera|Camera',
+            "Location": r'location|LocationManager|GPS'
+        }
+        
+        # Oldest timestamp allowed by the time range, using the precomputed index
+        cutoff = (now - TIME_RANGES[time_range]).timestamp() if time_range in TIME_RANGES else None
+        
+        # Resolve the keyword to candidate lines when a keyword index has been built
+        candidates = None
+        if keyword and keyword.strip():
+            keyword_index = load_keyword_index(input_file)
+            if keyword_index is not None:
+                candidates = keyword_index.candidate_rows(keyword)
+        
+        if candidates is not None:
+            lines = index.iter_rows(candidates)
+        elif cutoff is not None:
+            # Seek past lines older than the cutoff; iter_since keeps undated lines
+            lines = index.iter_since(cutoff)
+        else:
+            lines = index.iter_lines()
+        
+        scanned = read = 0
+        for line, ts in lines:
+            scanned += 1
+            read += len(line)
+            include = True
+            
+            # Apply time filter (lines without a timestamp are kept)
+            if cutoff is not None and ts is not None and ts < cutoff:
+                include = False
+            
+            # Apply keyword filter
+            if include and keyword and keyword.strip():
+                if keyword.lower() not in line.lower():
+                    include = False
+            
+            # Apply severity filter, using the logcat level when it has a severity
+            # (S, "silent", has none and is matched by pattern like non-logcat lines)
+            if include and severity and severity != "All":
+                record = parse_line(line, now)
+                if record.severity is not None:
+                    if record.severity != severity:
+                        include = False
+                elif not re.search(severity_patterns.get(severity, ""), line, re.IGNORECASE):
+                    include = False
+            
+            # Apply subtype filter
+            if include and subtype and subtype != "All":
+                if not re.search(subtype_patterns.get(subtype, ""), line, re.IGNORECASE):
+                    include = False
+            
+            # Add line to filtered results if it passes all filters
+            if include:
+                filtered_lines.append(line)
+        run.add(lines=scanned, bytes_read=read)
+        
+        # Write filtered lines to output file
+        with open(output_file, "w", encoding="utf-8") as f:
+            f.writelines(filtered_lines)
+        
+        return len(filtered_lines)
+    
+    except Exception as e:
+        print(f"Error filtering logs: {e}")
+        metrics.finish(run, e)
+        raise
+    finally:
+        if run.running:
+            metrics.finish(run)
@@ -0,0 +1,70 @@
+"""Logcat categories, time ranges and the log file layout shared by the GUI and CLI"""
+from datetime import timedelta
+
+LOG_TYPES = {
+    "Application": {
+        "description": "Application-specific logs",
+        "pattern": r'ActivityManager|PackageManager|ApplicationContext',
+        "color": "blue"
+    },
+    "System": {
+        "description": "System-level logs",
+        "pattern": r'SystemServer|System\.err|SystemClock|SystemProperties',
+        "color": "green"
+    },
+    "Crash": {
+        "description": "Application crashes and exceptions",
+        "pattern": r'FATAL|Exception|ANR|crash|force close|stacktrace',
+        "color": "red"
+    },
+    "GC": {
+        "description": "Garbage Collection events",
+        "pattern": r'dalvikvm.*GC|art.*GC|GC_|collector',
+        "color": "purple"
+    },
+    "Network": {
+        "description": "Network activity logs",
+        "pattern": r'ConnectivityManager|NetworkInfo|WifiManager|HttpURLConnection|socket|wifi|TCP|UDP|DNS',
+        "color": "cyan"
+    },
+    "Broadcast": {
+        "description": "Broadcast receivers and events",
+        "pattern": r'BroadcastReceiver|sendBroadcast|onReceive|Intent.*broadcast',
+        "color": "yellow"
+    },
+    "Service": {
+        "description": "Service lifecycle events",
+        "pattern": r'Service|startService|stopService|bindService|onBind',
+        "color": "orange"
+    },
+    "Device": {
+        "description": "Device state and hardware",
+        "pattern": r'PowerManager|BatteryManager|sensor|hardware|camera|location|bluetooth|telephony',
+        "color": "magenta"
+    }
+}
+
+# Look-back window for each time range option
+TIME_RANGES = {
+    "Past 1 Hour": timedelta(hours=1),
+    "Past 24 Hours": timedelta(hours=24),
+    "Past 7 Days": timedelta(days=7)
+}
+
+# Files written by extraction, relative to the working directory
+LOGCAT_FILE = "logs/android_logcat.txt"
+CALL_LOG_FILE = "logs/call_logs.txt"
+SMS_LOG_FILE = "logs/sms_logs.txt"
+CATEGORY_DIR = "logs/logcat_types"
+FILTERED_FILE = "logs/filtered_logs.txt"
+EXPORT_DIR = "logs/exports"
+# Multi-device extraction gives each serial its own copy of the layout above
+DEVICES_DIR = "logs/devices"
+
+# Graph types offered in the Graphs tab, besides one per logcat category
+GRAPH_TYPES = ["Call Logs", "SMS Logs", "Top SMS Senders", "Logcat Activity"] + list(LOG_TYPES.keys())
+
+
+def category_path(log_type):
+    """File holding the lines of one logcat category"""
+    return f"{CATEGORY_DIR}/{log_type.lower()}_logs.txt"
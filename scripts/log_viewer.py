@@ -0,0 +1,203 @@
+"""Virtualized text view that only keeps the visible lines of large logs in Tk"""
+import tkinter as tk
+from tkinter import ttk
+from tkinter import font as tkfont
+from bisect import bisect_right
+from datetime import datetime
+
+from scripts.logcat_parser import sniff_timestamp
+
+
+class VirtualLogViewer(tk.Frame):
+    """Scrollable view over one or more log files backed by their line-offset indexes.
+
+    Only page_size lines are ever inserted into the Text widget; scrolling,
+    jump-to-line and jump-to-time re-render that window from disk. Unless
+    page_size is given it follows the widget's height as it is resized. The
+    Text is read-only, since the page is rebuilt on every scroll.
+    """
+
+    def __init__(self, master, page_size=None, **text_options):
+        super().__init__(master, bg=text_options.get("bg"))
+        self._fixed_page = page_size is not None
+        self.page_size = page_size or text_options.get("height", 30)
+        # Lines of the page that fit entirely on screen; fewer than page_size when lines wrap
+        self._visible = self.page_size
+        # (first virtual line, line count, list of strings or TimestampIndex)
+        self._segments = []
+        self._starts = []
+        self._total = 0
+        self._first = 0
+
+        toolbar = tk.Frame(self, bg=text_options.get("bg"))
+        toolbar.pack(fill=tk.X)
+        label_options = {"bg": text_options.get("bg"), "fg": text_options.get("fg"), "font": text_options.get("font")}
+
+        tk.Label(toolbar, text="Line", **label_options).pack(side=tk.LEFT, padx=5)
+        self.line_entry = tk.Entry(toolbar, width=10)
+        self.line_entry.pack(side=tk.LEFT)
+        self.line_entry.bind("<Return>", lambda e: self.jump_to_line_entry())
+        tk.Button(toolbar, text="Go", bg="gray", fg="black",
+                  command=self.jump_to_line_entry).pack(side=tk.LEFT, padx=5)
+
+        tk.Label(toolbar, text="Time", **label_options).pack(side=tk.LEFT, padx=5)
+        self.time_entry = tk.Entry(toolbar, width=20)
+        self.time_entry.pack(side=tk.LEFT)
+        self.time_entry.bind("<Return>", lambda e: self.jump_to_time_entry())
+        tk.Button(toolbar, text="Go", bg="gray", fg="black",
+                  command=self.jump_to_time_entry).pack(side=tk.LEFT, padx=5)
+
+        self.status_label = tk.Label(toolbar, text="", **label_options)
+        self.status_label.pack(side=tk.RIGHT, padx=5)
+
+        self.scrollbar = ttk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self.scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.text = tk.Text(self, state=tk.DISABLED, **text_options)
+        self.text.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.text.bind("<Configure>", lambda e: self._on_resize(e.height))
+        # A disabled Text doesn't take focus on click, which the keys below need
+        self.text.bind("<Button-1>", lambda e: self.text.focus_set())
+
+        # Scrolling moves the virtual window instead of the Text widget
+        self.text.bind("<MouseWheel>", lambda e: self.scroll(-3 if e.delta > 0 else 3))
+        self.text.bind("<Button-4>", lambda e: self.scroll(-3))
+        self.text.bind("<Button-5>", lambda e: self.scroll(3))
+        self.text.bind("<Up>", lambda e: self.scroll(-1))
+        self.text.bind("<Down>", lambda e: self.scroll(1))
+        self.text.bind("<Prior>", lambda e: self.scroll(-self._visible))
+        self.text.bind("<Next>", lambda e: self.scroll(self._visible))
+        self.text.bind("<Control-Home>", lambda e: self.jump_to_line(1))
+        self.text.bind("<Control-End>", lambda e: self.jump_to_line(self._total))
+
+    def set_sources(self, sources):
+        """Show a sequence of sources: plain strings or TimestampIndex objects"""
+        segments = []
+        total = 0
+        for source in sources:
+            if isinstance(source, str):
+                source = source.splitlines(keepends=True)
+            count = len(source)
+            if count:
+                segments.append((total, count, source))
+                total += count
+        # Swap in the new sources on the Tk thread
+        self.after(0, self._apply_sources, segments, total)
+
+    def show_message(self, message):
+        """Replace the view with a plain message"""
+        self.set_sources([message])
+
+    def clear(self):
+        self.set_sources([])
+
+    def _apply_sources(self, segments, total):
+        self._segments = segments
+        self._starts = [start for start, _, _ in segments]
+        self._total = total
+        self._first = 0
+        self._render()
+
+    def _read(self, first, count):
+        """Return up to count lines starting at a virtual line number"""
+        lines = []
+        i = bisect_right(self._starts, first) - 1
+        while i >= 0 and i < len(self._segments) and len(lines) < count:
+            start, length, source = self._segments[i]
+            begin = max(first - start, 0)
+            end = min(length, begin + count - len(lines))
+            if isinstance(source, list):
+                lines.extend(source[begin:end])
+            else:
+                lines.extend(source.read_range(begin, end))
+            i += 1
+        return [line if line.endswith("\n") else line + "\n" for line in lines]
+
+    def _on_resize(self, height):
+        if self._fixed_page:
+            return
+        inset = 2 * sum(self.text.winfo_pixels(self.text.cget(option))
+                        for option in ("borderwidth", "highlightthickness", "pady"))
+        linespace = tkfont.Font(font=self.text.cget("font")).metrics("linespace")
+        page_size = max(1, (height - inset) // max(linespace, 1))
+        if page_size != self.page_size:
+            self.page_size = page_size
+            self._render()
+
+    def _count_visible(self, count):
+        """How many of the first count rendered lines are fully on screen"""
+        self.text.update_idletasks()
+        height = self.text.winfo_height()
+        if count == 0 or height <= 1:
+            return max(count, 1)
+        for line in range(1, count + 1):
+            # The last display line of a wrapped line decides whether it all fits
+            info = self.text.dlineinfo(f"{line}.end")
+            if info is None or info[1] + info[3] > height:
+                return max(line - 1, 1)
+        return count
+
+    def _render(self):
+        lines = self._read(self._first, self.page_size)
+        self.text.config(state=tk.NORMAL)
+        self.text.delete(1.0, tk.END)
+        self.text.insert(tk.END, "".join(lines))
+        self.text.config(state=tk.DISABLED)
+        self._visible = self._count_visible(len(lines))
+        if self._total:
+            last = min(self._first + self._visible, self._total)
+            self.scrollbar.set(self._first / self._total, last / self._total)
+            self.status_label.config(text=f"Lines {self._first + 1}-{last} of {self._total}")
+        else:
+            self.scrollbar.set(0, 1)
+            self.status_label.config(text="")
+
+    def _on_scrollbar(self, action, amount, unit=None):
+        if action == "moveto":
+            self._move_to(int(float(amount) * self._total))
+        elif action == "scroll":
+            step = self._visible if unit == "pages" else 1
+            self.scroll(int(amount) * step)
+
+    def _move_to(self, first):
+        first = max(0, min(first, self._total - self._visible))
+        if first != self._first:
+            self._first = first
+            self._render()
+
+    def scroll(self, lines):
+        """Move the visible window by a number of lines"""
+        self._move_to(self._first + lines)
+        return "break"
+
+    def jump_to_line(self, line_number):
+        """Show the given 1-based line at the top of the view"""
+        self._move_to(line_number - 1)
+        return "break"
+
+    def jump_to_time(self, timestamp):
+        """Show the first line at or after an epoch timestamp"""
+        for start, length, source in self._segments:
+            if isinstance(source, list):
+                continue
+            row = source.seek(timestamp)
+            while row < length:
+                ts = source.timestamp(row)
+                if ts is not None and ts >= timestamp:
+                    self.jump_to_line(start + row + 1)
+                    return True
+                row += 1
+        return False
+
+    def jump_to_line_entry(self):
+        try:
+            self.jump_to_line(int(self.line_entry.get()))
+        except ValueError:
+            self.status_label.config(text="Enter a line number")
+
+    def jump_to_time_entry(self):
+        text = self.time_entry.get().strip()
+        timestamp = sniff_timestamp(text, datetime.now())
+        if timestamp is None:
+            self.status_label.config(text="Use YYYY-MM-DD HH:MM:SS or MM-DD HH:MM:SS")
+        elif not self.jump_to_time(timestamp):
+            self.status_label.config(text="No lines at or after that time")
@@ -0,0 +1,150 @@
+"""Parser for `logcat -v threadtime`, `time` and `brief` output"""
+import re
+from datetime import datetime
+
+from scripts.line_scanner import iter_file_lines
+
+# Logcat priority letters mapped to the severity names used in the UI
+LEVEL_NAMES = {
+    "V": "Verbose",
+    "D": "Debug",
+    "I": "Info",
+    "W": "Warning",
+    "E": "Error",
+    "F": "Error",
+    "A": "Error",
+}
+
+# 10-18 10:53:34.123  1234  1250 I ActivityManager: message
+_THREADTIME = re.compile(
+    r'^(?:(\d{4})-)?(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?\s+'
+    r'(\d+)\s+(\d+)\s+([VDIWEFAS])\s+(.*?)\s*: ?(.*)$'
+)
+# 10-18 10:53:34.123 I/ActivityManager( 1234): message
+_TIME = re.compile(
+    r'^(?:(\d{4})-)?(\d{2})-(\d{2})\s+(\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6}))?\s+'
+    r'([VDIWEFAS])/(.*?)\s*\(\s*(\d+)\): ?(.*)$'
+)
+# I/ActivityManager( 1234): message
+_BRIEF = re.compile(r'^([VDIWEFAS])/(.*?)\s*\(\s*(\d+)\): ?(.*)$')
+
+# Timestamp formats found in call/SMS dumps and other non-logcat lines
+_FULL_DATE = re.compile(r'\d{4}-\d{2}-\d{2} \d{2}:\d{2}:\d{2}')
+_UNIX_MS = re.compile(r'date=(\d+)')
+_LOGCAT_DATE = re.compile(r'(\d{2}-\d{2} \d{2}:\d{2}:\d{2})')
+
+
+class LogRecord:
+    """One parsed log line. timestamp is epoch seconds, fields are None when unknown"""
+
+    __slots__ = ("timestamp", "pid", "tid", "level", "tag", "message", "line")
+
+    def __init__(self, line, timestamp=None, pid=None, tid=None, level=None, tag=None, message=None):
+        self.line = line
+        self.timestamp = timestamp
+        self.pid = pid
+        self.tid = tid
+        self.level = level
+        self.tag = tag
+        self.message = message
+
+    @property
+    def severity(self):
+        """Severity name for the logcat level, or None for non-logcat lines"""
+        return LEVEL_NAMES.get(self.level)
+
+    @property
+    def when(self):
+        """Timestamp as a local datetime, or None"""
+        return datetime.fromtimestamp(self.timestamp) if self.timestamp is not None else None
+
+    def __repr__(self):
+        return (f"LogRecord(timestamp={self.timestamp!r}, pid={self.pid!r}, tid={self.tid!r}, "
+                f"level={self.level!r}, tag={self.tag!r}, message={self.message!r})")
+
+
+def _to_epoch(year, month, day, hour, minute, second, fraction, now):
+    """Build an epoch timestamp, inferring the year the way logcat readers expect"""
+    micro = int(fraction.ljust(6, "0")) if fraction else 0
+    try:
+        if year:
+            return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second), micro).timestamp()
+        ts = datetime(now.year, int(month), int(day), int(hour), int(minute), int(second), micro)
+        # Logcat omits the year, so dates in the future belong to last year
+        if ts > now:
+            ts = ts.replace(year=now.year - 1)
+        return ts.timestamp()
+    except ValueError:
+        return None
+
+
+def sniff_timestamp(line, now=None):
+    """Find a timestamp anywhere in a free-form line (call/SMS dumps), as epoch seconds"""
+    date_match = _FULL_DATE.search(line)
+    if date_match:
+        try:
+            return datetime.strptime(date_match.group(), "%Y-%m-%d %H:%M:%S").timestamp()
+        except ValueError:
+            pass
+
+    unix_match = _UNIX_MS.search(line)
+    if unix_match:
+        try:
+            ts = int(unix_match.group(1)) / 1000
+            datetime.fromtimestamp(ts)  # Reject values outside the platform's range
+            return ts
+        except (ValueError, OverflowError, OSError):
+            pass
+
+    logcat_match = _LOGCAT_DATE.search(line)
+    if logcat_match:
+        now = now or datetime.now()
+        month_day, clock = logcat_match.group(1).split(" ")
+        month, day = month_day.split("-")
+        hour, minute, second = clock.split(":")
+        return _to_epoch(None, month, day, hour, minute, second, None, now)
+
+    return None
+
+
+def parse_line(line, now=None):
+    """Parse a single log line into a LogRecord"""
+    now = now or datetime.now()
+    text = line.rstrip("\r\n")
+
+    m = _THREADTIME.match(text)
+    if m:
+        year, month, day, hour, minute, second, fraction, pid, tid, level, tag, message = m.groups()
+        return LogRecord(line, _to_epoch(year, month, day, hour, minute, second, fraction, now),
+                         int(pid), int(tid), level, tag, message)
+
+    m = _TIME.match(text)
+    if m:
+        year, month, day, hour, minute, second, fraction, level, tag, pid, message = m.groups()
+        return LogRecord(line, _to_epoch(year, month, day, hour, minute, second, fraction, now),
+                         int(pid), None, level, tag, message)
+
+    m = _BRIEF.match(text)
+    if m:
+        level, tag, pid, message = m.groups()
+        return LogRecord(line, sniff_timestamp(text, now), int(pid), None, level, tag, message)
+
+    # Not a logcat header line (call/SMS rows, section headers, continuations)
+    return LogRecord(line, sniff_timestamp(text, now), message=text)
+
+
+def parse_lines(lines, now=None):
+    """Yield a LogRecord for each line"""
+    now = now or datetime.now()
+    for line in lines:
+        yield parse_line(line, now)
+
+
+def iter_file_records(filepath, now=None):
+    """Lazily parse a log file, one LogRecord per line"""
+    return parse_lines(iter_file_lines(filepath), now)
+
+
+def parse_file(filepath, now=None):
+    """Parse a whole log file into a list of LogRecords"""
+    return list(iter_file_records(filepath, now))
@@ -0,0 +1,131 @@
+"""Single-pass pipeline from adb logcat output to the raw file, parser and category sinks"""
+import math
+import os
+import subprocess
+import tempfile
+from array import array
+from collections import Counter
+from datetime import datetime
+
+from scripts.adb import AdbError
+from scripts.line_scanner import LineScanner, decode_line
+from scripts.logcat_parser import parse_line
+
+LOGCAT_COMMAND = ["adb", "logcat", "-d", "-v", "threadtime"]
+
+
+class PipelineStats:
+    """Counters and line index collected while streaming a logcat"""
+
+    def __init__(self):
+        self.lines = 0
+        # Lines carried over from a checkpoint instead of being classified again
+        self.resumed_lines = 0
+        self.category_counts = Counter()
+        self.level_counts = Counter()
+        self.offsets = array("q")
+        self.timestamps = array("d")
+
+
+def adb_lines(command=LOGCAT_COMMAND):
+    """Yield raw output lines (bytes) from an adb command as they arrive.
+
+    Raises AdbError once the output ends if adb exited with an error, with
+    adb's own message (no device, unauthorized, ...) like run_adb.
+    """
+    # stderr goes to a file so a chatty adb can't block on a full pipe
+    with tempfile.TemporaryFile() as errors:
+        try:
+            process = subprocess.Popen(command, stdout=subprocess.PIPE, stderr=errors)
+        except OSError as e:
+            raise AdbError(f"{' '.join(command)}: {e}") from e
+        try:
+            for raw in process.stdout:
+                yield raw
+            returncode = process.wait()
+            if returncode:
+                errors.seek(0)
+                message = errors.read().decode("utf-8", errors="replace").strip() or f"exit status {returncode}"
+                raise AdbError(f"{' '.join(command)}: {message}")
+        finally:
+            if process.poll() is None:
+                process.kill()
+            process.stdout.close()
+            process.wait()
+
+
+def file_lines(path, start=0):
+    """Yield raw lines (bytes) from an existing log file, from a byte offset on"""
+    with LineScanner(path) as scanner:
+        for _, raw in scanner.iter_raw(start):
+            yield raw
+
+
+def tee_to_file(raw_lines, path):
+    """Write raw lines to path while passing (offset, raw) downstream.
+
+    Lines go to path + ".part", which replaces path only once raw_lines
+    ends cleanly, so a failed fetch leaves the previous capture in place.
+    """
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    part_path = path + ".part"
+    offset = 0
+    try:
+        with open(part_path, "wb") as f:
+            for raw in raw_lines:
+                f.write(raw)
+                yield offset, raw
+                offset += len(raw)
+    except BaseException:
+        try:
+            os.remove(part_path)
+        except OSError:
+            pass
+        raise
+    os.replace(part_path, path)
+
+
+def with_offsets(raw_lines, start=0):
+    """Pair each raw line with its byte offset without writing anything"""
+    offset = start
+    for raw in raw_lines:
+        yield offset, raw
+        offset += len(raw)
+
+
+def parse_records(offset_lines, now=None):
+    """Decode and parse each line, yielding (offset, LogRecord)"""
+    now = now or datetime.now()
+    for offset, raw in offset_lines:
+        yield offset, parse_line(decode_line(raw), now)
+
+
+def classify_records(records, classifier):
+    """Attach the matching LOG_TYPES categories, yielding (offset, record, categories)"""
+    for offset, record in records:
+        yield offset, record, classifier.classify(record.line)
+
+
+def fan_out(classified, sinks, on_match=None):
+    """Write each line to its category sinks and collect counters and the line index.
+
+    on_match(log_type, line) is called for every category a line belongs to.
+    """
+    stats = PipelineStats()
+    for offset, record, categories in classified:
+        stats.lines += 1
+        stats.offsets.append(offset)
+        stats.timestamps.append(math.nan if record.timestamp is None else record.timestamp)
+        if record.level:
+            stats.level_counts[record.level] += 1
+        for log_type in categories:
+            stats.category_counts[log_type] += 1
+            sinks.write(log_type, record.line)
+            if on_match:
+                on_match(log_type, record.line)
+    return stats
+
+
+def run_pipeline(offset_lines, classifier, sinks, on_match=None):
+    """Parse, classify and fan out a stream of (offset, raw) lines in one pass"""
+    return fan_out(classify_records(parse_records(offset_lines), classifier), sinks, on_match)
@@ -0,0 +1,104 @@
+"""Multi-process categorization of large logcat files"""
+import io
+import math
+import multiprocessing
+import os
+from array import array
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+
+from scripts.log_classifier import LogClassifier
+from scripts.logcat_parser import parse_line
+from scripts.line_scanner import decode_line
+from scripts.logcat_stream import PipelineStats
+
+CHUNK_SIZE = 32 * 1024 * 1024
+
+# Built once per worker process by _init_worker
+_classifier = None
+
+
+def _init_worker(log_types):
+    global _classifier
+    _classifier = LogClassifier(log_types)
+
+
+def chunk_ranges(path, chunk_size=CHUNK_SIZE):
+    """Split a file into (start, end) byte ranges that begin and end on line boundaries"""
+    size = os.path.getsize(path)
+    ranges = []
+    start = 0
+    with open(path, "rb") as f:
+        while start < size:
+            end = start + chunk_size
+            if end >= size:
+                end = size
+            else:
+                # Extend the chunk to the end of the line it stops in
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _classify_chunk(task):
+    """Classify one byte range; runs in a worker process"""
+    path, start, end, now = task
+    with open(path, "rb") as f:
+        f.seek(start)
+        data = f.read(end - start)
+
+    texts = {log_type: [] for log_type in _classifier.log_types}
+    offsets = array("q")
+    timestamps = array("d")
+    level_counts = Counter()
+    offset = start
+    for raw in io.BytesIO(data):
+        line = decode_line(raw)
+        record = parse_line(line, now)
+        offsets.append(offset)
+        timestamps.append(math.nan if record.timestamp is None else record.timestamp)
+        if record.level:
+            level_counts[record.level] += 1
+        for log_type in _classifier.classify(line):
+            texts[log_type].append(line)
+        offset += len(raw)
+
+    category_counts = Counter({log_type: len(lines) for log_type, lines in texts.items() if lines})
+    texts = {log_type: "".join(lines) for log_type, lines in texts.items() if lines}
+    return texts, offsets, timestamps, level_counts, category_counts
+
+
+def categorize_parallel(path, log_types, write, workers=None, chunk_size=CHUNK_SIZE, start_method="spawn"):
+    """Classify a logcat file across a process pool and write results in file order.
+
+    write(log_type, text) receives each chunk's lines for a category, in the
+    same order a serial pass would produce them. Returns PipelineStats.
+
+    Workers are spawned rather than forked, since callers may have threads
+    running (adb sessions, keyword indexing) whose locks a forked child
+    would inherit held. Spawned workers import the __main__ module, so only
+    call this from scripts whose module code is guarded, such as cli.py.
+    """
+    workers = workers or os.cpu_count() or 1
+    now = datetime.now()
+    tasks = [(path, start, end, now) for start, end in chunk_ranges(path, chunk_size)]
+
+    stats = PipelineStats()
+    with ProcessPoolExecutor(max_workers=workers,
+                             mp_context=multiprocessing.get_context(start_method),
+                             initializer=_init_worker, initargs=(log_types,)) as executor:
+        # map() yields results in submission order, which keeps the merge in line order
+        for texts, offsets, timestamps, level_counts, category_counts in executor.map(_classify_chunk, tasks):
+            for log_type in log_types:
+                if log_type in texts:
+                    write(log_type, texts[log_type])
+            stats.lines += len(offsets)
+            stats.offsets.extend(offsets)
+            stats.timestamps.extend(timestamps)
+            stats.level_counts.update(level_counts)
+            stats.category_counts.update(category_counts)
+    return stats
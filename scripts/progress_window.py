@@ -0,0 +1,130 @@
+"""Progress window with a cancel button for BackgroundJob"""
+import tkinter as tk
+from tkinter import ttk
+
+from scripts.background_job import JobCancelled
+
+
+class JobProgressWindow(tk.Toplevel):
+    """Small non-modal window that follows a BackgroundJob until it finishes.
+
+    The job's progress is polled with after(), so the worker never touches
+    Tk. When the job ends the window closes and exactly one callback runs on
+    the UI thread: on_success(result), on_error(exception) or on_cancel().
+    """
+
+    POLL_MS = 100
+
+    def __init__(self, master, job, title, on_success=None, on_error=None, on_cancel=None,
+                 bg="black", fg="white", font=None):
+        super().__init__(master, bg=bg)
+        self.job = job
+        self.on_success = on_success
+        self.on_error = on_error
+        self.on_cancel = on_cancel
+        self.title(title)
+        self.resizable(False, False)
+        self.transient(master)
+        self.protocol("WM_DELETE_WINDOW", self.cancel)
+
+        self.message_label = tk.Label(self, text="Starting...", bg=bg, fg=fg, font=font,
+                                      width=50, anchor="w")
+        self.message_label.pack(fill=tk.X, padx=10, pady=(10, 5))
+        self.progress = ttk.Progressbar(self, orient=tk.HORIZONTAL, length=350,
+                                        mode="determinate", maximum=100)
+        self.progress.pack(fill=tk.X, padx=10, pady=5)
+        self.cancel_button = tk.Button(self, text="Cancel", bg="gray", fg="black", command=self.cancel)
+        self.cancel_button.pack(pady=(5, 10))
+
+        self.after(self.POLL_MS, self._poll)
+
+    def cancel(self):
+        self.job.cancel()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.message_label.config(text="Cancelling...")
+
+    def _poll(self):
+        if not self.job.done.is_set():
+            fraction, message = self.job.snapshot()
+            self.progress["value"] = fraction * 100
+            if message and not self.job.cancelled:
+                self.message_label.config(text=message)
+            self.after(self.POLL_MS, self._poll)
+            return
+
+        self.destroy()
+        if isinstance(self.job.error, JobCancelled):
+            if self.on_cancel:
+                self.on_cancel()
+        elif self.job.error is not None:
+            if self.on_error:
+                self.on_error(self.job.error)
+        elif self.on_success:
+            self.on_success(self.job.result)
+
+
+class DeviceProgressWindow(tk.Toplevel):
+    """One row per device for a MultiDeviceExtraction running in a BackgroundJob.
+
+    Rows are refreshed from extraction.snapshot() with after(); when the job
+    ends the window stays open with the final states and on_done(snapshot)
+    runs on the UI thread.
+    """
+
+    POLL_MS = 250
+
+    def __init__(self, master, job, extraction, title="Extracting Devices", on_done=None,
+                 bg="black", fg="white", font=None):
+        super().__init__(master, bg=bg)
+        self.job = job
+        self.extraction = extraction
+        self.on_done = on_done
+        self.title(title)
+        self.transient(master)
+        self.protocol("WM_DELETE_WINDOW", self.close)
+
+        self.summary_label = tk.Label(self, text="Starting...", bg=bg, fg=fg, font=font, anchor="w")
+        self.summary_label.pack(fill=tk.X, padx=10, pady=(10, 5))
+        self.tree = ttk.Treeview(self, columns=("state", "progress", "message"), height=min(len(extraction.serials), 20))
+        self.tree.heading("#0", text="Device")
+        self.tree.heading("state", text="State")
+        self.tree.heading("progress", text="Progress")
+        self.tree.heading("message", text="Status")
+        self.tree.column("#0", width=160)
+        self.tree.column("state", width=80)
+        self.tree.column("progress", width=70, anchor="e")
+        self.tree.column("message", width=320)
+        for serial in extraction.serials:
+            self.tree.insert("", tk.END, iid=serial, text=serial, values=("queued", "0%", ""))
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.cancel_button = tk.Button(self, text="Cancel", bg="gray", fg="black", command=self.cancel)
+        self.cancel_button.pack(pady=(5, 10))
+
+        self.after(self.POLL_MS, self._poll)
+
+    def cancel(self):
+        self.job.cancel()
+        self.cancel_button.config(state=tk.DISABLED)
+        self.summary_label.config(text="Cancelling...")
+
+    def close(self):
+        if not self.job.done.is_set():
+            self.cancel()
+        else:
+            self.destroy()
+
+    def _poll(self):
+        snapshot = self.extraction.snapshot()
+        for progress in snapshot:
+            self.tree.item(progress.serial, values=(progress.state, f"{progress.fraction:.0%}", progress.message))
+        if not self.job.done.is_set():
+            if not self.job.cancelled:
+                self.summary_label.config(text=self.job.snapshot()[1] or "Starting...")
+            self.after(self.POLL_MS, self._poll)
+            return
+
+        finished = sum(progress.state == "done" for progress in snapshot)
+        self.summary_label.config(text=f"Finished: {finished} of {len(snapshot)} devices extracted")
+        self.cancel_button.config(text="Close", state=tk.NORMAL, command=self.destroy)
+        if self.on_done:
+            self.on_done(snapshot)
@@ -0,0 +1,225 @@
+"""PDF layout for the forensic report and graph exports"""
+from datetime import datetime
+
+from fpdf import FPDF
+
+from scripts.report_stats import collect_report_stats
+from scripts.stage_metrics import metrics
+
+# Table rows written between progress updates
+PROGRESS_ROWS = 200
+
+
+def _no_progress(fraction=None, message=None):
+    pass
+
+
+def write_full_report(filepath, log_types, progress=None):
+    """Collect report statistics and write the full forensic report to filepath.
+
+    progress(fraction, message) is called between stages; collection takes
+    the first 80% and PDF layout the rest. Nothing touches Tk, so this can
+    run on a worker thread or from the command line.
+    """
+    with metrics.stage("report", filepath) as run:
+        return _write_full_report(filepath, log_types, progress, run)
+
+
+def _write_full_report(filepath, log_types, progress, run):
+    progress = progress or _no_progress
+    # One streaming pass over each source gathers everything the sections below need
+    stats = collect_report_stats(log_types, progress=lambda fraction, message: progress(fraction * 0.8, message))
+    run.add(lines=stats.lines_read, bytes_read=stats.bytes_read)
+    progress(0.8, "Laying out report")
+
+    pdf = FPDF()
+
+    # Add a cover page
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', size=24)
+    pdf.cell(200, 40, txt="Android Forensic Analysis Report", ln=True, align='C')
+    pdf.set_font("Arial", size=12)
+    pdf.cell(200, 10, txt=f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True, align='C')
+    pdf.ln(20)
+
+    # Add device information if available
+    if stats.device_info is not None:
+        # Add device info to the report
+        pdf.set_font("Arial", 'B', size=14)
+        pdf.cell(200, 10, txt="Device Information", ln=True)
+        pdf.ln(5)
+
+        pdf.set_font("Arial", size=12)
+        for key, value in stats.device_info.items():
+            pdf.cell(200, 10, txt=f"{key}: {value}", ln=True)
+    else:
+        pdf.cell(200, 10, txt="Could not retrieve device information", ln=True)
+
+    # Add table of contents placeholder (would need to be filled in post-processing)
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', size=16)
+    pdf.cell(200, 10, txt="Table of Contents", ln=True)
+    pdf.ln(10)
+    pdf.set_font("Arial", size=12)
+    pdf.cell(200, 10, txt="1. Call Log Analysis", ln=True)
+    pdf.cell(200, 10, txt="2. SMS Log Analysis", ln=True)
+    pdf.cell(200, 10, txt="3. Logcat Analysis", ln=True)
+
+    # Call Log Analysis
+    progress(0.85, "Writing call log analysis")
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', size=16)
+    pdf.cell(200, 10, txt="1. Call Log Analysis", ln=True)
+    pdf.ln(10)
+
+    calls = stats.calls
+    if "calls" in stats.errors:
+        pdf.cell(200, 10, txt=f"Error analyzing call logs: {str(stats.errors['calls'])}", ln=True)
+    elif calls is None:
+        pdf.cell(200, 10, txt="Call log file not found", ln=True)
+    elif calls.lines:
+        # Call statistics
+        pdf.set_font("Arial", size=12)
+        pdf.cell(200, 10, txt=f"Total calls: {calls.lines}", ln=True)
+        pdf.cell(200, 10, txt=f"Incoming calls: {calls.type_counts['incoming']}", ln=True)
+        pdf.cell(200, 10, txt=f"Outgoing calls: {calls.type_counts['outgoing']}", ln=True)
+        pdf.cell(200, 10, txt=f"Missed calls: {calls.type_counts['missed']}", ln=True)
+        pdf.ln(10)
+
+        # Most frequent callers
+        top_callers = calls.top_numbers(5)
+        if top_callers:
+            pdf.set_font("Arial", 'B', size=14)
+            pdf.cell(200, 10, txt="Top 5 Most Frequent Callers", ln=True)
+            pdf.ln(5)
+
+            pdf.set_font("Arial", 'B', size=12)
+            pdf.cell(100, 10, txt="Phone Number", border=1)
+            pdf.cell(50, 10, txt="Call Count", border=1)
+            pdf.ln()
+
+            pdf.set_font("Arial", size=12)
+            for number, count in top_callers:
+                pdf.cell(100, 10, txt=number, border=1)
+                pdf.cell(50, 10, txt=str(count), border=1)
+                pdf.ln()
+    else:
+        pdf.cell(200, 10, txt="No call logs found", ln=True)
+
+    # SMS Log Analysis
+    progress(0.9, "Writing SMS log analysis")
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', size=16)
+    pdf.cell(200, 10, txt="2. SMS Log Analysis", ln=True)
+    pdf.ln(10)
+
+    sms = stats.sms
+    if "sms" in stats.errors:
+        pdf.cell(200, 10, txt=f"Error analyzing SMS logs: {str(stats.errors['sms'])}", ln=True)
+    elif sms is None:
+        pdf.cell(200, 10, txt="SMS log file not found", ln=True)
+    elif sms.lines:
+        # SMS statistics
+        pdf.set_font("Arial", size=12)
+        pdf.cell(200, 10, txt=f"Total SMS messages: {sms.lines}", ln=True)
+        pdf.cell(200, 10, txt=f"Incoming messages: {sms.type_counts['incoming']}", ln=True)
+        pdf.cell(200, 10, txt=f"Outgoing messages: {sms.type_counts['outgoing']}", ln=True)
+        pdf.ln(10)
+
+        # Most frequent SMS senders
+        top_senders = sms.top_numbers(5)
+        if top_senders:
+            pdf.set_font("Arial", 'B', size=14)
+            pdf.cell(200, 10, txt="Top 5 Most Frequent SMS Senders", ln=True)
+            pdf.ln(5)
+
+            pdf.set_font("Arial", 'B', size=12)
+            pdf.cell(100, 10, txt="Phone Number", border=1)
+            pdf.cell(50, 10, txt="Message Count", border=1)
+            pdf.ln()
+
+            pdf.set_font("Arial", size=12)
+            for number, count in top_senders:
+                pdf.cell(100, 10, txt=number, border=1)
+                pdf.cell(50, 10, txt=str(count), border=1)
+                pdf.ln()
+    else:
+        pdf.cell(200, 10, txt="No SMS logs found", ln=True)
+
+    # Logcat Analysis
+    progress(0.95, "Writing logcat analysis")
+    pdf.add_page()
+    pdf.set_font("Arial", 'B', size=16)
+    pdf.cell(200, 10, txt="3. Logcat Analysis", ln=True)
+    pdf.ln(10)
+
+    # Add logcat type distribution information
+    for log_type in log_types:
+        if log_type in stats.errors:
+            pdf.cell(200, 10, txt=f"Error analyzing {log_type} logs: {str(stats.errors[log_type])}", ln=True)
+            continue
+        category = stats.categories.get(log_type)
+        if category and category.lines:
+            pdf.set_font("Arial", 'B', size=14)
+            pdf.cell(200, 10, txt=f"{log_type} Logs", ln=True)
+            pdf.ln(5)
+
+            pdf.set_font("Arial", size=12)
+            pdf.cell(200, 10, txt=f"Total entries: {category.lines}", ln=True)
+
+            # Add example entries (first 3)
+            if category.lines > 1:
+                pdf.set_font("Arial", 'B', size=12)
+                pdf.cell(200, 10, txt="Example entries:", ln=True)
+
+                pdf.set_font("Arial", size=10)
+                for i, line in enumerate(category.examples):
+                    # Truncate long lines
+                    if len(line) > 100:
+                        line = line[:97] + "..."
+                    pdf.multi_cell(0, 10, txt=f"{i+1}. {line.strip()}")
+
+            pdf.ln(5)
+
+    # Save the PDF
+    progress(1.0, "Saving report")
+    pdf.output(filepath)
+    return filepath
+
+
+def write_graph_pdf(filepath, log_type, time_range, data, progress=None):
+    """Write graph data rows [(label or datetime, count)] to a PDF table"""
+    progress = progress or _no_progress
+    pdf = FPDF()
+    pdf.add_page()
+    pdf.set_font("Arial", size=12)
+    pdf.cell(200, 10, txt=f"{log_type} - Graph Export", ln=True, align='C')
+    pdf.cell(200, 10, txt=f"Time Range: {time_range}", ln=True)
+    pdf.cell(200, 10, txt=f"Generated: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}", ln=True)
+    pdf.ln(10)
+
+    # Create data table
+    pdf.set_font("Arial", 'B', size=10)
+    pdf.cell(100, 10, txt="Time/Label", border=1)
+    pdf.cell(50, 10, txt="Count", border=1)
+    pdf.ln()
+
+    pdf.set_font("Arial", size=10)
+    for i, (label, count) in enumerate(data):
+        if not i % PROGRESS_ROWS:
+            progress(i / len(data), f"Writing row {i + 1} of {len(data)}")
+        # Format the label/time
+        if isinstance(label, datetime):
+            label_str = label.strftime('%Y-%m-%d %H:%M')
+        else:
+            label_str = str(label)
+
+        # Add a row to the table
+        pdf.cell(100, 10, txt=label_str, border=1)
+        pdf.cell(50, 10, txt=str(count), border=1)
+        pdf.ln()
+
+    # Save the PDF
+    progress(1.0, "Saving export")
+    pdf.output(filepath)
+    return filepath
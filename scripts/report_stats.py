@@ -0,0 +1,180 @@
+"""Single-pass statistics collection for the forensic report"""
+import os
+import re
+from collections import Counter
+from itertools import islice
+
+from scripts.line_scanner import LineScanner, decode_line
+
+# Lines between progress callbacks during a scan
+PROGRESS_INTERVAL = 65536
+
+# Direction patterns, same as the report has always used
+CALL_TYPES = {
+    "incoming": re.compile(r'type:\s*1|INCOMING', re.IGNORECASE),
+    "outgoing": re.compile(r'type:\s*2|OUTGOING', re.IGNORECASE),
+    "missed": re.compile(r'type:\s*3|MISSED', re.IGNORECASE),
+}
+SMS_TYPES = {
+    "incoming": re.compile(r'type:\s*1|INCOMING|from:', re.IGNORECASE),
+    "outgoing": re.compile(r'type:\s*2|OUTGOING|to:', re.IGNORECASE),
+}
+CALL_NUMBER_RE = re.compile(r'(?:number:|to:|from:)\s*(\+?\d{7,15})')
+ANY_NUMBER_RE = re.compile(r'(\+?\d{7,15})')
+SMS_SENDER_RE = re.compile(r'from: (\+?\d+)')
+
+# Device field -> (cheap substring guard, pattern)
+DEVICE_FIELDS = {
+    "Device Model": ("model=", re.compile(r'model=([^,\s]+)')),
+    "Android Version": ("Android", re.compile(r'Android\s+(\d+(\.\d+)*)')),
+    "Kernel Version": ("Linux", re.compile(r'Linux\s+version\s+([^\s]+)')),
+}
+
+
+class SourceStats:
+    """Line count, per-type counts and number frequencies for one log source"""
+
+    def __init__(self):
+        self.lines = 0
+        self.type_counts = Counter()
+        self.numbers = Counter()
+
+    def top_numbers(self, n=5):
+        return self.numbers.most_common(n)
+
+
+class CategoryStats:
+    """Entry count and the first few example lines of a category file"""
+
+    def __init__(self, lines, examples):
+        self.lines = lines
+        self.examples = examples
+
+
+class ReportStats:
+    """Everything export_full_report needs, gathered with one pass per source.
+
+    A source that doesn't exist is left as None so the report can say so;
+    any other failure is kept in errors under the same attribute name.
+    lines_read and bytes_read total the sources that were read in full.
+    """
+
+    def __init__(self):
+        self.device_info = None
+        self.calls = None
+        self.sms = None
+        self.categories = {}
+        self.errors = {}
+        self.lines_read = 0
+        self.bytes_read = 0
+
+    def _count_read(self, path, lines):
+        self.lines_read += lines
+        self.bytes_read += os.path.getsize(path)
+
+
+def _scan_lines(scanner, progress=None):
+    """Decoded lines of a scanner, calling progress(fraction of bytes read) periodically"""
+    for n, (offset, raw) in enumerate(scanner.iter_raw()):
+        if progress and not n % PROGRESS_INTERVAL:
+            progress(offset / scanner.size)
+        yield decode_line(raw)
+
+
+def collect_device_info(path, progress=None):
+    """Find device model, Android and kernel versions, stopping once all are known"""
+    device_info = {field: "Unknown" for field in DEVICE_FIELDS}
+    pending = dict(DEVICE_FIELDS)
+    with LineScanner(path) as scanner:
+        for line in _scan_lines(scanner, progress):
+            for field, (guard, pattern) in list(pending.items()):
+                if guard in line:
+                    match = pattern.search(line)
+                    if match:
+                        device_info[field] = match.group(1)
+                        del pending[field]
+            if not pending:
+                break
+    return device_info
+
+
+def collect_call_stats(path, progress=None):
+    """Count calls by direction and tally the numbers involved"""
+    stats = SourceStats()
+    with LineScanner(path) as scanner:
+        for line in _scan_lines(scanner, progress):
+            stats.lines += 1
+            for call_type, pattern in CALL_TYPES.items():
+                if pattern.search(line):
+                    stats.type_counts[call_type] += 1
+            numbers = CALL_NUMBER_RE.findall(line) or ANY_NUMBER_RE.findall(line)
+            stats.numbers.update(numbers)
+    return stats
+
+
+def collect_sms_stats(path, progress=None):
+    """Count messages by direction and tally senders"""
+    stats = SourceStats()
+    with LineScanner(path) as scanner:
+        for line in _scan_lines(scanner, progress):
+            stats.lines += 1
+            for sms_type, pattern in SMS_TYPES.items():
+                if pattern.search(line):
+                    stats.type_counts[sms_type] += 1
+            match = SMS_SENDER_RE.search(line)
+            if match:
+                stats.numbers[match.group(1)] += 1
+    return stats
+
+
+def collect_category_stats(path, examples=3):
+    """Count a category file's entries and keep the first examples after its header"""
+    with LineScanner(path) as scanner:
+        return CategoryStats(scanner.count_lines(), list(islice(scanner.iter_lines(), 1, 1 + examples)))
+
+
+def collect_report_stats(log_types, logcat_path="logs/android_logcat.txt",
+                         call_path="logs/call_logs.txt", sms_path="logs/sms_logs.txt",
+                         category_dir="logs/logcat_types", progress=None):
+    """Gather the statistics for every report section.
+
+    progress(fraction, message), if given, is called as the sources are read;
+    anything it raises (such as JobCancelled) stops collection.
+    """
+    stats = ReportStats()
+    sources = [
+        ("device_info", collect_device_info, logcat_path, "Reading device information"),
+        ("calls", collect_call_stats, call_path, "Analyzing call logs"),
+        ("sms", collect_sms_stats, sms_path, "Analyzing SMS logs"),
+    ]
+    # The three sources and the category files each count as one step
+    steps = len(sources) + 1
+
+    def step_progress(step, message):
+        if not progress:
+            return None
+        progress(step / steps, message)
+        return lambda fraction: progress((step + fraction) / steps, message)
+
+    for step, (name, collect, path, message) in enumerate(sources):
+        try:
+            result = collect(path, step_progress(step, message))
+            setattr(stats, name, result)
+            if isinstance(result, SourceStats):
+                stats._count_read(path, result.lines)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            stats.errors[name] = e
+
+    for i, log_type in enumerate(log_types):
+        step_progress(len(sources) + i / len(log_types), f"Counting {log_type} logs")
+        path = f"{category_dir}/{log_type.lower()}_logs.txt"
+        try:
+            stats.categories[log_type] = collect_category_stats(path)
+            stats._count_read(path, stats.categories[log_type].lines)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            stats.errors[log_type] = e
+    return stats
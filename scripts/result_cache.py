@@ -0,0 +1,95 @@
+"""Memory-capped LRU cache for graph aggregates"""
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+
+DEFAULT_MAX_BYTES = 32 * 1024 * 1024
+
+
+def approx_size(value):
+    """Rough deep size of an aggregate in bytes, enough to enforce a memory cap"""
+    nbytes = getattr(value, "nbytes", None)
+    if nbytes is not None:
+        # NumPy arrays
+        return nbytes + sys.getsizeof(value, 0)
+    size = sys.getsizeof(value, 64)
+    if isinstance(value, dict):
+        size += sum(approx_size(k) + approx_size(v) for k, v in value.items())
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        size += sum(approx_size(item) for item in value)
+    return size
+
+
+class ResultCache:
+    """LRU map of aggregates keyed on (path, size, mtime_ns, graph type, time range).
+
+    A changed file gets a new key, so stale entries are never returned; they
+    just age out of the LRU order. Entries for relative ranges ("Past 24
+    Hours") carry a valid_until time after which the oldest counted line
+    would fall out of the range, and are recomputed from then on.
+    """
+
+    def __init__(self, max_bytes=DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        # key -> (value, size, valid_until)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key_for(path, graph_type, time_range):
+        """Build a cache key from the file's current size and mtime (raises FileNotFoundError)"""
+        st = os.stat(path)
+        return (path, st.st_size, st.st_mtime_ns, graph_type, time_range)
+
+    def get(self, key, default=None):
+        """Return a cached value and mark it most recently used"""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or (entry[2] is not None and time.time() >= entry[2]):
+                if entry is not None:
+                    self._discard(key)
+                self.misses += 1
+                return default
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, valid_until=None):
+        """Store a value, evicting least recently used entries to stay under max_bytes"""
+        size = approx_size(value)
+        with self._lock:
+            if key in self._entries:
+                self._discard(key)
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size, valid_until)
+            self.bytes += size
+            while self.bytes > self.max_bytes:
+                self._discard(next(iter(self._entries)))
+
+    def get_or_compute(self, path, graph_type, time_range, compute):
+        """Return the cached aggregate or call compute() -> (value, valid_until) and cache it"""
+        key = self.key_for(path, graph_type, time_range)
+        missing = object()
+        value = self.get(key, missing)
+        if value is missing:
+            value, valid_until = compute()
+            self.put(key, value, valid_until)
+        return value
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+
+    def _discard(self, key):
+        _, size, _ = self._entries.pop(key)
+        self.bytes -= size
+
+    def __len__(self):
+        return len(self._entries)
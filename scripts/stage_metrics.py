@@ -0,0 +1,208 @@
+"""Per-stage timings and counters for the log pipeline, with optional cProfile capture"""
+import cProfile
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from collections import Counter, deque
+from contextlib import contextmanager
+from datetime import datetime
+
+# Stages the pipeline reports, in pipeline order
+STAGES = ("extract", "categorize", "monitor", "filter", "graph", "report")
+
+# Completed runs kept in memory
+HISTORY_SIZE = 500
+
+# Functions listed in a profiled run's summary
+PROFILE_LINES = 30
+
+# Comma-separated stages to profile from startup, e.g. LOG_PROFILE_STAGES=categorize,filter
+PROFILE_ENV = "LOG_PROFILE_STAGES"
+
+
+class StageRun:
+    """One execution of a stage.
+
+    bytes_read is the size of the input the stage consumed; stages that only
+    see decoded lines count characters. category_hits counts lines matched per
+    LOG_TYPES category, and queue_depth_peak the deepest the live queue got
+    while the stage ran.
+    """
+
+    def __init__(self, name, detail=None):
+        self.name = name
+        self.detail = detail
+        self.started = datetime.now()
+        self.seconds = None
+        self.lines = 0
+        self.bytes_read = 0
+        self.category_hits = Counter()
+        self.queue_depth = None
+        self.queue_depth_peak = None
+        self.error = None
+        self.profile = None
+        self._start = time.perf_counter()
+        self._profiler = None
+
+    @property
+    def running(self):
+        return self.seconds is None
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._start if self.running else self.seconds
+
+    @property
+    def lines_per_sec(self):
+        elapsed = self.elapsed
+        return self.lines / elapsed if elapsed else None
+
+    def add(self, lines=0, bytes_read=0):
+        self.lines += lines
+        self.bytes_read += bytes_read
+
+    def add_hits(self, counts):
+        """Add per-category match counts (a Counter or {log_type: count})"""
+        self.category_hits.update(counts)
+
+    def sample_queue(self, depth):
+        self.queue_depth = depth
+        if self.queue_depth_peak is None or depth > self.queue_depth_peak:
+            self.queue_depth_peak = depth
+
+    def to_dict(self):
+        lines_per_sec = self.lines_per_sec
+        return {
+            "stage": self.name,
+            "detail": self.detail,
+            "started": self.started.isoformat(timespec="milliseconds"),
+            "running": self.running,
+            "seconds": round(self.elapsed, 6),
+            "lines": self.lines,
+            "bytes_read": self.bytes_read,
+            "lines_per_sec": round(lines_per_sec, 1) if lines_per_sec is not None else None,
+            "category_hits": dict(self.category_hits),
+            "queue_depth": self.queue_depth,
+            "queue_depth_peak": self.queue_depth_peak,
+            "error": self.error,
+            "profile": self.profile,
+        }
+
+
+class StageMetrics:
+    """Thread-safe registry of stage runs.
+
+    Stages are wrapped in stage(), or begin() ... finish() where a with block
+    doesn't fit. Stages named in profile_stages run under cProfile and keep a
+    text summary of the hottest functions in the run's profile.
+    """
+
+    def __init__(self, history=HISTORY_SIZE, profile_stages=()):
+        self.profile_stages = set(profile_stages)
+        self._runs = deque(maxlen=history)
+        self._active = []
+        self._lock = threading.Lock()
+
+    def begin(self, name, detail=None, profile=None):
+        """Start a run; profile=None profiles it if name is in profile_stages"""
+        run = StageRun(name, detail)
+        if profile if profile is not None else name in self.profile_stages:
+            profiler = cProfile.Profile()
+            try:
+                profiler.enable()
+                run._profiler = profiler
+            except ValueError as e:
+                # Only one profiler can be active at a time
+                run.profile = f"Profiling unavailable: {e}"
+        with self._lock:
+            self._active.append(run)
+        return run
+
+    def finish(self, run, error=None):
+        """Stop a run's clock and profiler and move it into the history"""
+        if run._profiler is not None:
+            run._profiler.disable()
+            out = io.StringIO()
+            pstats.Stats(run._profiler, stream=out).sort_stats("cumulative").print_stats(PROFILE_LINES)
+            run.profile = out.getvalue()
+            run._profiler = None
+        if error is not None:
+            run.error = f"{type(error).__name__}: {error}"
+        run.seconds = time.perf_counter() - run._start
+        with self._lock:
+            if run in self._active:
+                self._active.remove(run)
+            self._runs.append(run)
+        return run
+
+    @contextmanager
+    def stage(self, name, detail=None, profile=None):
+        """Time the block as a run of name, yielding the StageRun for its counters"""
+        run = self.begin(name, detail, profile)
+        try:
+            yield run
+        except BaseException as e:
+            self.finish(run, e)
+            raise
+        self.finish(run)
+
+    def sample_queue(self, name, depth):
+        """Record a queue depth on the running instances of a stage"""
+        with self._lock:
+            runs = [run for run in self._active if run.name == name]
+        for run in runs:
+            run.sample_queue(depth)
+
+    def runs(self):
+        """Running then completed runs, newest first"""
+        with self._lock:
+            return list(reversed(self._active)) + list(reversed(self._runs))
+
+    def totals(self):
+        """Per-stage totals over the completed runs in the history"""
+        totals = {}
+        with self._lock:
+            runs = list(self._runs)
+        for run in runs:
+            total = totals.setdefault(run.name, {"runs": 0, "errors": 0, "seconds": 0.0, "lines": 0,
+                                                 "bytes_read": 0, "category_hits": Counter()})
+            total["runs"] += 1
+            total["errors"] += run.error is not None
+            total["seconds"] += run.seconds
+            total["lines"] += run.lines
+            total["bytes_read"] += run.bytes_read
+            total["category_hits"].update(run.category_hits)
+        for total in totals.values():
+            total["seconds"] = round(total["seconds"], 6)
+            total["lines_per_sec"] = round(total["lines"] / total["seconds"], 1) if total["seconds"] else None
+            total["category_hits"] = dict(total["category_hits"])
+        return totals
+
+    def to_dict(self):
+        return {
+            "generated": datetime.now().isoformat(timespec="seconds"),
+            "totals": self.totals(),
+            "runs": [run.to_dict() for run in self.runs()],
+        }
+
+    def dump_json(self, path):
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, indent=2)
+            f.write("\n")
+
+    def clear(self):
+        """Forget completed runs; running ones are kept"""
+        with self._lock:
+            self._runs.clear()
+
+
+def _profile_stages_from_env():
+    return [name.strip() for name in os.environ.get(PROFILE_ENV, "").split(",") if name.strip()]
+
+
+# Shared by the GUI, the command line and the pipeline modules
+metrics = StageMetrics(profile_stages=_profile_stages_from_env())
@@ -0,0 +1,128 @@
+"""Window listing pipeline stage runs from StageMetrics"""
+import tkinter as tk
+from tkinter import ttk, filedialog, messagebox
+
+from scripts.stage_metrics import STAGES
+
+
+def _format_bytes(size):
+    for unit in ("B", "KB", "MB", "GB"):
+        if size < 1024 or unit == "GB":
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+
+
+class StageStatsWindow(tk.Toplevel):
+    """Table of recent stage runs with details and profiling switches.
+
+    Rows are refreshed with after() while the window is open, so running
+    stages (such as live monitoring) show their counters as they grow.
+    Selecting a row shows its category hits, error and cProfile summary.
+    """
+
+    REFRESH_MS = 1000
+    COLUMNS = (
+        ("stage", "Stage", 80),
+        ("detail", "Detail", 220),
+        ("started", "Started", 90),
+        ("seconds", "Seconds", 70),
+        ("lines", "Lines", 80),
+        ("bytes", "Read", 80),
+        ("rate", "Lines/s", 80),
+        ("queue", "Queue peak", 80),
+        ("status", "Status", 70),
+    )
+
+    def __init__(self, master, metrics, bg="black", fg="white", font=None):
+        super().__init__(master, bg=bg)
+        self.metrics = metrics
+        self.title("Performance Stats")
+        self._runs = {}
+        self._shown = None
+
+        toolbar = tk.Frame(self, bg=bg)
+        toolbar.pack(fill=tk.X, padx=10, pady=(10, 5))
+        tk.Label(toolbar, text="Profile:", bg=bg, fg=fg, font=font).pack(side=tk.LEFT)
+        self.profile_vars = {}
+        for stage in STAGES:
+            var = tk.BooleanVar(value=stage in metrics.profile_stages)
+            tk.Checkbutton(toolbar, text=stage, variable=var, bg=bg, fg=fg, selectcolor=bg, font=font,
+                           command=lambda s=stage, v=var: self.set_profiled(s, v.get())).pack(side=tk.LEFT)
+            self.profile_vars[stage] = var
+        tk.Button(toolbar, text="Save JSON", bg="gray", fg="black", command=self.save_json).pack(side=tk.RIGHT, padx=2)
+        tk.Button(toolbar, text="Clear", bg="gray", fg="black", command=self.clear).pack(side=tk.RIGHT, padx=2)
+
+        self.tree = ttk.Treeview(self, columns=[c[0] for c in self.COLUMNS], show="headings", height=12)
+        for column, heading, width in self.COLUMNS:
+            self.tree.heading(column, text=heading)
+            self.tree.column(column, width=width, anchor="w" if column in ("stage", "detail") else "e")
+        self.tree.pack(fill=tk.BOTH, expand=True, padx=10, pady=5)
+        self.tree.bind("<<TreeviewSelect>>", lambda event: self.show_details())
+
+        self.details = tk.Text(self, height=14, wrap=tk.NONE, bg=bg, fg=fg, font=("Courier", 9))
+        self.details.pack(fill=tk.BOTH, expand=True, padx=10, pady=(5, 10))
+
+        self.refresh()
+
+    def set_profiled(self, stage, enabled):
+        if enabled:
+            self.metrics.profile_stages.add(stage)
+        else:
+            self.metrics.profile_stages.discard(stage)
+
+    def refresh(self):
+        if not self.winfo_exists():
+            return
+        selection = self.tree.selection()
+        selected = self._runs.get(selection[0]) if selection else None
+        self.tree.delete(*self.tree.get_children())
+        self._runs = {}
+        for run in self.metrics.runs():
+            rate = run.lines_per_sec
+            status = "running" if run.running else ("error" if run.error else "ok")
+            item = self.tree.insert("", tk.END, values=(
+                run.name, run.detail or "", run.started.strftime("%H:%M:%S"), f"{run.elapsed:.3f}",
+                f"{run.lines:,}", _format_bytes(run.bytes_read), f"{rate:,.0f}" if rate is not None else "",
+                run.queue_depth_peak if run.queue_depth_peak is not None else "", status))
+            self._runs[item] = run
+            # Item ids change on every refresh, so reselect by run
+            if run is selected:
+                self.tree.selection_set(item)
+        self.after(self.REFRESH_MS, self.refresh)
+
+    def show_details(self):
+        selection = self.tree.selection()
+        run = self._runs.get(selection[0]) if selection else None
+        # Reselection after a refresh only redraws runs that are still changing
+        if run is self._shown and run is not None and not run.running:
+            return
+        self._shown = run
+        self.details.delete(1.0, tk.END)
+        if run is None:
+            return
+        text = [f"{run.name}: {run.detail or ''}"]
+        if run.category_hits:
+            text.append("Category hits:")
+            text += [f"  {log_type:<12} {count:>10,}" for log_type, count in run.category_hits.most_common()]
+        if run.queue_depth is not None:
+            text.append(f"Queue depth: {run.queue_depth} (peak {run.queue_depth_peak})")
+        if run.error:
+            text.append(f"Error: {run.error}")
+        if run.profile:
+            text += ["", run.profile]
+        self.details.insert(tk.END, "\n".join(text))
+
+    def clear(self):
+        self.metrics.clear()
+        self._shown = None
+        self.details.delete(1.0, tk.END)
+
+    def save_json(self):
+        path = filedialog.asksaveasfilename(parent=self, defaultextension=".json",
+                                            filetypes=[("JSON", "*.json")], initialfile="stage_metrics.json")
+        if not path:
+            return
+        try:
+            self.metrics.dump_json(path)
+        except OSError as e:
+            messagebox.showerror("Save Failed", f"Failed to save stats: {str(e)}", parent=self)
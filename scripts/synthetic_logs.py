@@ -0,0 +1,151 @@
+"""Deterministic synthetic logcat, call log and SMS dumps for benchmarks.
+
+The same seed, line count and end time always produce byte-identical files.
+Timestamps run evenly up to the end time, so every time range option has
+data, and the logcat lines cover every LOG_TYPES category as well as lines
+that match none.
+"""
+import os
+import random
+from datetime import datetime, timedelta
+
+from scripts.log_types import LOGCAT_FILE, CALL_LOG_FILE, SMS_LOG_FILE
+
+# Lines generated per write
+WRITE_CHUNK = 10000
+
+# How far back the generated logs reach from the end time
+DEFAULT_SPAN = timedelta(days=10)
+
+# (level, tag, message template) weights loosely follow a real device's logcat
+LOGCAT_TEMPLATES = [
+    ("I", "ActivityManager", "Start proc {pid}:com.example.app{n}/u0a{n} for activity"),
+    ("I", "PackageManager", "Package com.example.app{n} codePath changed"),
+    ("I", "SystemServer", "Entered the Android system server!"),
+    ("W", "System.err", "at com.example.app{n}.MainActivity.onCreate(MainActivity.java:{n})"),
+    ("E", "AndroidRuntime", "FATAL EXCEPTION: main Process: com.example.app{n}, PID: {pid}"),
+    ("E", "AndroidRuntime", "java.lang.NullPointerException: Attempt to invoke virtual method"),
+    ("I", "art", "Background concurrent copying GC freed {n}(1MB) AllocSpace objects"),
+    ("D", "dalvikvm", "GC_CONCURRENT freed {n}K, 12% free"),
+    ("D", "ConnectivityManager", "requestNetwork for uid {n}"),
+    ("I", "WifiManager", "wifi state changed to connected, rssi -{n}"),
+    ("D", "DnsResolver", "DNS query for host{n}.example.com took {n}ms"),
+    ("D", "BroadcastQueue", "sendBroadcast intent android.intent.action.SCREEN_ON"),
+    ("V", "BootReceiver", "onReceive android.intent.action.BOOT_COMPLETED"),
+    ("I", "ActivityThread", "startService Intent {{ cmp=com.example.app{n}/.SyncService }}"),
+    ("D", "JobScheduler", "bindService for job {n}"),
+    ("D", "PowerManagerService", "acquireWakeLock lock={n} flags=0x1"),
+    ("I", "BatteryManager", "battery level {n}%"),
+    ("D", "SensorService", "sensor {n} activated"),
+    ("I", "Choreographer", "Skipped {n} frames!  The application may be doing too much work."),
+    ("D", "InputDispatcher", "Delivering touch to window {n}"),
+    ("W", "Looper", "Slow dispatch took {n}ms main h=android.os.Handler"),
+]
+LOGCAT_WEIGHTS = [6, 2, 1, 3, 1, 1, 4, 2, 3, 3, 2, 2, 1, 2, 1, 2, 2, 2, 5, 6, 3]
+
+# Lines at the top of a dump that the report's device information looks for
+DEVICE_HEADER = [
+    "--------- beginning of main",
+    "{ts}  {pid}  {pid} I Build   : model=Pixel_7 brand=google",
+    "{ts}  {pid}  {pid} I Build   : Android 14.0.0 release-keys",
+    "{ts}  {pid}  {pid} I kernel  : Linux version 5.10.157-android13 (build@host)",
+]
+
+SMS_BODIES = ["See you at 6", "Your code is {n}", "Running late", "Call me back", "OK", "Thanks!"]
+
+
+def _phone_numbers(rng, count=200):
+    """A fixed pool of numbers, so top caller/sender charts have repeat contacts"""
+    return [f"+1555{rng.randrange(10 ** 7):07d}" for _ in range(count)]
+
+
+def _timestamps(count, end, span):
+    """count evenly spaced datetimes ending at end"""
+    step = span / max(count, 1)
+    start = end - span
+    for i in range(count):
+        yield start + step * (i + 1)
+
+
+def _write_lines(path, lines):
+    """Write lines in chunks so very large dumps don't build up in memory"""
+    os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+    written = 0
+    with open(path, "w", encoding="utf-8", newline="\n") as f:
+        chunk = []
+        for line in lines:
+            chunk.append(line)
+            if len(chunk) >= WRITE_CHUNK:
+                f.write("\n".join(chunk) + "\n")
+                written += len(chunk)
+                chunk = []
+        if chunk:
+            f.write("\n".join(chunk) + "\n")
+            written += len(chunk)
+    return written
+
+
+def logcat_lines(count, seed=0, end=None, span=DEFAULT_SPAN):
+    """`logcat -v threadtime` lines, including the device information header"""
+    rng = random.Random(seed)
+    end = end or datetime.now().replace(minute=0, second=0, microsecond=0)
+    times = _timestamps(count, end, span)
+
+    produced = 0
+    for template in DEVICE_HEADER[:count]:
+        ts = next(times)
+        produced += 1
+        yield template.format(ts=ts.strftime("%m-%d %H:%M:%S.%f")[:-3], pid=1)
+
+    pids = [rng.randrange(100, 32768) for _ in range(64)]
+    templates = rng.choices(LOGCAT_TEMPLATES, LOGCAT_WEIGHTS, k=min(count, 65536)) or LOGCAT_TEMPLATES
+    for i, ts in enumerate(times, produced):
+        level, tag, message = templates[i % len(templates)]
+        pid = pids[i % len(pids)]
+        n = rng.randrange(1, 1000)
+        yield (f"{ts.strftime('%m-%d %H:%M:%S.%f')[:-3]} {pid:5d} {pid + n % 7:5d} {level} "
+               f"{tag}: {message.format(pid=pid, n=n)}")
+
+
+def call_lines(count, seed=0, end=None, span=DEFAULT_SPAN):
+    """Call log rows: incoming, outgoing and missed calls between a pool of numbers"""
+    rng = random.Random(seed + 1)
+    end = end or datetime.now().replace(minute=0, second=0, microsecond=0)
+    numbers = _phone_numbers(rng)
+    for ts in _timestamps(count, end, span):
+        call_type = rng.choice((1, 1, 2, 2, 3))
+        duration = 0 if call_type == 3 else rng.randrange(5, 1800)
+        yield (f"{ts.strftime('%Y-%m-%d %H:%M:%S')} | number: {rng.choice(numbers)} | "
+               f"type: {call_type} | duration: {duration}")
+
+
+def sms_lines(count, seed=0, end=None, span=DEFAULT_SPAN):
+    """SMS rows: received messages carry from:, sent ones to:"""
+    rng = random.Random(seed + 2)
+    end = end or datetime.now().replace(minute=0, second=0, microsecond=0)
+    numbers = _phone_numbers(rng)
+    for ts in _timestamps(count, end, span):
+        body = rng.choice(SMS_BODIES).format(n=rng.randrange(100000, 1000000))
+        if rng.random() < 0.6:
+            party, sms_type = f"from: {rng.choice(numbers)}", 1
+        else:
+            party, sms_type = f"to: {rng.choice(numbers)}", 2
+        yield f"{ts.strftime('%Y-%m-%d %H:%M:%S')} | {party} | type: {sms_type} | body: {body}"
+
+
+def write_dataset(logcat_count, call_count=None, sms_count=None, seed=0, end=None,
+                  logcat_path=LOGCAT_FILE, call_path=CALL_LOG_FILE, sms_path=SMS_LOG_FILE):
+    """Write all three dumps; calls and SMS default to 1% of the logcat size.
+
+    Returns {path: lines written}.
+    """
+    end = end or datetime.now().replace(minute=0, second=0, microsecond=0)
+    if call_count is None:
+        call_count = max(logcat_count // 100, 100)
+    if sms_count is None:
+        sms_count = max(logcat_count // 100, 100)
+    return {
+        logcat_path: _write_lines(logcat_path, logcat_lines(logcat_count, seed, end)),
+        call_path: _write_lines(call_path, call_lines(call_count, seed, end)),
+        sms_path: _write_lines(sms_path, sms_lines(sms_count, seed, end)),
+    }
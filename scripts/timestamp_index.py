@@ -0,0 +1,250 @@
+"""Sidecar index of line offsets and timestamps for log files"""
+import json
+import math
+from bisect import bisect_left
+import os
+import threading
+from array import array
+from datetime import datetime
+
+from scripts.line_scanner import LineScanner, decode_line
+from scripts.logcat_parser import parse_line
+
+INDEX_SUFFIX = ".tsidx"
+_MAGIC = b"ALTIDX1\n"
+
+# In-process copies of loaded indexes, keyed by log path
+_cache = {}
+_cache_lock = threading.Lock()
+
+
+class TimestampIndex:
+    """Byte offset and epoch timestamp (NaN when undated) for every line of a file"""
+
+    def __init__(self, path, size, mtime_ns, offsets, timestamps):
+        self.path = path
+        self.size = size
+        self.mtime_ns = mtime_ns
+        self.offsets = offsets
+        self.timestamps = timestamps
+        self._dated = None
+        self._running_max = None
+        self._undated = None
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def is_current(self):
+        """Return True if the log file hasn't changed since the index was built"""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False
+        return st.st_size == self.size and st.st_mtime_ns == self.mtime_ns
+
+    def timestamp(self, row):
+        """Epoch timestamp for a line, or None if the line has no timestamp"""
+        ts = self.timestamps[row]
+        return None if math.isnan(ts) else ts
+
+    def dated_rows(self):
+        """Return (rows, timestamps) for every line that has a timestamp"""
+        if self._dated is None:
+            rows = array("q")
+            timestamps = array("d")
+            for row, ts in enumerate(self.timestamps):
+                if not math.isnan(ts):
+                    rows.append(row)
+                    timestamps.append(ts)
+            self._dated = (rows, timestamps)
+        return self._dated
+
+    def seek(self, cutoff):
+        """Return the first row that could have a timestamp >= cutoff.
+
+        Binary-searches the running maximum of the timestamps, so every dated
+        line before the returned row is older than cutoff even when the file is
+        out of order. Sorted files skip straight to the tail; badly shuffled
+        ones degrade to a scan from the first out-of-order line.
+        """
+        if self._running_max is None:
+            running_max = array("d")
+            undated = array("q")
+            highest = -math.inf
+            for row, ts in enumerate(self.timestamps):
+                if math.isnan(ts):
+                    undated.append(row)
+                elif ts > highest:
+                    highest = ts
+                running_max.append(highest)
+            self._running_max = running_max
+            self._undated = undated
+        return bisect_left(self._running_max, cutoff)
+
+    def dated_rows_since(self, cutoff):
+        """Return (rows, timestamps) for dated lines with timestamp >= cutoff"""
+        rows, timestamps = self.dated_rows()
+        start = bisect_left(rows, self.seek(cutoff))
+        selected_rows = []
+        selected_timestamps = []
+        for i in range(start, len(rows)):
+            if timestamps[i] >= cutoff:
+                selected_rows.append(rows[i])
+                selected_timestamps.append(timestamps[i])
+        return selected_rows, selected_timestamps
+
+    def read_lines(self, rows):
+        """Read the given lines from the log file by offset"""
+        with LineScanner(self.path) as scanner:
+            return [scanner.line_at(self.offsets[row]) for row in rows]
+
+    def read_range(self, start_row, stop_row):
+        """Read a contiguous block of lines [start_row, stop_row)"""
+        stop_row = min(stop_row, len(self.offsets))
+        if start_row >= stop_row:
+            return []
+        with LineScanner(self.path) as scanner:
+            return [scanner.line_at(self.offsets[row]) for row in range(start_row, stop_row)]
+
+    def iter_rows(self, rows):
+        """Yield (line, timestamp or None) for the given rows, in order"""
+        with LineScanner(self.path) as scanner:
+            for row in rows:
+                yield scanner.line_at(self.offsets[row]), self.timestamp(row)
+
+    def iter_lines(self, start_row=0):
+        """Yield (line, timestamp or None) for each line from start_row on"""
+        if start_row >= len(self.offsets):
+            return
+        with LineScanner(self.path) as scanner:
+            lines = scanner.iter_lines(self.offsets[start_row])
+            for row, line in zip(range(start_row, len(self.offsets)), lines):
+                yield line, self.timestamp(row)
+
+    def iter_since(self, cutoff, include_undated=True):
+        """Yield (line, timestamp or None) for lines at or after cutoff.
+
+        Only the tail of the file from seek(cutoff) is read. Undated lines are
+        yielded too (including any before the tail) unless include_undated is False.
+        """
+        start = self.seek(cutoff)
+        if include_undated:
+            head_undated = self._undated[:bisect_left(self._undated, start)]
+            for line in self.read_lines(head_undated):
+                yield line, None
+        for line, ts in self.iter_lines(start):
+            if ts is None:
+                if include_undated:
+                    yield line, None
+            elif ts >= cutoff:
+                yield line, ts
+
+    def save(self):
+        """Write the index next to the log file"""
+        header = json.dumps({
+            "size": self.size,
+            "mtime_ns": self.mtime_ns,
+            "count": len(self.offsets)
+        }).encode("utf-8")
+        tmp_path = self.path + INDEX_SUFFIX + ".tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(_MAGIC)
+            f.write(header + b"\n")
+            self.offsets.tofile(f)
+            self.timestamps.tofile(f)
+        os.replace(tmp_path, self.path + INDEX_SUFFIX)
+
+
+def build_index(path, now=None):
+    """Scan a log file once and record each line's offset and timestamp"""
+    now = now or datetime.now()
+    st = os.stat(path)
+    offsets = array("q")
+    timestamps = array("d")
+    with LineScanner(path) as scanner:
+        for offset, raw in scanner.iter_raw():
+            ts = parse_line(decode_line(raw), now).timestamp
+            offsets.append(offset)
+            timestamps.append(math.nan if ts is None else ts)
+    return TimestampIndex(path, st.st_size, st.st_mtime_ns, offsets, timestamps)
+
+
+def store_index(path, offsets, timestamps):
+    """Save an index collected while the file was written, skipping a rebuild scan"""
+    st = os.stat(path)
+    index = TimestampIndex(path, st.st_size, st.st_mtime_ns, offsets, timestamps)
+    try:
+        index.save()
+    except OSError as e:
+        print(f"Error saving timestamp index for {path}: {e}")
+    with _cache_lock:
+        _cache[path] = index
+    return index
+
+
+def _read_sidecar(path, st=None):
+    """Load a sidecar index if it matches the file's current size and mtime.
+
+    With st=None the sidecar is loaded whatever file version it describes.
+    """
+    try:
+        with open(path + INDEX_SUFFIX, "rb") as f:
+            if f.readline() != _MAGIC:
+                return None
+            header = json.loads(f.readline())
+            if st is not None and (header["size"] != st.st_size or header["mtime_ns"] != st.st_mtime_ns):
+                return None
+            offsets = array("q")
+            timestamps = array("d")
+            offsets.fromfile(f, header["count"])
+            timestamps.fromfile(f, header["count"])
+    except (OSError, ValueError, KeyError, EOFError):
+        return None
+    return TimestampIndex(path, header["size"], header["mtime_ns"], offsets, timestamps)
+
+
+def load_index_prefix(path, size, mtime_ns):
+    """Return (offsets, timestamps) for the lines in the first size bytes of a
+    log file that has since grown, or None if no usable index is left.
+
+    An index stored when the file was exactly size bytes long (and last
+    modified at mtime_ns) is used as is; an index of the file's current
+    version is cut at size. The caller is responsible for checking that the
+    first size bytes haven't changed.
+    """
+    with _cache_lock:
+        candidates = [_cache.get(path)]
+    candidates.append(_read_sidecar(path))
+    for index in candidates:
+        if index is None:
+            continue
+        if index.size == size and index.mtime_ns == mtime_ns:
+            return index.offsets, index.timestamps
+        if index.size >= size and index.is_current():
+            rows = bisect_left(index.offsets, size)
+            return index.offsets[:rows], index.timestamps[:rows]
+    return None
+
+
+def load_index(path):
+    """Return an up-to-date index for a log file, rebuilding the sidecar if stale.
+
+    Raises FileNotFoundError if the log file doesn't exist.
+    """
+    st = os.stat(path)
+    with _cache_lock:
+        index = _cache.get(path)
+    if index is not None and index.size == st.st_size and index.mtime_ns == st.st_mtime_ns:
+        return index
+
+    index = _read_sidecar(path, st)
+    if index is None:
+        index = build_index(path)
+        try:
+            index.save()
+        except OSError as e:
+            print(f"Error saving timestamp index for {path}: {e}")
+
+    with _cache_lock:
+        _cache[path] = index
+    return index